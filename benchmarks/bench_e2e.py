@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+"""End-to-end benchmarks of the chat and transcription engines against the mock API.
+
+Starts benchmarks/mock_server.py in-process and runs each scenario in its
+own subprocess (so peak RSS is per scenario), with GROQ_BASE_URL pointing
+at the mock. Prints one JSON document; save it per commit and compare:
+
+    python benchmarks/bench_e2e.py --out before.json
+    git checkout <other>
+    python benchmarks/bench_e2e.py --out after.json --compare before.json
+
+Scenarios:
+    chat_stream     sequential ChatCompleter.stream_completion calls (TTFT, tokens/s)
+    chat_fanout     AsyncChatCompleter.gather_completions (requests/s)
+    transcribe      WhisperTranscriber.transcribe of a WAV file (MB/s, latency)
+
+Usage:
+    python benchmarks/bench_e2e.py [--scenario NAME ...] [--requests N] [--out FILE] [--compare FILE]
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+from typing import Any, Dict, List
+
+from rich.console import Console
+from rich.table import Table
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Allow running from a source checkout without installing
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from mock_server import MockGroqServer
+
+console = Console(stderr=True)
+
+SCENARIOS = ('chat_stream', 'chat_fanout', 'transcribe')
+
+# Mock settings shared by every run, so results are comparable
+MOCK = dict(latency=0.05, tokens_per_second=2000.0, chunk_tokens=1, reply_tokens=500, segments=500)
+
+TRANSCRIBE_MB = 10
+
+
+class TimedOutput(io.StringIO):
+    """Collects streamed output and the time of the first write."""
+
+    def __init__(self):
+        super().__init__()
+        self.first_write = None
+
+    def isatty(self) -> bool:
+        # Terminal-style coalescing, as an interactive user would see
+        return True
+
+    def write(self, text: str) -> int:
+        if self.first_write is None:
+            self.first_write = time.perf_counter()
+        return super().write(text)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    try:
+        import resource
+    except ImportError:
+        return float('nan')
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak / 1024 / (1024 if sys.platform == 'darwin' else 1)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_chat_stream(requests: int) -> Dict[str, Any]:
+    from groq_cli.chat import ChatCompleter
+
+    started = time.perf_counter()
+    completer = ChatCompleter(api_key='benchmark')
+    init_seconds = time.perf_counter() - started
+
+    ttfts, rates, totals = [], [], []
+    for i in range(requests):
+        output = TimedOutput()
+        sent = time.perf_counter()
+        completer.stream_completion(f"question {i}", model='llama-3.1-8b-instant', max_tokens=MOCK['reply_tokens'], output=output)
+        done = time.perf_counter()
+        ttfts.append(output.first_write - sent)
+        totals.append(done - sent)
+        rates.append(MOCK['reply_tokens'] / max(done - output.first_write, 1e-9))
+
+    return {
+        'requests': requests,
+        'client_init_ms': init_seconds * 1000,
+        'ttft_p50_ms': statistics.median(ttfts) * 1000,
+        'ttft_p95_ms': percentile(ttfts, 0.95) * 1000,
+        'total_p50_ms': statistics.median(totals) * 1000,
+        'tokens_per_s': statistics.median(rates),
+    }
+
+
+def run_chat_fanout(requests: int) -> Dict[str, Any]:
+    from groq_cli.chat import AsyncChatCompleter
+
+    async def run() -> float:
+        completer = AsyncChatCompleter(api_key='benchmark')
+        try:
+            started = time.perf_counter()
+            await completer.gather_completions(
+                [f"question {i}" for i in range(requests)],
+                model='llama-3.1-8b-instant',
+                max_tokens=MOCK['reply_tokens']
+            )
+            return time.perf_counter() - started
+        finally:
+            await completer.close()
+
+    elapsed = asyncio.run(run())
+    return {
+        'requests': requests,
+        'wall_s': elapsed,
+        'requests_per_s': requests / elapsed,
+        'tokens_per_s': requests * MOCK['reply_tokens'] / elapsed,
+    }
+
+
+def run_transcribe(requests: int) -> Dict[str, Any]:
+    from groq_cli.transcriber import WhisperTranscriber
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        audio_path = Path(tmp_dir) / 'bench.wav'
+        rate = 16000
+        with wave.open(str(audio_path), 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(rate)
+            wav.writeframes(b'\x00\x00' * (TRANSCRIBE_MB * 1024 * 1024 // 2))
+        size_mb = audio_path.stat().st_size / (1024 * 1024)
+
+        transcriber = WhisperTranscriber(api_key='benchmark', cache=None)
+        latencies = []
+        for _ in range(max(1, requests // 4)):
+            started = time.perf_counter()
+            result = transcriber.transcribe(audio_path, quiet=True)
+            latencies.append(time.perf_counter() - started)
+
+    return {
+        'requests': len(latencies),
+        'file_mb': size_mb,
+        'segments': len(result.get('segments', [])),
+        'latency_p50_ms': statistics.median(latencies) * 1000,
+        'mb_per_s': size_mb / statistics.median(latencies),
+    }
+
+
+RUNNERS = {'chat_stream': run_chat_stream, 'chat_fanout': run_chat_fanout, 'transcribe': run_transcribe}
+
+
+def run_scenario(name: str, url: str, requests: int) -> Dict[str, Any]:
+    """Run one scenario in a fresh interpreter and return its metrics."""
+    env = {**os.environ, 'GROQ_BASE_URL': url}
+    completed = subprocess.run(
+        [sys.executable, __file__, '--child', name, '--requests', str(requests)],
+        capture_output=True, text=True, env=env
+    )
+    if completed.returncode:
+        raise RuntimeError(f"{name} failed:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def print_comparison(report: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print each metric next to the baseline's value."""
+    table = Table(title=f"{baseline.get('revision')} → {report.get('revision')}")
+    table.add_column("Scenario")
+    table.add_column("Metric")
+    table.add_column("Before", justify="right")
+    table.add_column("After", justify="right")
+    table.add_column("Change", justify="right")
+    for name, metrics in report['scenarios'].items():
+        before = baseline.get('scenarios', {}).get(name, {})
+        for metric, value in metrics.items():
+            if metric == 'requests' or not isinstance(value, (int, float)) or metric not in before:
+                continue
+            change = (value - before[metric]) / before[metric] * 100 if before[metric] else 0.0
+            table.add_row(name, metric, f"{before[metric]:.1f}", f"{value:.1f}", f"{change:+.1f}%")
+    console.print(table)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenario', action='append', choices=SCENARIOS, help='Scenario to run (repeatable; default all)')
+    parser.add_argument('--requests', type=int, default=20, help='Requests per scenario')
+    parser.add_argument('--out', type=Path, help='Also write the JSON report to this file')
+    parser.add_argument('--compare', type=Path, help='Earlier JSON report to compare against')
+    parser.add_argument('--child', choices=SCENARIOS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        metrics = RUNNERS[args.child](args.requests)
+        metrics['peak_rss_mb'] = peak_rss_mb()
+        print(json.dumps(metrics))
+        return 0
+
+    report = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'mock': MOCK,
+        'scenarios': {},
+    }
+    with MockGroqServer(**MOCK) as server:
+        for name in args.scenario or SCENARIOS:
+            console.print(f"[dim]Running {name}...[/dim]")
+            report['scenarios'][name] = run_scenario(name, server.url, args.requests)
+        report['mock_counters'] = dict(server.counters)
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        args.out.write_text(text + '\n', encoding='utf-8')
+    if args.compare:
+        print_comparison(report, json.loads(args.compare.read_text(encoding='utf-8')))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
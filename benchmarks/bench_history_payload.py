@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""Compare request payload per turn across chat history strategies.
+
+Replays a synthetic interactive session (with one long paste) through
+ChatCompleter with a fake client and reports the bytes of messages sent
+per turn for the old fixed 20-message cap, the token-budgeted history,
+and the token-budgeted history with rolling summaries.
+
+Usage:
+    python benchmarks/bench_history_payload.py [turns]
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from rich.console import Console
+from rich.table import Table
+
+# Allow running from a source checkout without installing
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from groq_cli.chat import ChatCompleter
+from groq_cli.summary import RollingSummarizer
+
+console = Console()
+
+SYSTEM_PROMPT = "You are a concise assistant for a platform engineering team."
+PASTE_TURN = 5
+
+
+class FakeCompletions:
+    """Streams a reply for chat turns and returns a short summary otherwise."""
+
+    def create(self, stream=False, **params):
+        if stream:
+            reply = "Here is a detailed answer with some reasoning and an example. " * 12
+            return iter([SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=reply))])])
+        message = SimpleNamespace(content="The user is debugging a deployment; key facts so far. " * 8)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def session_queries(turns: int):
+    for i in range(turns):
+        if i == PASTE_TURN:
+            yield "Here is the log:\n" + "2025-09-19 12:00:00 ERROR worker crashed with exit code 137\n" * 400
+        else:
+            yield f"Follow-up question {i}: what should I check next about the failing deployment?"
+
+
+def legacy_payloads(turns: int):
+    """The previous behaviour: system prompt plus the last 20 messages, whatever their size."""
+    history = [{"role": "system", "content": SYSTEM_PROMPT}]
+    reply = FakeCompletions().create(stream=True, messages=[])
+    reply_text = next(reply).choices[0].delta.content
+    sizes = []
+    for query in session_queries(turns):
+        messages = history + [{"role": "user", "content": query}]
+        sizes.append(len(json.dumps(messages, ensure_ascii=False).encode('utf-8')))
+        history += [{"role": "user", "content": query}, {"role": "assistant", "content": reply_text}]
+        if len(history) > 20:
+            history = history[-20:]
+    return sizes
+
+
+def completer_payloads(turns: int, summarize: bool):
+    completer = ChatCompleter(api_key="benchmark")
+    completer.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+    completer.conversation_history = [{"role": "system", "content": SYSTEM_PROMPT}]
+    summarizer = RollingSummarizer(completer) if summarize else None
+
+    for query in session_queries(turns):
+        if summarizer:
+            summarizer.apply()
+        completer.stream_completion(query, model="llama-3.3-70b-versatile", maintain_history=True, output=io.StringIO())
+        if summarizer and summarizer.update():
+            # Let the background summary land before the next turn, as it
+            # would while the user reads the reply
+            summarizer._pending.result()
+    if summarizer:
+        summarizer.close()
+    return list(completer.request_bytes)
+
+
+def main() -> int:
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+
+    rows = [
+        ("fixed 20-message cap (previous)", legacy_payloads(turns)),
+        ("token budget", completer_payloads(turns, summarize=False)),
+        ("token budget + rolling summary", completer_payloads(turns, summarize=True)),
+    ]
+
+    table = Table(title=f"Request payload over a {turns}-turn session (turn {PASTE_TURN + 1} pastes a 24 KB log)")
+    table.add_column("History")
+    table.add_column("Mean KB/turn", justify="right")
+    table.add_column("Max KB/turn", justify="right")
+    table.add_column("Last KB", justify="right")
+    table.add_column("Total KB", justify="right")
+    for name, sizes in rows:
+        table.add_row(
+            name,
+            f"{sum(sizes) / len(sizes) / 1024:.1f}",
+            f"{max(sizes) / 1024:.1f}",
+            f"{sizes[-1] / 1024:.1f}",
+            f"{sum(sizes) / 1024:.0f}"
+        )
+    console.print(table)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""Measure cold-start time of the CLI entry point.
+
+Times `--help` end to end over several runs and lists the slowest
+imports of groq_cli.main from `python -X importtime`.
+
+Usage:
+    python benchmarks/bench_startup.py [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def main() -> int:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    wall_times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, '-m', 'groq_cli.main', '--help'], cwd=ROOT, capture_output=True, check=True)
+        wall_times.append((time.perf_counter() - started) * 1000)
+
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import groq_cli.main'],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    imports = []
+    for line in completed.stderr.splitlines():
+        if line.startswith('import time:') and 'cumulative' not in line:
+            _, cumulative, name = line.split('|')
+            imports.append((int(cumulative), name.rstrip()))
+    imports.sort(reverse=True)
+
+    console.print(
+        f"[bold]groq --help[/bold]: median {statistics.median(wall_times):.0f} ms, "
+        f"min {min(wall_times):.0f} ms over {runs} runs"
+    )
+
+    table = Table(title="Slowest imports of groq_cli.main (cumulative)")
+    table.add_column("Module")
+    table.add_column("ms", justify="right")
+    for cumulative, name in imports[:15]:
+        table.add_row(name, f"{cumulative / 1000:.1f}")
+    console.print(table)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Check that per-token cost of the streaming loops stays flat.
+
+Streams a synthetic response through ChatCompleter.stream_completion and
+stream_completion_rich with a fake client, and compares the average cost
+of the first and last tokens. A ratio near 1.0 means accumulation is
+linear overall; the legacy Text-rebuild loop is shown for reference.
+
+Usage:
+    python benchmarks/bench_stream_accumulation.py [tokens]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
+
+# Allow running from a source checkout without installing
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import groq_cli.chat as chat_module
+from groq_cli.chat import ChatCompleter
+
+console = Console()
+
+WINDOW = 2000
+
+
+class TimedStream:
+    """Synthetic token stream that records when each token is requested."""
+
+    def __init__(self, tokens: int):
+        self.tokens = tokens
+        self.stamps = []
+
+    def __iter__(self):
+        for i in range(self.tokens):
+            self.stamps.append(time.perf_counter())
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=f"tok{i % 97} "))])
+        self.stamps.append(time.perf_counter())
+
+    def per_token_us(self):
+        """Average microseconds per token over the first and last windows."""
+        gaps = [b - a for a, b in zip(self.stamps, self.stamps[1:])]
+        window = min(WINDOW, len(gaps) // 2)
+        first = sum(gaps[:window]) / window * 1e6
+        last = sum(gaps[-window:]) / window * 1e6
+        return first, last
+
+
+def fake_completer(stream: TimedStream) -> ChatCompleter:
+    completer = ChatCompleter(api_key="benchmark")
+    completer.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **_: stream)))
+    return completer
+
+
+def legacy_rich_loop(stream: TimedStream, live_console: Console) -> str:
+    """The previous stream_completion_rich loop, for comparison."""
+    response_text = ""
+    with Live(console=live_console, refresh_per_second=10, transient=False) as live:
+        for chunk in stream:
+            response_text += chunk.choices[0].delta.content
+            live.update(Text(response_text))
+    return response_text
+
+
+def main() -> int:
+    tokens = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    quiet_console = Console(file=io.StringIO(), force_terminal=True, width=120)
+    chat_module.console = quiet_console
+
+    rows = []
+
+    stream = TimedStream(tokens)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        fake_completer(stream).stream_completion("benchmark", model="llama-3.1-8b-instant")
+    rows.append(("stream_completion", *stream.per_token_us()))
+
+    stream = TimedStream(tokens)
+    fake_completer(stream).stream_completion_rich("benchmark", model="llama-3.1-8b-instant")
+    rows.append(("stream_completion_rich", *stream.per_token_us()))
+
+    stream = TimedStream(tokens)
+    legacy_rich_loop(stream, quiet_console)
+    rows.append(("legacy Text rebuild (reference)", *stream.per_token_us()))
+
+    table = Table(title=f"Per-token cost over a {tokens}-token stream")
+    table.add_column("Loop")
+    table.add_column(f"First {WINDOW} (µs/token)", justify="right")
+    table.add_column(f"Last {WINDOW} (µs/token)", justify="right")
+    table.add_column("Last / first", justify="right")
+    for name, first, last in rows:
+        table.add_row(name, f"{first:.2f}", f"{last:.2f}", f"{last / first:.1f}x")
+    console.print(table)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""Compare whole-document and streaming transcript writers.
+
+Builds a synthetic verbose_json transcript and writes it as SRT, WebVTT
+and JSON, once with the previous approach (build the whole document as
+one string, or json.dump with indent=2) and once with the streaming
+writers, reporting wall time and traced peak memory of each.
+
+Usage:
+    python benchmarks/bench_subtitles.py [segments]
+"""
+
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+# Allow running from a source checkout without installing
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from groq_cli.subtitles import write_transcript
+
+console = Console()
+
+WORDS_PER_SEGMENT = 12
+
+
+def synthetic_transcript(segments: int) -> dict:
+    """A verbose_json-shaped transcript with word timestamps."""
+    segment_list, words = [], []
+    for i in range(segments):
+        start = i * 3.7
+        text = " ".join(f"word{i}_{j}" for j in range(WORDS_PER_SEGMENT))
+        segment_list.append({
+            'id': i, 'seek': 0, 'start': start, 'end': start + 3.5, 'text': ' ' + text,
+            'tokens': list(range(50000 + i % 100, 50000 + i % 100 + 16)),
+            'temperature': 0.0, 'avg_logprob': -0.21, 'compression_ratio': 1.4, 'no_speech_prob': 0.01
+        })
+        for j in range(WORDS_PER_SEGMENT):
+            words.append({'word': f"word{i}_{j}", 'start': start + j * 0.29, 'end': start + j * 0.29 + 0.25})
+    return {
+        'task': 'transcribe', 'language': 'english', 'duration': segments * 3.7,
+        'text': " ".join(segment['text'].strip() for segment in segment_list),
+        'segments': segment_list, 'words': words
+    }
+
+
+def legacy_time(seconds: float, decimal: str) -> str:
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+    millis = int((seconds % 1) * 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{decimal}{millis:03d}"
+
+
+def legacy_write(data: dict, path: Path, format: str) -> None:
+    """The previous save_transcript: one joined string, or json.dump with indent."""
+    if format == "json":
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        return
+    lines = ["WEBVTT", ""] if format == "vtt" else []
+    decimal = "." if format == "vtt" else ","
+    for i, segment in enumerate(data['segments'], 1):
+        if format == "srt":
+            lines.append(f"{i}")
+        lines.append(f"{legacy_time(segment['start'], decimal)} --> {legacy_time(segment['end'], decimal)}")
+        lines.append(segment['text'].strip())
+        lines.append("")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines))
+
+
+def measure(write, data: dict, path: Path, format: str) -> tuple:
+    # Timed without tracing, which slows the pure-Python writers severalfold
+    started = time.perf_counter()
+    write(data, path, format)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    write(data, path, format)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024), path.stat().st_size / (1024 * 1024)
+
+
+def main() -> int:
+    segments = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    data = synthetic_transcript(segments)
+
+    table = Table(title=f"Writing a {segments:,}-segment transcript ({len(data['words']):,} words)")
+    table.add_column("Format")
+    table.add_column("Writer")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Traced peak (MB)", justify="right")
+    table.add_column("File (MB)", justify="right")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for format in ('srt', 'vtt', 'json'):
+            for name, write in (("whole document (previous)", legacy_write), ("streaming", write_transcript)):
+                elapsed, peak, size = measure(write, data, Path(tmp_dir) / f"out.{format}", format)
+                table.add_row(format, name, f"{elapsed:.2f}", f"{peak:.1f}", f"{size:.1f}")
+    console.print(table)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
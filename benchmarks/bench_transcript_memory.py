@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""Compare a verbose_json dict with the columnar Transcript.
+
+Decodes a synthetic verbose_json transcript from JSON (as the SDK does),
+then reports the traced memory of the dict and of the Transcript built
+from it, and the time to pull one minute of segments and words out of
+the middle of each.
+
+Usage:
+    python benchmarks/bench_transcript_memory.py [segments]
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+# Allow running from a source checkout without installing
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_subtitles import synthetic_transcript
+from groq_cli.transcript import Transcript
+
+console = Console()
+
+QUERIES = 200
+
+
+def traced(build):
+    """Build an object and return it with the memory it still holds, in MB."""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size / (1024 * 1024)
+
+
+def dict_between(data: dict, start: float, end: float) -> dict:
+    """Linear scan over the dict lists, as callers had to do before."""
+    return {
+        key: [item for item in data[key] if item['end'] > start and item['start'] < end]
+        for key in ('segments', 'words')
+    }
+
+
+def main() -> int:
+    segments = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    encoded = json.dumps(synthetic_transcript(segments))
+
+    data, dict_mb = traced(lambda: json.loads(encoded))
+    transcript, columnar_mb = traced(lambda: Transcript.from_dict(data))
+
+    duration = data['duration']
+    windows = [(duration * i / QUERIES, duration * i / QUERIES + 60) for i in range(QUERIES)]
+
+    started = time.perf_counter()
+    for start, end in windows:
+        dict_between(data, start, end)
+    dict_query = (time.perf_counter() - started) / QUERIES
+
+    started = time.perf_counter()
+    for start, end in windows:
+        transcript.between(start, end)
+    columnar_query = (time.perf_counter() - started) / QUERIES
+
+    assert transcript.between(*windows[1]).to_dict()['words'] == dict_between(data, *windows[1])['words']
+
+    table = Table(title=f"A {segments:,}-segment transcript ({len(data['words']):,} words)")
+    table.add_column("Representation")
+    table.add_column("Memory (MB)", justify="right")
+    table.add_column("1-minute range query (ms)", justify="right")
+    table.add_row("verbose_json dict", f"{dict_mb:.1f}", f"{dict_query * 1000:.2f}")
+    table.add_row("Transcript", f"{columnar_mb:.1f}", f"{columnar_query * 1000:.3f}")
+    console.print(table)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
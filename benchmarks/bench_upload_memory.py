@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""Measure peak memory of in-memory vs streamed transcription uploads.
+
+Each mode runs in its own subprocess against a local HTTP sink, so the
+peak RSS figures don't bleed into each other.
+
+Usage:
+    python benchmarks/bench_upload_memory.py [size_mb]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+READ_BLOCK = 64 * 1024
+
+
+class SinkHandler(BaseHTTPRequestHandler):
+    """Drain the upload body and answer like the transcription endpoint."""
+
+    def do_POST(self):
+        remaining = int(self.headers.get('Content-Length', 0))
+        while remaining > 0:
+            remaining -= len(self.rfile.read(min(READ_BLOCK, remaining)))
+
+        body = json.dumps({'text': 'ok'}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    try:
+        import resource
+    except ImportError:
+        return float('nan')
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak / 1024 / (1024 if sys.platform == 'darwin' else 1)
+
+
+def run_mode(mode: str, audio_path: Path) -> dict:
+    """Upload the file once in the given mode and report memory use."""
+    from groq import Groq
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SinkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = Groq(api_key='benchmark', base_url=f"http://127.0.0.1:{server.server_port}")
+
+    baseline_rss = peak_rss_mb()
+    tracemalloc.start()
+    with open(audio_path, 'rb') as audio_file:
+        payload = audio_file.read() if mode == 'bytes' else audio_file
+        client.audio.transcriptions.create(
+            file=(audio_path.name, payload),
+            model='whisper-large-v3-turbo',
+            response_format='json'
+        )
+        del payload
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    server.shutdown()
+
+    return {
+        'mode': mode,
+        'traced_peak_mb': traced_peak / (1024 * 1024),
+        'rss_growth_mb': peak_rss_mb() - baseline_rss
+    }
+
+
+def main() -> int:
+    """Run both modes and print a comparison."""
+    if len(sys.argv) == 3 and sys.argv[1] in ('bytes', 'stream'):
+        print(json.dumps(run_mode(sys.argv[1], Path(sys.argv[2]))))
+        return 0
+
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        audio_path = Path(tmp_dir) / 'upload.wav'
+        with open(audio_path, 'wb') as f:
+            for _ in range(size_mb):
+                f.write(os.urandom(1024 * 1024))
+
+        results = []
+        for mode in ('bytes', 'stream'):
+            completed = subprocess.run(
+                [sys.executable, __file__, mode, str(audio_path)],
+                capture_output=True, text=True, check=True
+            )
+            results.append(json.loads(completed.stdout))
+
+    table = Table(title=f"Upload memory for a {size_mb} MB file")
+    table.add_column("Mode")
+    table.add_column("Traced peak (MB)", justify="right")
+    table.add_column("Peak RSS growth (MB)", justify="right")
+    for result in results:
+        table.add_row(result['mode'], f"{result['traced_peak_mb']:.1f}", f"{result['rss_growth_mb']:.1f}")
+    console.print(table)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
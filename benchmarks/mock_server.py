@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+"""Local stand-in for the Groq API, for offline benchmarks and tests.
+
+Serves the three endpoints the CLI uses:
+
+    POST /openai/v1/chat/completions     SSE stream (or one JSON body)
+    POST /openai/v1/audio/transcriptions text, json or verbose_json
+    GET  /openai/v1/models               model list (daemon warm-up)
+
+Latency, token rate, chunk size, reply length and error injection are
+configurable. Point the SDK at it with base_url, or with GROQ_BASE_URL
+when running the CLI itself.
+
+Usage:
+    python benchmarks/mock_server.py [--port 8000] [--latency 0.1] [--tokens-per-second 400]
+    GROQ_BASE_URL=http://127.0.0.1:8000 gq "hello"
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+READ_BLOCK = 64 * 1024
+
+_FORM_FIELD = re.compile(rb'name="(response_format|model)"\r\n\r\n([^\r]*)\r\n')
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Routes requests to the mock endpoints."""
+
+    protocol_version = 'HTTP/1.1'
+    server: "MockGroqServer"
+
+    def do_GET(self):
+        if self.path.rstrip('/').endswith('/models'):
+            self._send_json(200, {'object': 'list', 'data': [{'id': 'mock', 'object': 'model', 'created': 0, 'owned_by': 'mock'}]})
+        else:
+            self._send_json(404, {'error': {'message': f'unknown path {self.path}'}})
+
+    def do_POST(self):
+        body = self._read_body()
+        self.server.count('requests')
+        time.sleep(self.server.latency)
+
+        if self.server.inject_error():
+            self.server.count('errors')
+            self._send_json(
+                self.server.error_status,
+                {'error': {'message': 'injected error', 'type': 'mock'}},
+                {'retry-after': '0.05'}
+            )
+            return
+
+        if self.path.endswith('/chat/completions'):
+            self._chat(json.loads(body or b'{}'))
+        elif self.path.endswith('/audio/transcriptions'):
+            self._transcription(body)
+        else:
+            self._send_json(404, {'error': {'message': f'unknown path {self.path}'}})
+
+    def _chat(self, request: Dict[str, Any]) -> None:
+        server = self.server
+        tokens = min(server.reply_tokens, request.get('max_tokens') or server.reply_tokens)
+        words = [f"tok{i} " for i in range(tokens)]
+
+        if not request.get('stream'):
+            self._send_json(200, {
+                'id': 'mock', 'object': 'chat.completion', 'created': 0, 'model': request.get('model', 'mock'),
+                'choices': [{'index': 0, 'finish_reason': 'stop', 'message': {'role': 'assistant', 'content': ''.join(words)}}],
+                'usage': {'prompt_tokens': 0, 'completion_tokens': tokens, 'total_tokens': tokens}
+            })
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self._rate_limit_headers()
+        self.end_headers()
+
+        # Encode the event envelope once; only the content differs per event
+        chunk = {
+            'id': 'mock', 'object': 'chat.completion.chunk', 'created': 0, 'model': request.get('model', 'mock'),
+            'choices': [{'index': 0, 'delta': {'content': '\x00'}, 'finish_reason': None}]
+        }
+        head, tail = f"data: {json.dumps(chunk)}\n\n".encode('utf-8').split(b'\\u0000')
+        events = [
+            head + json.dumps(''.join(words[start:start + server.chunk_tokens]))[1:-1].encode('utf-8') + tail
+            for start in range(0, len(words), server.chunk_tokens)
+        ]
+
+        interval = server.chunk_tokens / server.tokens_per_second if server.tokens_per_second else 0.0
+        if server.inject_disconnect():
+            server.count('disconnects')
+            events = events[:len(events) // 2]
+            self.close_connection = True
+        else:
+            events.append(b"data: [DONE]\n\n")
+
+        try:
+            if interval:
+                for event in events:
+                    self._write_chunk(event)
+                    time.sleep(interval)
+            else:
+                self._write_chunk(b''.join(events))
+            if not self.close_connection:
+                self._write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _transcription(self, body: bytes) -> None:
+        server = self.server
+        fields = {name.decode(): value.decode() for name, value in _FORM_FIELD.findall(body[:READ_BLOCK])}
+        time.sleep(server.seconds_per_mb * len(body) / (1024 * 1024))
+
+        segments = [
+            {'id': i, 'start': i * 2.0, 'end': i * 2.0 + 2.0, 'text': f' Segment number {i}.'}
+            for i in range(server.segments)
+        ]
+        text = ''.join(segment['text'] for segment in segments).strip()
+        response_format = fields.get('response_format', 'json')
+
+        if response_format == 'text':
+            self._send(200, text.encode('utf-8'), 'text/plain')
+        elif response_format == 'verbose_json':
+            self._send_json(200, {
+                'task': 'transcribe', 'language': 'english', 'duration': server.segments * 2.0,
+                'text': text, 'segments': segments
+            })
+        else:
+            self._send_json(200, {'text': text})
+
+    def _read_body(self) -> bytes:
+        remaining = int(self.headers.get('Content-Length', 0))
+        parts = []
+        while remaining > 0:
+            part = self.rfile.read(min(READ_BLOCK, remaining))
+            if not part:
+                break
+            parts.append(part)
+            remaining -= len(part)
+        self.server.count('bytes_received', sum(len(part) for part in parts))
+        return b''.join(parts)
+
+    def _rate_limit_headers(self) -> None:
+        # As the API reports them after one request: the reset is the time
+        # until that request's share of the quota is restored
+        quota = self.server.requests_per_minute
+        if quota:
+            self.send_header('x-ratelimit-limit-requests', str(int(quota)))
+            self.send_header('x-ratelimit-remaining-requests', str(int(quota) - 1))
+            self.send_header('x-ratelimit-reset-requests', f"{60 / quota:.3f}s")
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status == 200:
+            self._rate_limit_headers()
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        self._send(status, json.dumps(payload).encode('utf-8'), 'application/json', headers)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockGroqServer(ThreadingHTTPServer):
+    """
+    Threaded mock of the Groq API.
+
+    Use as a context manager to serve on a background thread; url is the
+    base_url to give the SDK. Counters record requests, injected errors,
+    dropped streams and bytes received.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        port: int = 0,
+        latency: float = 0.05,
+        tokens_per_second: float = 500.0,
+        chunk_tokens: int = 1,
+        reply_tokens: int = 200,
+        segments: int = 50,
+        seconds_per_mb: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        disconnect_rate: float = 0.0,
+        requests_per_minute: Optional[float] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize the server (not yet serving).
+
+        Args:
+            port: Port to bind on 127.0.0.1 (0 picks a free one)
+            latency: Seconds before the first byte of every response
+            tokens_per_second: Streaming rate of chat replies (0 for no delay)
+            chunk_tokens: Tokens per SSE event
+            reply_tokens: Length of chat replies (capped by max_tokens)
+            segments: Segments in verbose_json transcriptions
+            seconds_per_mb: Extra transcription processing time per MB uploaded
+            error_rate: Fraction of requests answered with error_status
+            error_status: Status for injected errors
+            disconnect_rate: Fraction of chat streams dropped halfway
+            requests_per_minute: Request quota advertised in x-ratelimit-*
+                headers (None sends no rate-limit headers)
+            seed: Seed for error injection
+        """
+        super().__init__(('127.0.0.1', port), MockHandler)
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.chunk_tokens = max(1, chunk_tokens)
+        self.reply_tokens = reply_tokens
+        self.segments = segments
+        self.seconds_per_mb = seconds_per_mb
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.disconnect_rate = disconnect_rate
+        self.requests_per_minute = requests_per_minute
+        self.counters = {'requests': 0, 'errors': 0, 'disconnects': 0, 'bytes_received': 0}
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += amount
+
+    def inject_error(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def inject_disconnect(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.disconnect_rate
+
+    def start(self) -> "MockGroqServer":
+        """Serve on a daemon thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="mock-groq", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self) -> "MockGroqServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--tokens-per-second', type=float, default=500.0)
+    parser.add_argument('--chunk-tokens', type=int, default=1)
+    parser.add_argument('--reply-tokens', type=int, default=200)
+    parser.add_argument('--segments', type=int, default=50)
+    parser.add_argument('--seconds-per-mb', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--disconnect-rate', type=float, default=0.0)
+    parser.add_argument('--requests-per-minute', type=float)
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args()
+
+    server = MockGroqServer(**vars(args))
+    print(f"Mock Groq API on {server.url} (set GROQ_BASE_URL={server.url})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""Fakes shared by the test modules.
+
+The API clients are replaced by small stand-ins that record what they
+were asked and stream canned replies, so the suite never needs a key or
+the network.
+"""
+
+import asyncio
+import io
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+
+
+def make_chunk(content):
+    """A streamed chat completion chunk carrying one piece of content."""
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+class FakeCompletions:
+    """Stand-in for client.chat.completions that streams a fixed reply and records each request."""
+
+    def __init__(self, reply=("ok",)):
+        self.reply = reply
+        self.calls = []
+
+    @property
+    def requests(self):
+        """Messages of each request, in order."""
+        return [params["messages"] for params in self.calls]
+
+    def create(self, **params):
+        self.calls.append(params)
+        return iter([make_chunk(part) for part in self.reply])
+
+
+class FakeAsyncCompletions:
+    """Stand-in for client.chat.completions that echoes the query back token by token."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def create(self, **params):
+        query = params["messages"][-1]["content"]
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+
+        async def stream():
+            try:
+                for word in query.split():
+                    await asyncio.sleep(0.001)
+                    yield make_chunk(word + " ")
+            finally:
+                self.active -= 1
+
+        return stream()
+
+
+def attach_completions(completer, completions=None):
+    """
+    Point a chat completer at fake completions.
+
+    Returns:
+        (completer, completions)
+    """
+    completions = completions if completions is not None else FakeCompletions()
+    completer.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return completer, completions
+
+
+def write_wav(path: Path, seconds: float, rate: int = 8000) -> Path:
+    """Write a silent mono 16-bit WAV file."""
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b'\x00\x00' * int(seconds * rate))
+    return path
+
+
+class FakeTranscriptions:
+    """Stand-in for client.audio.transcriptions emitting one segment per second."""
+
+    def __init__(self):
+        self.calls = []
+
+    def create(self, **params):
+        name, data = params['file']
+        self.calls.append(params)
+        if isinstance(data, bytes):
+            data = io.BytesIO(data)
+        with wave.open(data, 'rb') as wav:
+            length = wav.getnframes() / wav.getframerate()
+        starts = range(int(length) + (length % 1 > 0))
+        segments = [
+            {'id': i, 'start': float(i), 'end': min(i + 1.0, length), 'text': ' tick'}
+            for i in starts
+        ]
+        return {
+            'text': ''.join(segment['text'] for segment in segments),
+            'segments': segments,
+            'words': [{'word': 'tick', 'start': s['start'], 'end': s['end']} for s in segments],
+        }
+
+
+class FailingTranscriptions(FakeTranscriptions):
+    """Fails once a given number of requests have succeeded."""
+
+    def __init__(self, succeed: int):
+        super().__init__()
+        self.succeed = succeed
+
+    def create(self, **params):
+        if len(self.calls) >= self.succeed:
+            raise RuntimeError("connection dropped")
+        return super().create(**params)
+
+
+def make_transcriber(transcriptions=None, **options):
+    """
+    Build a WhisperTranscriber whose API client is a fake.
+
+    Args:
+        transcriptions: Fake transcriptions endpoint (a FakeTranscriptions by default)
+        **options: WhisperTranscriber arguments
+
+    Returns:
+        (transcriber, transcriptions)
+    """
+    from groq_cli.transcriber import WhisperTranscriber
+
+    transcriptions = transcriptions if transcriptions is not None else FakeTranscriptions()
+    transcriber = WhisperTranscriber(api_key='test-key', **options)
+    transcriber.client = SimpleNamespace(audio=SimpleNamespace(transcriptions=transcriptions))
+    return transcriber, transcriptions
@@ -0,0 +1,344 @@
+"""Audio helpers for splitting and preparing files before upload."""
+
+import shutil
+import subprocess
+import wave
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Default chunk layout for files over the tier size limit
+CHUNK_SECONDS = 600.0
+CHUNK_OVERLAP = 10.0
+
+# Chunks produced by ffmpeg are 16 kHz mono FLAC, which never exceeds
+# the raw 16-bit PCM rate
+FFMPEG_CHUNK_BYTES_PER_SECOND = 16000 * 2
+
+# Leave headroom below the limit for container overhead
+CHUNK_SIZE_HEADROOM = 0.9
+
+WAV_COPY_FRAMES = 65536
+
+
+def find_ffmpeg() -> Optional[str]:
+    """Return the path to the ffmpeg executable, if installed."""
+    return shutil.which('ffmpeg')
+
+
+def is_wav(file_path: Path) -> bool:
+    """Check whether a file can be handled natively with the wave module."""
+    return file_path.suffix.lower() == '.wav'
+
+
+def get_audio_duration(file_path: Path) -> float:
+    """
+    Get the duration of an audio file in seconds.
+
+    Args:
+        file_path: Path to audio file
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        ValueError: If the duration cannot be determined
+    """
+    if is_wav(file_path):
+        with wave.open(str(file_path), 'rb') as wav:
+            return wav.getnframes() / float(wav.getframerate())
+
+    ffprobe = shutil.which('ffprobe')
+    if not ffprobe:
+        raise ValueError(
+            f"ffprobe is required to split {file_path.suffix} files. "
+            "Install ffmpeg or convert the file to WAV."
+        )
+
+    completed = subprocess.run(
+        [ffprobe, '-v', 'error', '-show_entries', 'format=duration',
+         '-of', 'default=noprint_wrappers=1:nokey=1', str(file_path)],
+        capture_output=True, text=True
+    )
+    try:
+        return float(completed.stdout.strip())
+    except ValueError:
+        raise ValueError(f"Could not read duration of {file_path.name}: {completed.stderr.strip()}")
+
+
+def max_chunk_seconds(file_path: Path, max_bytes: int, chunk_seconds: float = CHUNK_SECONDS) -> float:
+    """
+    Get the longest chunk duration that stays under the upload size limit.
+
+    Args:
+        file_path: Path to audio file
+        max_bytes: Upload size limit in bytes
+        chunk_seconds: Preferred chunk duration
+
+    Returns:
+        Chunk duration in seconds
+    """
+    if is_wav(file_path):
+        with wave.open(str(file_path), 'rb') as wav:
+            bytes_per_second = wav.getframerate() * wav.getnchannels() * wav.getsampwidth()
+    else:
+        bytes_per_second = FFMPEG_CHUNK_BYTES_PER_SECOND
+
+    return min(chunk_seconds, max_bytes * CHUNK_SIZE_HEADROOM / bytes_per_second)
+
+
+def plan_chunks(
+    duration: float,
+    chunk_seconds: float = CHUNK_SECONDS,
+    overlap: float = CHUNK_OVERLAP,
+    cut_points: Optional[List[float]] = None
+) -> List[Tuple[float, float]]:
+    """
+    Split a timeline into overlapping chunks.
+
+    When cut points (known silences) are given, each chunk ends at the
+    latest one in the second half of its window with no overlap, so no
+    word is split. Windows without a cut point fall back to an overlapping
+    cut.
+
+    Args:
+        duration: Total duration in seconds
+        chunk_seconds: Length of each chunk
+        overlap: Seconds shared between neighbouring chunks
+        cut_points: Optional sorted times where it is safe to cut
+
+    Returns:
+        List of (start, end) tuples in seconds
+    """
+    if chunk_seconds <= overlap:
+        raise ValueError("Chunk length must be greater than the overlap")
+
+    cut_points = cut_points or []
+    chunks = []
+    start = 0.0
+    while True:
+        end = min(start + chunk_seconds, duration)
+        if end >= duration:
+            chunks.append((start, end))
+            break
+
+        candidates = [cut for cut in cut_points if start + chunk_seconds / 2 < cut <= end]
+        if candidates:
+            chunks.append((start, candidates[-1]))
+            start = candidates[-1]
+        else:
+            chunks.append((start, end))
+            start = end - overlap
+    return chunks
+
+
+def extract_chunk(file_path: Path, start: float, end: float, dest_dir: Path) -> Path:
+    """
+    Write one time range of an audio file to a standalone file.
+
+    WAV files are copied frame-by-frame with the wave module; other formats
+    are cut and re-encoded to 16 kHz mono FLAC with ffmpeg.
+
+    Args:
+        file_path: Path to source audio file
+        start: Chunk start in seconds
+        end: Chunk end in seconds
+        dest_dir: Directory to write the chunk into
+
+    Returns:
+        Path to the chunk file
+    """
+    stem = f"{file_path.stem}_{int(start * 1000):010d}"
+
+    if is_wav(file_path):
+        dest = dest_dir / f"{stem}.wav"
+        with wave.open(str(file_path), 'rb') as src, wave.open(str(dest), 'wb') as out:
+            rate = src.getframerate()
+            frame_size = src.getnchannels() * src.getsampwidth()
+            out.setnchannels(src.getnchannels())
+            out.setsampwidth(src.getsampwidth())
+            out.setframerate(rate)
+
+            src.setpos(int(start * rate))
+            remaining = int(end * rate) - int(start * rate)
+            while remaining > 0:
+                frames = src.readframes(min(WAV_COPY_FRAMES, remaining))
+                if not frames:
+                    break
+                out.writeframes(frames)
+                remaining -= len(frames) // frame_size
+        return dest
+
+    ffmpeg = find_ffmpeg()
+    if not ffmpeg:
+        raise ValueError(
+            f"ffmpeg is required to split {file_path.suffix} files. "
+            "Install ffmpeg or convert the file to WAV."
+        )
+
+    dest = dest_dir / f"{stem}.flac"
+    subprocess.run(
+        [ffmpeg, '-v', 'error', '-y', '-ss', f"{start:.3f}", '-t', f"{end - start:.3f}",
+         '-i', str(file_path), '-ac', '1', '-ar', '16000', '-c:a', 'flac', str(dest)],
+        check=True, capture_output=True
+    )
+    return dest
+
+
+# Whisper downsamples everything to 16 kHz mono internally
+TARGET_SAMPLE_RATE = 16000
+
+PCM_BLOCK_SECONDS = 30
+
+
+def _require_numpy():
+    """Import numpy, explaining how to install it if missing."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "numpy is required for local audio processing. "
+            "Install it with: pip install groq-cli[audio]"
+        )
+    return numpy
+
+
+def read_pcm_blocks(file_path: Path, sample_rate: int = TARGET_SAMPLE_RATE, block_seconds: float = PCM_BLOCK_SECONDS):
+    """
+    Decode an audio file to mono float32 PCM, one block at a time.
+
+    WAV files are decoded and resampled with numpy; other formats are piped
+    through ffmpeg.
+
+    Args:
+        file_path: Path to audio file
+        sample_rate: Output sample rate
+        block_seconds: Seconds of audio per yielded block
+
+    Yields:
+        numpy float32 arrays in the range [-1, 1]
+    """
+    np = _require_numpy()
+    block_samples = int(sample_rate * block_seconds)
+
+    if not is_wav(file_path):
+        ffmpeg = find_ffmpeg()
+        if not ffmpeg:
+            raise ValueError(
+                f"ffmpeg is required to decode {file_path.suffix} files. "
+                "Install ffmpeg or convert the file to WAV."
+            )
+        process = subprocess.Popen(
+            [ffmpeg, '-v', 'error', '-i', str(file_path), '-ac', '1', '-ar', str(sample_rate),
+             '-f', 's16le', '-'],
+            stdout=subprocess.PIPE
+        )
+        try:
+            while True:
+                data = process.stdout.read(block_samples * 2)
+                if not data:
+                    break
+                yield np.frombuffer(data[:len(data) // 2 * 2], dtype='<i2').astype(np.float32) / 32768.0
+        finally:
+            process.stdout.close()
+            process.wait()
+        return
+
+    with wave.open(str(file_path), 'rb') as wav:
+        channels = wav.getnchannels()
+        width = wav.getsampwidth()
+        source_rate = wav.getframerate()
+        if width not in (1, 2, 4):
+            raise ValueError(f"Unsupported WAV sample width: {width * 8} bits")
+
+        ratio = source_rate / sample_rate
+        frames_per_block = max(1, int(block_samples * ratio))
+        position = 0  # source frames consumed before the current block
+        next_output = 0  # index of the next output sample
+        carry = None
+
+        while True:
+            data = wav.readframes(frames_per_block)
+            if not data:
+                break
+
+            if width == 1:
+                samples = (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+            elif width == 2:
+                samples = np.frombuffer(data, dtype='<i2').astype(np.float32) / 32768.0
+            else:
+                samples = np.frombuffer(data, dtype='<i4').astype(np.float32) / 2147483648.0
+            mono = samples.reshape(-1, channels).mean(axis=1)
+
+            if ratio == 1:
+                yield mono
+                continue
+
+            # Keep one sample from the previous block so interpolation is
+            # continuous across block edges
+            if carry is not None:
+                mono = np.concatenate(([carry], mono))
+                offset = position - 1
+            else:
+                offset = position
+            position += len(mono) - (1 if carry is not None else 0)
+            carry = mono[-1]
+
+            last_output = int((position - 1) / ratio)
+            times = np.arange(next_output, last_output + 1) * ratio
+            next_output = last_output + 1
+            yield np.interp(times - offset, np.arange(len(mono)), mono).astype(np.float32)
+
+
+def write_wav_pcm(dest: Path, blocks, sample_rate: int = TARGET_SAMPLE_RATE) -> Path:
+    """
+    Write float PCM blocks to a 16-bit mono WAV file.
+
+    Args:
+        dest: Output path
+        blocks: Iterable of float arrays in [-1, 1]
+        sample_rate: Sample rate of the blocks
+
+    Returns:
+        Path to the written file
+    """
+    np = _require_numpy()
+    with wave.open(str(dest), 'wb') as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(sample_rate)
+        for block in blocks:
+            out.writeframes((np.clip(block, -1.0, 1.0) * 32767).astype('<i2').tobytes())
+    return dest
+
+
+def reencode_audio(file_path: Path, dest_dir: Path) -> Path:
+    """
+    Downmix to mono, resample to 16 kHz and re-encode an audio file locally.
+
+    Uses ffmpeg to produce FLAC when it is installed. Without ffmpeg, WAV
+    files are rewritten as 16-bit 16 kHz mono WAV with numpy.
+
+    Args:
+        file_path: Path to source audio file
+        dest_dir: Directory to write the re-encoded file into
+
+    Returns:
+        Path to the re-encoded file
+
+    Raises:
+        ValueError: If no local encoder can handle the file
+    """
+    ffmpeg = find_ffmpeg()
+    if ffmpeg:
+        dest = dest_dir / f"{file_path.stem}_16k.flac"
+        subprocess.run(
+            [ffmpeg, '-v', 'error', '-y', '-i', str(file_path), '-ac', '1',
+             '-ar', str(TARGET_SAMPLE_RATE), '-c:a', 'flac', str(dest)],
+            check=True, capture_output=True
+        )
+        return dest
+
+    if is_wav(file_path):
+        return write_wav_pcm(dest_dir / f"{file_path.stem}_16k.wav", read_pcm_blocks(file_path))
+
+    raise ValueError(f"ffmpeg is required to re-encode {file_path.suffix} files")
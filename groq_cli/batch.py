@@ -0,0 +1,200 @@
+"""Batch transcription of audio directories and glob patterns."""
+
+import glob
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn, TimeElapsedColumn
+
+from groq_cli.audio import get_audio_duration
+from groq_cli.manifest import JobManifest
+from groq_cli.transcriber import SUPPORTED_FORMATS, WhisperTranscriber
+from groq_cli.utils import DEFAULT_WORKERS
+
+console = Console()
+
+
+def find_audio_files(pattern: str) -> List[Path]:
+    """
+    Collect supported audio files from a directory tree or glob pattern.
+
+    Args:
+        pattern: Directory to walk recursively, or a glob pattern
+
+    Returns:
+        Sorted list of resolved audio file paths
+    """
+    root = Path(pattern)
+    if root.is_dir():
+        candidates = (path for path in root.rglob('*') if path.is_file())
+    else:
+        candidates = (Path(match) for match in glob.glob(pattern, recursive=True))
+
+    return sorted({
+        path.resolve() for path in candidates
+        if path.is_file() and path.suffix.lower() in SUPPORTED_FORMATS
+    })
+
+
+def output_path_for(file_path: Path, format: str) -> Path:
+    """
+    Get the transcript path written next to a source file.
+
+    The source extension is replaced (call.wav -> call.txt) unless another
+    audio file in the same folder shares the stem; then it is kept
+    (call.wav.txt and call.mp3.txt), so neither transcript overwrites
+    the other.
+
+    Args:
+        file_path: Source audio file
+        format: Transcript format ('text', 'json', 'srt', 'vtt')
+
+    Returns:
+        Path of the transcript
+    """
+    extension = f'.{format if format != "text" else "txt"}'
+    siblings = (
+        file_path.with_suffix(suffix)
+        for known in SUPPORTED_FORMATS
+        for suffix in (known, known.upper())
+        if suffix != file_path.suffix
+    )
+    if any(sibling.is_file() for sibling in siblings):
+        return file_path.with_name(file_path.name + extension)
+    return file_path.with_suffix(extension)
+
+
+def transcribe_batch(
+    transcriber: WhisperTranscriber,
+    files: List[Path],
+    model: str = "whisper-large-v3-turbo",
+    language: Optional[str] = None,
+    format: str = "text",
+    workers: int = DEFAULT_WORKERS,
+    preprocess: Optional[bool] = None,
+    trim_silence: bool = False,
+    manifest: Optional[JobManifest] = None
+) -> Dict[str, Any]:
+    """
+    Transcribe many files concurrently and save each transcript next to its source.
+
+    All jobs share the transcriber's client. Oversized files are still
+    chunked, but their chunks run serially so total concurrency stays at
+    ``workers``. With a manifest, each finished file is checkpointed and
+    files finished by an earlier run of the same job are skipped; the
+    manifest is removed once every file has succeeded.
+
+    Args:
+        transcriber: Transcriber whose client is shared by every job
+        files: Audio files to transcribe
+        model: Whisper model to use
+        language: Optional language code
+        format: Transcript format to save ('text', 'json', 'srt', 'vtt')
+        workers: Number of files to transcribe concurrently
+        preprocess: Re-encode before upload (None re-encodes lossless formats only)
+        trim_silence: Cut long silences before upload
+        manifest: Optional checkpoint manifest for this job
+
+    Returns:
+        Summary dictionary with counts, failures and throughput (of the
+        files transcribed in this run; 'resumed' counts the skipped ones)
+    """
+    def run_job(file_path: Path) -> float:
+        # verbose_json always carries the duration used for throughput
+        result = transcriber.transcribe(
+            file_path,
+            model=model,
+            language=language,
+            response_format="verbose_json",
+            include_timestamps=(format in ['srt', 'vtt', 'json']),
+            workers=1,
+            quiet=True,
+            preprocess=preprocess,
+            trim_silence=trim_silence,
+            compact=True
+        )
+        output_path = transcriber.save_transcript(result, output_path_for(file_path, format), format=format)
+
+        duration = result.get('duration')
+        if duration is None:
+            try:
+                duration = get_audio_duration(file_path)
+            except ValueError:
+                duration = 0.0
+        if manifest is not None:
+            manifest.mark(str(file_path), 'done', result=str(output_path), audio_seconds=float(duration))
+        return float(duration)
+
+    resumed = 0
+    if manifest is not None:
+        remaining = [path for path in files if not manifest.is_done(str(path))]
+        resumed = len(files) - len(remaining)
+        if resumed:
+            console.print(f"[dim]Resuming: {resumed} of {len(files)} files already done[/dim]")
+        files = remaining
+
+    succeeded = 0
+    audio_seconds = 0.0
+    failures = []
+    started = time.perf_counter()
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console
+    ) as progress:
+        task = progress.add_task("Transcribing files...", total=len(files))
+
+        executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="groq-batch")
+        try:
+            futures = {executor.submit(run_job, path): path for path in files}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    audio_seconds += future.result()
+                    succeeded += 1
+                except Exception as e:
+                    failures.append((path, str(e)))
+                    if manifest is not None:
+                        manifest.mark(str(path), 'failed', error=str(e))
+                    console.print(f"[red]✗ {path.name}: {e}[/red]")
+                progress.advance(task)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    elapsed = time.perf_counter() - started
+    minutes = elapsed / 60 if elapsed > 0 else float('inf')
+    if manifest is not None and not failures:
+        manifest.remove()
+
+    return {
+        'files': len(files),
+        'resumed': resumed,
+        'succeeded': succeeded,
+        'failed': failures,
+        'elapsed': elapsed,
+        'audio_seconds': audio_seconds,
+        'files_per_min': succeeded / minutes,
+        'audio_hours_per_min': audio_seconds / 3600 / minutes
+    }
+
+
+def print_batch_summary(summary: Dict[str, Any]) -> None:
+    """Print the throughput summary for a batch run."""
+    console.print("\n[bold cyan]Batch Summary:[/bold cyan]")
+    console.print(f"  Files: {summary['succeeded']}/{summary['files']} transcribed")
+    if summary.get('resumed'):
+        console.print(f"  Resumed: {summary['resumed']} already done in an earlier run")
+    if summary['failed']:
+        console.print(f"  [red]Failed: {len(summary['failed'])}[/red]")
+    console.print(f"  Audio: {summary['audio_seconds'] / 3600:.2f} hours in {summary['elapsed']:.1f} seconds")
+    console.print(
+        f"  Throughput: {summary['files_per_min']:.1f} files/min, "
+        f"{summary['audio_hours_per_min']:.2f} audio-hours/min"
+    )
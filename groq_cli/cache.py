@@ -0,0 +1,351 @@
+"""On-disk caches for transcriptions and deterministic chat completions."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+# Default cap on the total size of cached responses
+DEFAULT_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+# Eviction frees space down to this fraction of the cap, so a full cache
+# is not swept again on every put
+EVICT_TO_FRACTION = 0.9
+
+# Completion cache defaults
+COMPLETION_TTL_SECONDS = 7 * 24 * 3600
+COMPLETION_MAX_BYTES = 50 * 1024 * 1024
+COMPLETION_MEMORY_ENTRIES = 256
+
+# Request parameters that determine a completion
+COMPLETION_KEY_FIELDS = ('messages', 'model', 'temperature', 'max_tokens', 'include_domains', 'exclude_domains')
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Get the per-user cache directory for transcripts."""
+    base = os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME')
+    root = Path(base) if base else Path.home() / '.cache'
+    return root / 'groq-cli' / 'transcripts'
+
+
+def default_completion_cache_path() -> Path:
+    """Get the per-user path of the chat completion cache database."""
+    return default_cache_dir().parent / 'completions.sqlite3'
+
+
+def hash_file(file_path: Path) -> str:
+    """
+    Hash a file's contents without loading it into memory.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class TranscriptionCache:
+    """
+    Content-addressed store of transcription responses with LRU eviction.
+
+    The total size is tracked as entries are written, and the directory
+    is only scanned (and the total re-read from disk) when that total
+    passes the cap, or on the first put.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (defaults to the user cache dir)
+            max_bytes: Total size cap; least recently used entries are evicted beyond it
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Bytes of entries on disk; None until the first scan
+        self._total: Optional[int] = None
+
+    def make_key(self, file_path: Path, params: Dict[str, Any]) -> str:
+        """
+        Build the cache key for an audio file and request parameters.
+
+        Args:
+            file_path: Path to the audio file
+            params: Request parameters that affect the response
+
+        Returns:
+            Hex cache key
+        """
+        digest = hashlib.sha256(hash_file(file_path).encode('ascii'))
+        digest.update(json.dumps(params, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            The stored response, or None on a miss
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        # Touch the entry so eviction treats it as recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return entry.get('result')
+
+    def put(self, key: str, result: Any) -> None:
+        """
+        Store a response and evict old entries if over the size cap.
+
+        Args:
+            key: Cache key from make_key
+            result: Transcription response (dict or string)
+        """
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f'.{threading.get_ident()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'result': result}, f, ensure_ascii=False)
+        with self._lock:
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+            if self._total is not None:
+                self._total += path.stat().st_size - replaced
+            over = self._total is None or self._total > self.max_bytes
+        if over:
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries once the cache passes its size cap.
+
+        Entries are removed until the total is back under
+        EVICT_TO_FRACTION of the cap.
+        """
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.cache_dir.glob('*.json'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            if total > self.max_bytes:
+                entries.sort()
+                target = self.max_bytes * EVICT_TO_FRACTION
+                for _, size, path in entries:
+                    if total <= target:
+                        break
+                    try:
+                        path.unlink()
+                    except FileNotFoundError:
+                        pass
+                    total -= size
+            self._total = total
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        with self._lock:
+            for path in self.cache_dir.glob('*.json'):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            self._total = 0
+
+
+class CompletionCache:
+    """
+    Cache of deterministic chat completions, in memory and in sqlite.
+
+    Only requests with temperature 0 are cached, and compound models
+    (whose answers depend on live web search) are skipped unless
+    allow_compound is set. Entries expire after a TTL, and the least
+    recently used are evicted once the database passes its size cap.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttl: float = COMPLETION_TTL_SECONDS,
+        max_bytes: int = COMPLETION_MAX_BYTES,
+        memory_entries: int = COMPLETION_MEMORY_ENTRIES,
+        allow_compound: bool = False
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: sqlite database file (defaults to the user cache dir)
+            ttl: Seconds an entry stays valid
+            max_bytes: Cap on the total size of stored responses
+            memory_entries: Entries also kept in memory for repeat hits
+            allow_compound: Cache compound-model responses too
+        """
+        self.path = Path(path) if path else default_completion_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.allow_compound = allow_compound
+        self.hits = 0
+        self.misses = 0
+
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            "key TEXT PRIMARY KEY, result TEXT NOT NULL, created REAL NOT NULL, "
+            "accessed REAL NOT NULL, size INTEGER NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS completions_accessed ON completions (accessed)")
+
+    def cacheable(self, params: Dict[str, Any]) -> bool:
+        """
+        Whether a request's response can be reused.
+
+        Args:
+            params: Request parameters from build_chat_params
+
+        Returns:
+            True for temperature-0 requests to non-compound models (or any
+            model with allow_compound)
+        """
+        if params.get('temperature') != 0:
+            return False
+        return self.allow_compound or 'compound' not in params.get('model', '')
+
+    def make_key(self, params: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a chat request.
+
+        Args:
+            params: Request parameters from build_chat_params
+
+        Returns:
+            Hex cache key
+        """
+        fields = {field: params.get(field) for field in COMPLETION_KEY_FIELDS}
+        return hashlib.sha256(json.dumps(fields, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached completion.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            The stored result, or None on a miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry[0] + self.ttl > now:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+            row = self._db.execute(
+                "SELECT result, created FROM completions WHERE key = ? AND created > ?",
+                (key, now - self.ttl)
+            ).fetchone()
+            if row is None:
+                self._memory.pop(key, None)
+                self.misses += 1
+                return None
+
+            self._db.execute("UPDATE completions SET accessed = ? WHERE key = ?", (now, key))
+            result = json.loads(row[0])
+            self._remember(key, row[1], result)
+            self.hits += 1
+            return result
+
+    def put(self, key: str, result: Any) -> None:
+        """
+        Store a completion and evict expired or excess entries.
+
+        Args:
+            key: Cache key from make_key
+            result: Completion result (must be JSON serialisable)
+        """
+        now = time.time()
+        data = json.dumps(result, ensure_ascii=False, default=str)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO completions (key, result, created, accessed, size) VALUES (?, ?, ?, ?, ?)",
+                (key, data, now, now, len(data))
+            )
+            self._remember(key, now, result)
+            self._evict(now)
+
+    def _remember(self, key: str, created: float, result: Any) -> None:
+        self._memory[key] = (created, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self, now: float) -> None:
+        self._db.execute("DELETE FROM completions WHERE created <= ?", (now - self.ttl,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM completions").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # Least recently used first, until back under the cap
+        doomed = []
+        for key, size in self._db.execute("SELECT key, size FROM completions ORDER BY accessed"):
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM completions WHERE key = ?", doomed)
+        for (key,) in doomed:
+            self._memory.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        with self._lock:
+            self._memory.clear()
+            self._db.execute("DELETE FROM completions")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
@@ -1,13 +1,25 @@
 """Chat completion module with streaming support for Groq API including compound model capabilities."""
 
+import asyncio
+import contextlib
+import json
 import os
-from typing import Optional, List, Dict, Generator, Any
-from groq import Groq, GroqError, RateLimitError, APIError
+import time
+from collections import deque
+from typing import Deque, Optional, List, Dict, Generator, Any, TextIO, Union
+from groq import AsyncGroq, DefaultAsyncHttpxClient, DefaultHttpxClient, Groq, GroqError, RateLimitError, APIError
 from rich.console import Console
 import sys
 from rich.live import Live
 from rich.text import Text
-from rich.markdown import Markdown
+
+from groq_cli.cache import CompletionCache
+from groq_cli.history import DEFAULT_HISTORY_TOKENS, ConversationHistory, estimate_tokens
+from groq_cli.output import TokenSink
+from groq_cli.ratelimit import RateLimiter, shared_limiter
+from groq_cli.retry import RetryPolicy
+from groq_cli.stats import RequestStats
+from groq_cli.summary import RollingSummarizer
 
 # Force UTF-8 encoding for Windows
 if sys.platform == "win32":
@@ -16,23 +28,124 @@ if sys.platform == "win32":
 
 console = Console(force_terminal=True, legacy_windows=False)
 
+# In-flight request limit for AsyncChatCompleter.gather_completions
+DEFAULT_CONCURRENCY = 8
+
+# Request sizes kept for the end-of-session summary; a long-lived daemon
+# must not grow without bound
+REQUEST_BYTES_WINDOW = 1000
+
+
+def build_chat_params(
+    query: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    system_prompt: Optional[str] = None,
+    history: Optional[List[Dict[str, str]]] = None,
+    include_domains: Optional[List[str]] = None,
+    exclude_domains: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Build the request parameters for a streaming chat completion.
+
+    Args:
+        query: User query
+        model: Model to use
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        system_prompt: Optional system prompt
+        history: Previous messages to include before the query
+        include_domains: Domains to restrict web search to (compound models)
+        exclude_domains: Domains to exclude from web search (compound models)
+
+    Returns:
+        Keyword arguments for chat.completions.create
+    """
+    messages = []
+
+    # Add system prompt if provided
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+
+    # Add conversation history if maintaining
+    if history:
+        messages.extend(history)
+
+    # Add current query
+    messages.append({"role": "user", "content": query})
+
+    params = {
+        "messages": messages,
+        "model": model,
+        "stream": True,
+        "temperature": temperature,
+        "max_tokens": max_tokens
+    }
+
+    # Add domain filtering for compound models
+    if "compound" in model:
+        if include_domains:
+            params["include_domains"] = include_domains
+        if exclude_domains:
+            params["exclude_domains"] = exclude_domains
+
+    return params
+
 
 class ChatCompleter:
     """Handles chat completions with streaming support."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[CompletionCache] = None,
+        history_tokens: int = DEFAULT_HISTORY_TOKENS
+    ):
         """
         Initialize chat completer with API credentials.
 
         Args:
             api_key: Groq API key (defaults to GROQ_API_KEY env var)
+            http_client: Optional httpx.Client to share a connection pool
+            rate_limiter: Limiter for this completer's requests (defaults to
+                the process-wide one)
+            retry_policy: Retry policy for requests that fail before any
+                token arrives
+            cache: Optional cache for deterministic (temperature 0) completions
+            history_tokens: Cap on history tokens sent with each request; the
+                model's context window lowers it further when smaller
         """
+        started = time.perf_counter()
         self.api_key = api_key or os.environ.get('GROQ_API_KEY')
         if not self.api_key:
             raise ValueError("API key required. Set GROQ_API_KEY or pass api_key parameter.")
 
-        self.client = Groq(api_key=self.api_key)
-        self.conversation_history: List[Dict[str, str]] = []
+        self.rate_limiter = rate_limiter or shared_limiter()
+        http_client = self.rate_limiter.attach(http_client or DefaultHttpxClient())
+        # Retries are handled by retry_policy, which knows whether tokens were shown
+        self.client = Groq(api_key=self.api_key, http_client=http_client, max_retries=0)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self.history = ConversationHistory(max_tokens=history_tokens)
+
+        # Size of the messages payload of recent requests, in bytes
+        self.request_bytes: Deque[int] = deque(maxlen=REQUEST_BYTES_WINDOW)
+
+        # Reported in the first request's stats
+        self._init_seconds: Optional[float] = time.perf_counter() - started
+
+    @property
+    def conversation_history(self) -> List[Dict[str, str]]:
+        """Conversation messages, with the pinned system prompt first."""
+        return self.history.messages
+
+    @conversation_history.setter
+    def conversation_history(self, messages: List[Dict[str, str]]) -> None:
+        self.history.set_messages(messages)
 
     def stream_completion(
         self,
@@ -43,7 +156,8 @@ class ChatCompleter:
         system_prompt: Optional[str] = None,
         maintain_history: bool = False,
         include_domains: Optional[List[str]] = None,
-        exclude_domains: Optional[List[str]] = None
+        exclude_domains: Optional[List[str]] = None,
+        output: Optional[TextIO] = None
     ) -> Dict[str, Any]:
         """
         Stream a chat completion response.
@@ -55,71 +169,106 @@ class ChatCompleter:
             max_tokens: Maximum tokens to generate
             system_prompt: Optional system prompt
             maintain_history: Whether to maintain conversation history
+            output: Text stream for the tokens (defaults to stdout)
 
         Returns:
-            Complete response text
+            Dictionary with the response text, tools used and request stats
         """
-        messages = []
-
-        # Add system prompt if provided
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+        stats = RequestStats('chat', model=model)
+        if self._init_seconds is not None:
+            stats.add('client_init', self._init_seconds)
+            self._init_seconds = None
 
-        # Add conversation history if maintaining
+        history = None
         if maintain_history:
-            messages.extend(self.conversation_history)
+            # The system prompt is pinned in the history so eviction never drops it
+            if system_prompt:
+                self.history.system_prompt = system_prompt
+            self.history.fit_request(model, query, max_tokens)
+            history, system_prompt = self.history.messages, None
+
+        params = build_chat_params(
+            query,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            history=history,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains
+        )
 
-        # Add current query
-        messages.append({"role": "user", "content": query})
+        cache_key = self.cache.make_key(params) if self.cache and self.cache.cacheable(params) else None
+        cached = self.cache.get(cache_key) if cache_key else None
 
         try:
-            # Build parameters
-            params = {
-                "messages": messages,
-                "model": model,
-                "stream": True,
-                "temperature": temperature,
-                "max_tokens": max_tokens
-            }
-
-            # Add domain filtering for compound models
-            if "compound" in model:
-                if include_domains:
-                    params["include_domains"] = include_domains
-                if exclude_domains:
-                    params["exclude_domains"] = exclude_domains
-
-            # Create streaming chat completion
-            stream = self.client.chat.completions.create(**params)
-
-            response_text = ""
+            # Collect tokens in a list and join once; repeated string
+            # concatenation copies the whole response on every token
+            response_parts = []
             executed_tools = []
-
-            # Stream tokens to console
-            for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    content = chunk.choices[0].delta.content
-                    response_text += content
-                    print(content, end="", flush=True)
-
-                # Check for executed tools (compound models)
-                if hasattr(chunk.choices[0], 'message') and hasattr(chunk.choices[0].message, 'executed_tools'):
-                    executed_tools = chunk.choices[0].message.executed_tools
+            completion_tokens = None
+
+            if cached is not None:
+                # Replay through the same sink so output looks the same
+                stats.count('cache_hits')
+                response_parts.append(cached["text"])
+                executed_tools = cached["tools_used"]
+                with TokenSink(output) as sink:
+                    stats.token()
+                    sink.write(cached["text"])
+            else:
+                self.request_bytes.append(len(json.dumps(params["messages"], ensure_ascii=False).encode('utf-8')))
+                prompt_tokens = sum(estimate_tokens(m["content"]) for m in params["messages"])
+
+                def attempt() -> None:
+                    nonlocal executed_tools, completion_tokens
+                    stats.count('attempts')
+                    queued = time.perf_counter()
+                    # The slot is held while the response streams, so the limiter
+                    # counts in-flight streams; tokens are the prompt estimate
+                    with self.rate_limiter.slot(tokens=prompt_tokens), TokenSink(output) as sink:
+                        stats.add('queue', time.perf_counter() - queued)
+
+                        # Create streaming chat completion; returns once the
+                        # response headers are in
+                        with stats.phase('send'):
+                            stream = self.client.chat.completions.create(**params)
+
+                        # Stream tokens to console, coalescing writes
+                        for chunk in stream:
+                            if chunk.choices[0].delta.content:
+                                content = chunk.choices[0].delta.content
+                                stats.token()
+                                response_parts.append(content)
+                                sink.write(content)
+
+                            # The last chunk carries the usage counts
+                            usage = getattr(getattr(chunk, 'x_groq', None), 'usage', None)
+                            if usage is not None:
+                                completion_tokens = usage.completion_tokens
+
+                            # Check for executed tools (compound models)
+                            if hasattr(chunk.choices[0], 'message') and hasattr(chunk.choices[0].message, 'executed_tools'):
+                                executed_tools = chunk.choices[0].message.executed_tools
+
+                # Completions are billed, so only retry failures that show the
+                # request was never processed; once a token has been shown a
+                # retry would also repeat it
+                self.retry_policy.call(attempt, idempotent=False, retry_if=lambda _: not response_parts)
+
+            response_text = "".join(response_parts)
+            if cache_key and cached is None:
+                self.cache.put(cache_key, {"text": response_text, "tools_used": executed_tools})
 
             # Add to history if maintaining
             if maintain_history:
-                self.conversation_history.append({"role": "user", "content": query})
-                self.conversation_history.append({"role": "assistant", "content": response_text})
-
-                # Keep history size manageable (last 10 exchanges)
-                if len(self.conversation_history) > 20:
-                    self.conversation_history = self.conversation_history[-20:]
+                self.history.record(query, response_text)
 
             # Display tools used if compound model
             if executed_tools and "compound" in model:
                 console.print(f"\n[dim]Tools used: {', '.join(executed_tools)}[/dim]")
 
-            return {"text": response_text, "tools_used": executed_tools}
+            return {"text": response_text, "tools_used": executed_tools, "stats": stats.finish(completion_tokens)}
 
         except RateLimitError as e:
             console.print(f"\n[red]Rate limit exceeded. Please wait and try again.[/red]")
@@ -160,28 +309,32 @@ class ChatCompleter:
         messages.append({"role": "user", "content": query})
 
         try:
-            stream = self.client.chat.completions.create(
-                messages=messages,
-                model=model,
-                stream=True,
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
+            # A single Text is appended to in place and redrawn by Live's
+            # refresh timer, rather than rebuilt from the full response on
+            # every token
+            text = Text()
+
+            prompt_tokens = sum(estimate_tokens(m["content"]) for m in messages)
 
-            response_text = ""
+            def attempt() -> None:
+                with self.rate_limiter.slot(tokens=prompt_tokens):
+                    stream = self.client.chat.completions.create(
+                        messages=messages,
+                        model=model,
+                        stream=True,
+                        temperature=temperature,
+                        max_tokens=max_tokens
+                    )
 
-            # Use Rich Live for smooth updating
-            with Live(console=console, refresh_per_second=10, transient=False) as live:
-                for chunk in stream:
-                    if chunk.choices[0].delta.content:
-                        content = chunk.choices[0].delta.content
-                        response_text += content
+                    # Use Rich Live for smooth updating
+                    with Live(text, console=console, refresh_per_second=10, transient=False):
+                        for chunk in stream:
+                            if chunk.choices[0].delta.content:
+                                text.append(chunk.choices[0].delta.content)
 
-                        # Update display with accumulated text
-                        text = Text(response_text)
-                        live.update(text)
+            self.retry_policy.call(attempt, idempotent=False, retry_if=lambda _: not text.plain)
 
-            return response_text
+            return text.plain
 
         except Exception as e:
             console.print(f"\n[red]Error: {e}[/red]")
@@ -191,7 +344,8 @@ class ChatCompleter:
         self,
         model: str = "groq/compound",
         temperature: float = 0.7,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        summarize: bool = True
     ) -> None:
         """
         Start an interactive chat session.
@@ -200,61 +354,298 @@ class ChatCompleter:
             model: Model to use
             temperature: Sampling temperature
             system_prompt: Optional system prompt
+            summarize: Fold older turns into a running summary in the
+                background instead of only dropping them
         """
         console.print(f"[green]Starting interactive chat with {model}[/green]")
         console.print("[dim]Type 'exit', 'quit', or 'bye' to end the session[/dim]")
         console.print("[dim]Type 'clear' to clear conversation history[/dim]\n")
 
-        # Initialize with system prompt if provided
-        if system_prompt:
-            self.conversation_history = [{"role": "system", "content": system_prompt}]
-        else:
-            self.conversation_history = []
-
-        while True:
-            try:
-                # Get user input
-                query = console.input("[bold blue]You:[/bold blue] ")
-
-                # Check for exit commands
-                if query.lower() in ['exit', 'quit', 'bye']:
-                    console.print("[yellow]Goodbye![/yellow]")
+        # Start fresh, with the system prompt pinned if provided
+        self.history.clear(keep_system=False)
+        self.history.system_prompt = system_prompt
+        self.request_bytes.clear()
+        summarizer = RollingSummarizer(self) if summarize else None
+
+        try:
+            while True:
+                try:
+                    # Get user input
+                    query = console.input("[bold blue]You:[/bold blue] ")
+
+                    # Check for exit commands
+                    if query.lower() in ['exit', 'quit', 'bye']:
+                        console.print("[yellow]Goodbye![/yellow]")
+                        break
+
+                    # Check for clear command
+                    if query.lower() == 'clear':
+                        self.history.clear()
+                        if summarizer:
+                            summarizer.reset()
+                        console.print("[yellow]Conversation history cleared.[/yellow]\n")
+                        continue
+
+                    if not query.strip():
+                        continue
+
+                    # Swap in a finished summary; never waits for one
+                    if summarizer:
+                        summarizer.apply()
+
+                    # Display assistant header
+                    console.print("[bold green]Assistant:[/bold green] ", end="")
+
+                    # Stream the response with history
+                    response = self.stream_completion(
+                        query,
+                        model=model,
+                        temperature=temperature,
+                        maintain_history=True
+                    )
+
+                    console.print()  # New line after response
+
+                    if summarizer:
+                        summarizer.update()
+
+                except KeyboardInterrupt:
+                    console.print("\n[yellow]Chat interrupted. Goodbye![/yellow]")
                     break
+                except Exception as e:
+                    console.print(f"\n[red]Error: {e}[/red]")
+                    console.print("[yellow]Let's continue...[/yellow]\n")
+        finally:
+            if summarizer:
+                summarizer.close()
+
+        if self.request_bytes:
+            console.print(
+                f"[dim]Sent {len(self.request_bytes)} turns, "
+                f"{sum(self.request_bytes) / len(self.request_bytes) / 1024:.1f} KB per turn on average, "
+                f"{self.request_bytes[-1] / 1024:.1f} KB last[/dim]"
+            )
+
+    def clear_history(self) -> None:
+        """Clear conversation history, including the system prompt."""
+        self.history.clear(keep_system=False)
+
+    def get_history(self) -> List[Dict[str, str]]:
+        """Get current conversation history."""
+        return self.conversation_history
+
+    def set_history(self, history: List[Dict[str, str]]) -> None:
+        """Set conversation history."""
+        self.conversation_history = history
+
+
+class AsyncChatCompleter:
+    """Handles chat completions on the async client, including concurrent fan-out."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[CompletionCache] = None,
+        history_tokens: int = DEFAULT_HISTORY_TOKENS
+    ):
+        """
+        Initialize async chat completer with API credentials.
+
+        Args:
+            api_key: Groq API key (defaults to GROQ_API_KEY env var)
+            max_concurrency: Default limit on in-flight requests for gather_completions
+            rate_limiter: Limiter for this completer's requests (defaults to
+                the process-wide one)
+            retry_policy: Retry policy for requests that fail before any
+                token arrives
+            cache: Optional cache for deterministic (temperature 0) completions
+            history_tokens: Cap on history tokens sent with each request; the
+                model's context window lowers it further when smaller
+        """
+        self.api_key = api_key or os.environ.get('GROQ_API_KEY')
+        if not self.api_key:
+            raise ValueError("API key required. Set GROQ_API_KEY or pass api_key parameter.")
+
+        self.rate_limiter = rate_limiter or shared_limiter()
+        http_client = self.rate_limiter.attach(DefaultAsyncHttpxClient())
+        self.client = AsyncGroq(api_key=self.api_key, http_client=http_client, max_retries=0)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.history = ConversationHistory(max_tokens=history_tokens)
+
+    @property
+    def conversation_history(self) -> List[Dict[str, str]]:
+        """Conversation messages, with the pinned system prompt first."""
+        return self.history.messages
+
+    @conversation_history.setter
+    def conversation_history(self, messages: List[Dict[str, str]]) -> None:
+        self.history.set_messages(messages)
+
+    async def stream_completion(
+        self,
+        query: str,
+        model: str = "groq/compound",
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        system_prompt: Optional[str] = None,
+        maintain_history: bool = False,
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None,
+        echo: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Stream a chat completion response.
+
+        Args:
+            query: User query
+            model: Model to use
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            maintain_history: Whether to maintain conversation history
+            echo: Print tokens to stdout as they arrive
+
+        Returns:
+            Dictionary with the response text, tools used and request stats
+        """
+        stats = RequestStats('chat', model=model)
+        history = None
+        if maintain_history:
+            # The system prompt is pinned in the history so eviction never drops it
+            if system_prompt:
+                self.history.system_prompt = system_prompt
+            self.history.fit_request(model, query, max_tokens)
+            history, system_prompt = self.history.messages, None
+
+        params = build_chat_params(
+            query,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            history=history,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains
+        )
+
+        cache_key = self.cache.make_key(params) if self.cache and self.cache.cacheable(params) else None
+        cached = self.cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            stats.count('cache_hits')
+            stats.token()
+            if maintain_history:
+                self.history.record(query, cached["text"])
+            if echo:
+                with TokenSink() as sink:
+                    sink.write(cached["text"])
+            return {"text": cached["text"], "tools_used": cached["tools_used"], "stats": stats.finish()}
+
+        try:
+            # Collect tokens in a list and join once; repeated string
+            # concatenation copies the whole response on every token
+            response_parts = []
+            executed_tools = []
+            completion_tokens = None
+
+            prompt_tokens = sum(estimate_tokens(m["content"]) for m in params["messages"])
+
+            async def attempt() -> None:
+                nonlocal executed_tools, completion_tokens
+                stats.count('attempts')
+                with stats.phase('queue'):
+                    await self.rate_limiter.acquire_async(tokens=prompt_tokens)
+                success = False
+                try:
+                    with stats.phase('send'):
+                        stream = await self.client.chat.completions.create(**params)
+
+                    with TokenSink() if echo else contextlib.nullcontext() as sink:
+                        async for chunk in stream:
+                            if chunk.choices[0].delta.content:
+                                content = chunk.choices[0].delta.content
+                                stats.token()
+                                response_parts.append(content)
+                                if sink:
+                                    sink.write(content)
+
+                            # The last chunk carries the usage counts
+                            usage = getattr(getattr(chunk, 'x_groq', None), 'usage', None)
+                            if usage is not None:
+                                completion_tokens = usage.completion_tokens
+
+                            # Check for executed tools (compound models)
+                            if hasattr(chunk.choices[0], 'message') and hasattr(chunk.choices[0].message, 'executed_tools'):
+                                executed_tools = chunk.choices[0].message.executed_tools
+                    success = True
+                finally:
+                    self.rate_limiter.release(success)
+
+            # Completions are billed and not idempotent; once a token has been
+            # streamed a retry would also repeat it
+            await self.retry_policy.call_async(attempt, idempotent=False, retry_if=lambda _: not response_parts)
+
+            response_text = "".join(response_parts)
+            if cache_key:
+                self.cache.put(cache_key, {"text": response_text, "tools_used": executed_tools})
+
+            if maintain_history:
+                self.history.record(query, response_text)
+
+            if echo and executed_tools and "compound" in model:
+                console.print(f"\n[dim]Tools used: {', '.join(executed_tools)}[/dim]")
+
+            return {"text": response_text, "tools_used": executed_tools, "stats": stats.finish(completion_tokens)}
+
+        except RateLimitError:
+            if echo:
+                console.print("\n[red]Rate limit exceeded. Please wait and try again.[/red]")
+            raise
+        except APIError as e:
+            if echo:
+                console.print(f"\n[red]API Error: {e}[/red]")
+            raise
+
+    async def gather_completions(
+        self,
+        prompts: List[Union[str, Dict[str, Any]]],
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+        **defaults: Any
+    ) -> List[Any]:
+        """
+        Run many independent prompts concurrently.
+
+        Args:
+            prompts: Query strings, or dicts of stream_completion keyword
+                arguments (must include 'query')
+            max_concurrency: Limit on in-flight requests (defaults to the instance setting)
+            return_exceptions: Return failures in place instead of raising the first one
+            **defaults: Keyword arguments applied to every prompt
+
+        Returns:
+            Result dictionaries in the same order as prompts
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def run(prompt: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+            kwargs = {**defaults, **(prompt if isinstance(prompt, dict) else {"query": prompt})}
+            async with semaphore:
+                return await self.stream_completion(echo=False, **kwargs)
+
+        return await asyncio.gather(*(run(prompt) for prompt in prompts), return_exceptions=return_exceptions)
 
-                # Check for clear command
-                if query.lower() == 'clear':
-                    self.conversation_history = []
-                    if system_prompt:
-                        self.conversation_history = [{"role": "system", "content": system_prompt}]
-                    console.print("[yellow]Conversation history cleared.[/yellow]\n")
-                    continue
-
-                if not query.strip():
-                    continue
-
-                # Display assistant header
-                console.print("[bold green]Assistant:[/bold green] ", end="")
-
-                # Stream the response with history
-                response = self.stream_completion(
-                    query,
-                    model=model,
-                    temperature=temperature,
-                    maintain_history=True
-                )
-
-                console.print()  # New line after response
-
-            except KeyboardInterrupt:
-                console.print("\n[yellow]Chat interrupted. Goodbye![/yellow]")
-                break
-            except Exception as e:
-                console.print(f"\n[red]Error: {e}[/red]")
-                console.print("[yellow]Let's continue...[/yellow]\n")
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.client.close()
 
     def clear_history(self) -> None:
-        """Clear conversation history."""
-        self.conversation_history = []
+        """Clear conversation history, including the system prompt."""
+        self.history.clear(keep_system=False)
 
     def get_history(self) -> List[Dict[str, str]]:
         """Get current conversation history."""
@@ -0,0 +1,419 @@
+"""Background daemon that keeps warm API clients behind a Unix socket.
+
+`groq --daemon` holds one ChatCompleter and one WhisperTranscriber on a
+shared, long-lived HTTP connection pool. Later `groq` calls forward their
+request over the socket and stream the result back, skipping interpreter
+start-up of the SDK and the TLS handshake.
+
+The protocol is newline-delimited JSON: the client sends one request
+object, the daemon answers with zero or more {"token": ...} frames and
+then a single {"result": ...} or {"error": ...} frame.
+
+This module is imported on the forwarding path, so it must not import the
+groq SDK at module level.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TextIO
+
+from rich.console import Console
+
+from groq_cli.output import TokenSink
+
+console = Console()
+
+SOCKET_ENV = 'GROQ_CLI_SOCKET'
+
+# A daemon that does not accept within this long is treated as absent
+CONNECT_TIMEOUT = 0.5
+
+# httpx drops idle connections after 5 seconds by default; keep them long
+# enough to span the gaps between shell commands
+KEEPALIVE_EXPIRY = 120.0
+
+# Request fields forwarded to each engine
+CHAT_FIELDS = ('query', 'model', 'temperature', 'max_tokens', 'system_prompt')
+TRANSCRIBE_FIELDS = (
+    'file_path', 'model', 'language', 'response_format', 'include_timestamps',
+    'workers', 'preprocess', 'trim_silence'
+)
+
+
+def daemon_supported() -> bool:
+    """Whether this platform has Unix domain sockets."""
+    return hasattr(socket, 'AF_UNIX')
+
+
+def _uid() -> Optional[int]:
+    # os.getuid is POSIX-only
+    getuid = getattr(os, 'getuid', None)
+    return getuid() if getuid else None
+
+
+def default_socket_path(create: bool = False) -> Path:
+    """
+    Socket path shared by the daemon and its clients.
+
+    Uses GROQ_CLI_SOCKET if set, then $XDG_RUNTIME_DIR, then a per-user
+    0700 directory in the system temp directory.
+
+    Args:
+        create: Create the per-user directory if it is used (for the daemon)
+
+    Raises:
+        ValueError: If the per-user directory exists but is not private to
+            the current user
+    """
+    if os.environ.get(SOCKET_ENV):
+        return Path(os.environ[SOCKET_ENV])
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return Path(runtime_dir) / 'groq-cli.sock'
+    uid = _uid()
+    private_dir = Path(tempfile.gettempdir()) / (f"groq-cli-{uid}" if uid is not None else "groq-cli")
+    if create:
+        _make_private_dir(private_dir)
+    return private_dir / 'daemon.sock'
+
+
+def _make_private_dir(directory: Path) -> None:
+    directory.mkdir(mode=0o700, exist_ok=True)
+    info = os.lstat(directory)
+    uid = _uid()
+    if not stat.S_ISDIR(info.st_mode) or (uid is not None and (info.st_uid != uid or info.st_mode & 0o077)):
+        raise ValueError(f"{directory} is not a private directory owned by the current user")
+
+
+def _owned_socket(socket_path: Path) -> bool:
+    """Whether socket_path is a socket only the current user can reach."""
+    try:
+        info = os.lstat(socket_path)
+    except OSError:
+        return False
+    if not stat.S_ISSOCK(info.st_mode):
+        return False
+    uid = _uid()
+    # Anyone else could be listening on a socket they created or can write to
+    return uid is None or (info.st_uid == uid and not info.st_mode & 0o077)
+
+
+def key_fingerprint(api_key: str) -> str:
+    """Short hash of an API key, so requests can be matched without sending it."""
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+
+
+def _connect(socket_path: Path) -> Optional[socket.socket]:
+    if not daemon_supported() or not _owned_socket(socket_path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        # Stale socket file left by a daemon that is no longer running
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def forward_request(
+    request: Dict[str, Any],
+    api_key: str,
+    socket_path: Optional[Path] = None,
+    on_token: Optional[Callable[[str], None]] = None
+) -> Optional[Any]:
+    """
+    Send a request to a running daemon and wait for its result.
+
+    Args:
+        request: Request object with an 'op' field
+        api_key: API key the caller would use; the daemon only serves
+            callers with the same key
+        socket_path: Daemon socket (defaults to default_socket_path())
+        on_token: Called with each streamed token
+
+    Returns:
+        The daemon's result, or None if no daemon took the request and the
+        caller should handle it locally
+
+    Raises:
+        RuntimeError: If the daemon failed after accepting the request
+    """
+    if not daemon_supported():
+        return None
+    try:
+        sock = _connect(socket_path or default_socket_path())
+    except Exception:
+        # Whatever stops us reaching a daemon, the caller can still run locally
+        return None
+    if sock is None:
+        return None
+
+    with sock, sock.makefile('rb') as reader:
+        try:
+            sock.sendall(json.dumps({**request, 'key': key_fingerprint(api_key)}).encode('utf-8') + b"\n")
+        except OSError:
+            return None
+
+        accepted = False
+        for line in reader:
+            frame = json.loads(line)
+            if 'token' in frame:
+                accepted = True
+                if on_token:
+                    on_token(frame['token'])
+            elif 'result' in frame:
+                return frame['result']
+            elif frame.get('fallback'):
+                return None
+            else:
+                raise RuntimeError(f"Daemon: {frame.get('error', 'unknown error')}")
+
+    if not accepted:
+        return None
+    raise RuntimeError("Daemon closed the connection mid-response")
+
+
+def forward_chat(
+    api_key: str,
+    output: Optional[TextIO] = None,
+    socket_path: Optional[Path] = None,
+    **params: Any
+) -> Optional[Dict[str, Any]]:
+    """
+    Run a chat completion on the daemon, streaming tokens to output.
+
+    Args:
+        api_key: API key the caller would use
+        output: Text stream for the tokens (defaults to stdout)
+        socket_path: Daemon socket (defaults to default_socket_path())
+        **params: stream_completion arguments (see CHAT_FIELDS)
+
+    Returns:
+        Dictionary with the response text and tools used, or None if no
+        daemon is available
+    """
+    with TokenSink(output) as sink:
+        return forward_request({'op': 'chat', 'params': params}, api_key, socket_path, on_token=sink.write)
+
+
+def forward_transcription(
+    api_key: str,
+    socket_path: Optional[Path] = None,
+    output: Optional[Path] = None,
+    format: str = 'text',
+    tier: str = 'free',
+    **params: Any
+) -> Optional[Dict[str, Any]]:
+    """
+    Transcribe a file on the daemon.
+
+    Args:
+        api_key: API key the caller would use
+        socket_path: Daemon socket (defaults to default_socket_path())
+        output: File the daemon should save the transcript to
+        format: Output format for the saved file
+        tier: Account tier the caller would use; a daemon started on
+            another tier leaves the request to the caller
+        **params: transcribe arguments (see TRANSCRIBE_FIELDS)
+
+    Returns:
+        Dictionary with the 'transcript' and the 'saved_to' path, or None
+        if no daemon is available
+    """
+    params['file_path'] = str(Path(params['file_path']).resolve())
+    request = {
+        'op': 'transcribe',
+        'params': params,
+        'tier': tier,
+        'output': str(Path(output).resolve()) if output else None,
+        'format': format
+    }
+    return forward_request(request, api_key, socket_path)
+
+
+class _TokenFrames:
+    """Text stream that sends each write as a token frame."""
+
+    def __init__(self, send: Callable[[Dict[str, Any]], None]):
+        self._send = send
+
+    def write(self, text: str) -> None:
+        self._send({'token': text})
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        # Coalesce on the display-frame timer rather than in large blocks,
+        # so the client still sees tokens as they arrive
+        return True
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+
+    def send(self, frame: Dict[str, Any]) -> None:
+        with self.send_lock:
+            self.wfile.write(json.dumps(frame, ensure_ascii=False, default=str).encode('utf-8') + b"\n")
+            self.wfile.flush()
+
+    def handle(self) -> None:
+        self.send_lock = threading.Lock()
+        line = self.rfile.readline()
+        if not line:
+            # Liveness probe from another daemon starting up
+            return
+        try:
+            request = json.loads(line)
+        except ValueError:
+            self.send({'error': 'invalid request', 'fallback': True})
+            return
+
+        if request.get('key') != self.server.key:
+            self.send({'error': 'API key does not match the daemon', 'fallback': True})
+            return
+
+        try:
+            op = request.get('op')
+            if op == 'ping':
+                self.send({'result': {'pid': os.getpid()}})
+            elif op == 'chat':
+                self.send({'result': self.server.run_chat(request['params'], _TokenFrames(self.send))})
+            elif op == 'transcribe':
+                if request.get('tier', self.server.tier) != self.server.tier:
+                    # Size limits, and so chunking, depend on the tier
+                    self.send({'error': 'daemon runs on a different tier', 'fallback': True})
+                else:
+                    self.send({'result': self.server.run_transcription(request)})
+            else:
+                self.send({'error': f"unsupported operation: {op}", 'fallback': True})
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away mid-response
+            pass
+        except Exception as e:
+            try:
+                self.send({'error': str(e)})
+            except OSError:
+                pass
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server around warm chat and transcription engines."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, api_key: str, chat: Any, transcriber: Any):
+        """
+        Bind the socket and take ownership of the engines.
+
+        Args:
+            socket_path: Path to bind; a stale socket file is replaced
+            api_key: API key the engines use; only matching callers are served
+            chat: ChatCompleter for 'chat' requests
+            transcriber: WhisperTranscriber for 'transcribe' requests
+
+        Raises:
+            ValueError: If Unix sockets are unsupported or another daemon
+                is already listening on socket_path
+        """
+        if not daemon_supported():
+            raise ValueError("Daemon mode needs Unix domain sockets, which this platform lacks")
+
+        socket_path = Path(socket_path)
+        if socket_path.exists():
+            existing = _connect(socket_path)
+            if existing is not None:
+                existing.close()
+                raise ValueError(f"A daemon is already listening on {socket_path}")
+            socket_path.unlink()
+
+        self.socket_path = socket_path
+        self.key = key_fingerprint(api_key)
+        self.chat = chat
+        self.transcriber = transcriber
+        self.tier = getattr(transcriber, 'tier', 'free')
+
+        # Only the owner may connect; the daemon spends their API key
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def run_chat(self, params: Dict[str, Any], output: TextIO) -> Dict[str, Any]:
+        kwargs = {field: params[field] for field in CHAT_FIELDS if field in params}
+        return self.chat.stream_completion(maintain_history=False, output=output, **kwargs)
+
+    def run_transcription(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        params = request['params']
+        kwargs = {field: params[field] for field in TRANSCRIBE_FIELDS if field in params}
+        kwargs['file_path'] = Path(kwargs['file_path'])
+        transcript = self.transcriber.transcribe(quiet=True, **kwargs)
+
+        saved_to = None
+        if request.get('output'):
+            data = {'text': transcript} if isinstance(transcript, str) else transcript
+            saved_to = str(self.transcriber.save_transcript(data, Path(request['output']), format=request.get('format', 'text')))
+        return {'transcript': transcript, 'saved_to': saved_to}
+
+    def warm(self) -> None:
+        """Open a connection to the API ahead of the first request."""
+        try:
+            self.chat.client.models.list()
+        except Exception as e:
+            console.print(f"[dim]Could not pre-open API connection: {e}[/dim]")
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def create_daemon(
+    api_key: str,
+    socket_path: Optional[Path] = None,
+    tier: str = 'free',
+    cache: Optional[Any] = None,
+    index: Optional[Any] = None
+) -> DaemonServer:
+    """
+    Build a daemon whose engines share one long-lived connection pool.
+
+    Args:
+        api_key: Groq API key
+        socket_path: Path to bind (defaults to default_socket_path())
+        tier: Account tier for transcription size limits
+        cache: Optional TranscriptionCache
+        index: Optional TranscriptIndex fed with each transcript
+
+    Returns:
+        Bound DaemonServer, ready for serve_forever()
+    """
+    import httpx
+    from groq import DefaultHttpxClient
+    from groq_cli.chat import ChatCompleter
+    from groq_cli.manifest import default_jobs_dir
+    from groq_cli.transcriber import WhisperTranscriber
+
+    http_client = DefaultHttpxClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=KEEPALIVE_EXPIRY)
+    )
+    return DaemonServer(
+        socket_path or default_socket_path(create=True),
+        api_key,
+        chat=ChatCompleter(api_key=api_key, http_client=http_client),
+        transcriber=WhisperTranscriber(
+            api_key=api_key, tier=tier, cache=cache, http_client=http_client, index=index, jobs_dir=default_jobs_dir()
+        )
+    )
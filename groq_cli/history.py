@@ -0,0 +1,187 @@
+"""Token-budgeted conversation history for chat sessions."""
+
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+# Context windows of the chat models we list; unknown models get the
+# smallest so a guess never overflows
+MODEL_CONTEXT_TOKENS = {
+    'groq/compound': 131072,
+    'groq/compound-mini': 131072,
+    'llama-3.3-70b-versatile': 131072,
+    'llama-3.1-8b-instant': 131072,
+    'llama-4-scout': 131072,
+    'mixtral-8x7b-32768': 32768,
+    'gemma2-9b-it': 8192,
+}
+DEFAULT_CONTEXT_TOKENS = 8192
+
+# Cap on history sent with each request (--history-tokens). Each request
+# uses the smaller of this and what the model's context window leaves, so
+# the per-model budget only binds for small-context models; long sessions
+# otherwise re-upload their whole transcript every turn
+DEFAULT_HISTORY_TOKENS = 4000
+
+# Rough English average; errs high for code and non-Latin text, which
+# keeps the estimate on the safe side of the real count
+CHARS_PER_TOKEN = 4
+
+# Role markers and separators the chat template adds per message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Marks the system message that carries a running summary of older turns
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of a message without a tokenizer.
+
+    Args:
+        text: Message content
+
+    Returns:
+        Estimated tokens, including per-message overhead
+    """
+    return -(-len(text) // CHARS_PER_TOKEN) + MESSAGE_OVERHEAD_TOKENS
+
+
+def context_tokens(model: str) -> int:
+    """Context window of a model, in tokens."""
+    return MODEL_CONTEXT_TOKENS.get(model, DEFAULT_CONTEXT_TOKENS)
+
+
+class ConversationHistory:
+    """
+    Conversation messages trimmed oldest-first against a token budget.
+
+    The system prompt, and a running summary of older turns if one has
+    been set, are held separately and never evicted. Token estimates are
+    computed once per message and kept as a running total, so trimming is
+    proportional to the number of messages removed.
+    """
+
+    def __init__(self, max_tokens: int = DEFAULT_HISTORY_TOKENS):
+        """
+        Initialize an empty history.
+
+        Args:
+            max_tokens: Upper bound on history tokens sent with a request
+        """
+        self.max_tokens = max_tokens
+        self.system_prompt: Optional[str] = None
+        self.summary: Optional[str] = None
+        self._messages: Deque[Dict[str, str]] = deque()
+        self._tokens: Deque[int] = deque()
+        self.total_tokens = 0
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    @property
+    def messages(self) -> List[Dict[str, str]]:
+        """All messages, with the pinned system prompt and summary first."""
+        pinned = [
+            {"role": "system", "content": content}
+            for content in (self.system_prompt, self.summary) if content
+        ]
+        return pinned + list(self._messages)
+
+    @property
+    def system_tokens(self) -> int:
+        return sum(estimate_tokens(content) for content in (self.system_prompt, self.summary) if content)
+
+    def append(self, role: str, content: str) -> None:
+        """
+        Add a message; system messages replace the pinned prompt or summary.
+
+        Args:
+            role: Message role
+            content: Message content
+        """
+        if role == "system":
+            if content.startswith(SUMMARY_PREFIX):
+                self.summary = content
+            else:
+                self.system_prompt = content
+            return
+        tokens = estimate_tokens(content)
+        self._messages.append({"role": role, "content": content})
+        self._tokens.append(tokens)
+        self.total_tokens += tokens
+
+    def record(self, query: str, response: str) -> None:
+        """
+        Add a completed exchange.
+
+        Trimming waits for the next request, so a summarizer still sees the
+        exchange before it is evicted.
+
+        Args:
+            query: User message
+            response: Assistant reply
+        """
+        self.append("user", query)
+        self.append("assistant", response)
+
+    def set_messages(self, messages: List[Dict[str, str]]) -> None:
+        """Replace the history; system messages become the pinned prompt."""
+        self.clear(keep_system=False)
+        for message in messages:
+            self.append(message["role"], message["content"])
+
+    def clear(self, keep_system: bool = True) -> None:
+        """
+        Remove all messages.
+
+        Args:
+            keep_system: Keep the pinned system prompt
+        """
+        self._messages.clear()
+        self._tokens.clear()
+        self.total_tokens = 0
+        self.summary = None
+        if not keep_system:
+            self.system_prompt = None
+
+    def trim(self, budget: int) -> int:
+        """
+        Evict the oldest messages until the history fits a token budget.
+
+        Messages go in user/assistant pairs where possible, so the history
+        never starts with a dangling assistant reply. The pinned system
+        prompt and summary count against the budget but are never removed.
+
+        Args:
+            budget: Tokens available for the system prompt and history
+
+        Returns:
+            Number of messages evicted
+        """
+        budget = min(budget, self.max_tokens) - self.system_tokens
+        evicted = 0
+        while self._messages and self.total_tokens > budget:
+            self._pop_oldest()
+            evicted += 1
+        while self._messages and self._messages[0]["role"] == "assistant":
+            self._pop_oldest()
+            evicted += 1
+        return evicted
+
+    def fit_request(self, model: str, query: str, max_tokens: int) -> int:
+        """
+        Trim so that history, query and response fit the model's context.
+
+        Args:
+            model: Model the request goes to
+            query: New user message
+            max_tokens: Tokens reserved for the response
+
+        Returns:
+            Number of messages evicted
+        """
+        return self.trim(context_tokens(model) - max_tokens - estimate_tokens(query))
+
+    def _pop_oldest(self) -> None:
+        self._messages.popleft()
+        self.total_tokens -= self._tokens.popleft()
@@ -0,0 +1,187 @@
+"""Full-text and time-range index over finished transcripts."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from groq_cli.cache import default_cache_dir
+
+# Hits returned by a search unless a limit is given
+DEFAULT_SEARCH_LIMIT = 20
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS sources ("
+    "id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, indexed REAL NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS segments ("
+    "id INTEGER PRIMARY KEY, source_id INTEGER NOT NULL, start_ms INTEGER NOT NULL, "
+    "end_ms INTEGER NOT NULL, text TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS segments_time ON segments (source_id, start_ms)",
+    # External-content FTS table: the text is stored once, in segments
+    "CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5("
+    "text, content='segments', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS segments_ai AFTER INSERT ON segments BEGIN "
+    "INSERT INTO segments_fts (rowid, text) VALUES (new.id, new.text); END",
+    "CREATE TRIGGER IF NOT EXISTS segments_ad AFTER DELETE ON segments BEGIN "
+    "INSERT INTO segments_fts (segments_fts, rowid, text) VALUES ('delete', old.id, old.text); END",
+)
+
+
+def default_index_path() -> Path:
+    """Get the per-user path of the transcript index database."""
+    return default_cache_dir().parent / 'index.sqlite3'
+
+
+def _millis(seconds: Any) -> int:
+    return max(0, int(float(seconds or 0) * 1000 + 0.5))
+
+
+def transcript_rows(transcript_data: Union[str, Mapping[str, Any]]) -> List[Tuple[int, int, str]]:
+    """
+    Extract (start_ms, end_ms, text) rows from a transcription result.
+
+    Args:
+        transcript_data: verbose_json dict or Transcript, or plain text
+
+    Returns:
+        One row per non-empty segment; results without segments give a
+        single row spanning the whole recording
+    """
+    if isinstance(transcript_data, str):
+        transcript_data = {'text': transcript_data}
+
+    rows = []
+    for segment in transcript_data.get('segments') or []:
+        text = segment.get('text', '').strip()
+        if text:
+            rows.append((_millis(segment.get('start')), _millis(segment.get('end')), text))
+    if not rows and transcript_data.get('text', '').strip():
+        rows.append((0, _millis(transcript_data.get('duration')), transcript_data['text'].strip()))
+    return rows
+
+
+class TranscriptIndex:
+    """
+    sqlite FTS5 index of transcript segments with their times and source file.
+
+    Re-indexing a file replaces its earlier rows. Safe to share between
+    the worker threads of a batch job.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Open (or create) the index.
+
+        Args:
+            path: sqlite database file (defaults to the user cache dir)
+
+        Raises:
+            ValueError: If this Python's sqlite was built without FTS5
+        """
+        self.path = Path(path) if path else default_index_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        try:
+            for statement in _SCHEMA:
+                self._db.execute(statement)
+        except sqlite3.OperationalError as e:
+            self._db.close()
+            if 'fts5' in str(e):
+                raise ValueError("Transcript search needs SQLite with FTS5 support") from e
+            raise
+
+    def add(self, source: Union[str, Path], transcript_data: Union[str, Mapping[str, Any]]) -> int:
+        """
+        Index a transcript, replacing any earlier one for the same file.
+
+        Args:
+            source: Audio file the transcript came from
+            transcript_data: Transcription result (verbose_json, Transcript or text)
+
+        Returns:
+            Number of segments indexed
+        """
+        rows = transcript_rows(transcript_data)
+        source = str(Path(source).resolve())
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.execute(
+                    "INSERT INTO sources (path, indexed) VALUES (?, ?) "
+                    "ON CONFLICT (path) DO UPDATE SET indexed = excluded.indexed",
+                    (source, time.time())
+                )
+                source_id = self._db.execute("SELECT id FROM sources WHERE path = ?", (source,)).fetchone()[0]
+                self._db.execute("DELETE FROM segments WHERE source_id = ?", (source_id,))
+                self._db.executemany(
+                    "INSERT INTO segments (source_id, start_ms, end_ms, text) VALUES (?, ?, ?, ?)",
+                    [(source_id, *row) for row in rows]
+                )
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+        return len(rows)
+
+    def remove(self, source: Union[str, Path]) -> None:
+        """Drop a file's transcript from the index."""
+        source = str(Path(source).resolve())
+        with self._lock:
+            self._db.execute("DELETE FROM segments WHERE source_id IN (SELECT id FROM sources WHERE path = ?)", (source,))
+            self._db.execute("DELETE FROM sources WHERE path = ?", (source,))
+
+    def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        source: Optional[Union[str, Path]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find segments matching a query, best matches first.
+
+        Args:
+            query: FTS5 query ("exact phrase", OR, prefix*); text that is
+                not valid query syntax is searched for as a phrase
+            limit: Maximum number of hits
+            source: Only search this file's transcript
+            start: Only segments ending after this time (seconds)
+            end: Only segments starting before this time (seconds)
+
+        Returns:
+            Hits with 'file', 'start_ms', 'end_ms' and 'text'
+        """
+        sql = (
+            "SELECT sources.path, segments.start_ms, segments.end_ms, segments.text "
+            "FROM segments_fts JOIN segments ON segments.id = segments_fts.rowid "
+            "JOIN sources ON sources.id = segments.source_id WHERE segments_fts MATCH ?"
+        )
+        params: List[Any] = []
+        if source is not None:
+            sql += " AND sources.path = ?"
+            params.append(str(Path(source).resolve()))
+        if start is not None:
+            sql += " AND segments.end_ms > ?"
+            params.append(_millis(start))
+        if end is not None:
+            sql += " AND segments.start_ms < ?"
+            params.append(_millis(end))
+        sql += " ORDER BY rank, segments.start_ms LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            try:
+                rows = self._db.execute(sql, [query, *params]).fetchall()
+            except sqlite3.OperationalError:
+                phrase = '"' + query.replace('"', '""') + '"'
+                rows = self._db.execute(sql, [phrase, *params]).fetchall()
+        return [{'file': path, 'start_ms': start_ms, 'end_ms': end_ms, 'text': text} for path, start_ms, end_ms, text in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
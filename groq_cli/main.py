@@ -3,14 +3,20 @@
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 from rich.console import Console
 from dotenv import load_dotenv
 
-from groq_cli.transcriber import WhisperTranscriber
-from groq_cli.chat import ChatCompleter
+from groq_cli.history import DEFAULT_HISTORY_TOKENS
+from groq_cli.utils import DEFAULT_WORKERS
+
+# The engines pull in the groq SDK (httpx, pydantic) and heavier rich
+# modules, so each handler imports only what its mode needs
+if TYPE_CHECKING:
+    from groq_cli.cache import CompletionCache, TranscriptionCache
+    from groq_cli.index import TranscriptIndex
 
 # Load environment variables
 load_dotenv()
@@ -18,11 +24,20 @@ load_dotenv()
 console = Console()
 
 
+class ResumableInterrupt(KeyboardInterrupt):
+    """Ctrl-C during a checkpointed chunked or batch job, which a re-run resumes."""
+
+
 @click.command()
 @click.argument('text', required=False, type=str)
 @click.option('-q', '--query', type=str, help='Query for chat completion')
 @click.option('-t', '--transcribe', is_flag=True, help='Switch to Whisper transcription mode')
 @click.option('-f', '--file', type=click.Path(exists=True, path_type=Path), help='Audio file for transcription')
+@click.option('--batch', 'batch', type=str, help='Directory or glob of audio files to transcribe (with -t)')
+@click.option('--watch', type=click.Path(exists=True, file_okay=False, path_type=Path), help='Keep transcribing audio files as they arrive in this directory (with -t)')
+@click.option('--watch-poll', is_flag=True, help='With --watch, rescan periodically instead of using inotify (for network mounts)')
+@click.option('--batch-in', type=click.Path(exists=True, dir_okay=False, path_type=Path), help='JSONL file of prompts to run concurrently')
+@click.option('--batch-out', type=click.Path(dir_okay=False, path_type=Path), help='JSONL file for batch results (default: <batch-in>.results.jsonl)')
 @click.option('-m', '--model', default='groq/compound', help='Model for chat (default: groq/compound - with web search and tools)')
 @click.option('--whisper-model', default='whisper-large-v3-turbo', help='Whisper model (default: whisper-large-v3-turbo)')
 @click.option('--api-key', envvar='GROQ_API_KEY', help='Groq API key (or set GROQ_API_KEY env var)')
@@ -33,11 +48,32 @@ console = Console()
 @click.option('--max-tokens', type=int, default=2000, help='Maximum tokens for chat response')
 @click.option('--system', help='System prompt for chat')
 @click.option('--tier', type=click.Choice(['free', 'developer']), default='free', help='Account tier for file size limits')
+@click.option('--no-cache', is_flag=True, help='Always re-upload audio instead of reusing cached transcripts')
+@click.option('--cache-dir', type=click.Path(file_okay=False, path_type=Path), help='Directory for the transcription cache')
+@click.option('--no-index', is_flag=True, help='Do not add finished transcripts to the local search index')
+@click.option('--search', type=str, help='Search indexed transcripts (FTS5 syntax: "exact phrase", OR, prefix*); -f limits it to one file')
+@click.option('--chat-cache', is_flag=True, help='Reuse stored answers for repeated temperature-0 chat and --batch-in prompts')
+@click.option('--preprocess/--no-preprocess', default=None, help='Re-encode to 16 kHz mono before upload (default: WAV/FLAC only)')
+@click.option('--trim-silence', is_flag=True, help='Cut long silences before upload (timestamps still match the source)')
+@click.option('--no-resume', is_flag=True, help='Start interrupted chunked or batch transcriptions over instead of resuming them')
+@click.option('--hedge', is_flag=True, help='Re-send transcription requests that run past the usual p95 latency')
+@click.option('--workers', type=click.IntRange(min=1), default=DEFAULT_WORKERS, help='Concurrent requests for chunked, batch and --batch-in jobs')
+@click.option('--stats', 'show_stats', is_flag=True, help='Print per-phase request timings (queue, send, TTFT, upload, server, ...)')
+@click.option('--metrics-log', type=click.Path(dir_okay=False, path_type=Path), help='Append request timings to this JSONL file')
+@click.option('--no-summary', is_flag=True, help='In interactive chat, drop old turns instead of summarising them')
+@click.option('--history-tokens', type=click.IntRange(min=0), default=DEFAULT_HISTORY_TOKENS, show_default=True, help='In interactive chat, cap on history tokens sent per request (lowered further for small-context models)')
+@click.option('--daemon', 'run_daemon', is_flag=True, help='Run a background server that keeps a warm client for later calls')
+@click.option('--no-daemon', is_flag=True, help='Do not forward to a running daemon')
 def cli(
     text: Optional[str],
     query: Optional[str],
     transcribe: bool,
     file: Optional[Path],
+    batch: Optional[str],
+    watch: Optional[Path],
+    watch_poll: bool,
+    batch_in: Optional[Path],
+    batch_out: Optional[Path],
     model: str,
     whisper_model: str,
     api_key: str,
@@ -47,7 +83,23 @@ def cli(
     temperature: float,
     max_tokens: int,
     system: Optional[str],
-    tier: str
+    tier: str,
+    no_cache: bool,
+    cache_dir: Optional[Path],
+    no_index: bool,
+    search: Optional[str],
+    chat_cache: bool,
+    preprocess: Optional[bool],
+    trim_silence: bool,
+    no_resume: bool,
+    hedge: bool,
+    workers: int,
+    show_stats: bool,
+    metrics_log: Optional[Path],
+    no_summary: bool,
+    history_tokens: int,
+    run_daemon: bool,
+    no_daemon: bool
 ):
     """
     Groq CLI tool for chat completions and Whisper transcription.
@@ -63,9 +115,21 @@ def cli(
         # Transcription:
         groq -t -f audio.mp3
 
+        # Batch transcription of a directory or glob:
+        groq -t --batch recordings/ --format srt
+
+        # Transcribe recordings as they are dropped into a folder:
+        groq -t --watch /srv/recordings --format srt
+
+        # Where was something said in earlier transcripts:
+        groq --search "quarterly results"
+
         # Interactive chat:
         groq
 
+        # Batch prompts (resumable, results in input order):
+        groq --batch-in prompts.jsonl --batch-out results.jsonl
+
         # Advanced transcription:
         groq -t -f audio.wav --whisper-model whisper-large-v3 --format srt --output subtitles.srt
 
@@ -74,14 +138,17 @@ def cli(
 
         # Use compound model for research:
         groq "What's the latest news about AI?" -m groq/compound
+
+        # Keep a warm client running; later calls forward to it:
+        groq --daemon
     """
 
     # If positional text argument is provided, use it as query
     if text and not query:
         query = text
 
-    # Check for API key
-    if not api_key:
+    # Check for API key (searching is local and needs none)
+    if not api_key and not search:
         console.print("[red]Error: GROQ_API_KEY not found.[/red]")
         console.print("[yellow]Set it with:[/yellow]")
         console.print("  [dim]Windows:[/dim] set GROQ_API_KEY=your_api_key_here")
@@ -89,7 +156,57 @@ def cli(
         sys.exit(1)
 
     try:
-        if transcribe:
+        if search:
+            # Transcript search mode
+            handle_search(search, file=file)
+
+        elif run_daemon:
+            # Daemon mode
+            handle_daemon(
+                api_key=api_key,
+                tier=tier,
+                cache=build_cache(no_cache, cache_dir),
+                index=build_index(no_index)
+            )
+
+        elif transcribe and watch:
+            # Watch-folder mode
+            handle_watch(
+                directory=watch,
+                api_key=api_key,
+                model=whisper_model,
+                format=format,
+                language=language,
+                tier=tier,
+                workers=workers,
+                cache=build_cache(no_cache, cache_dir),
+                index=build_index(no_index),
+                preprocess=preprocess,
+                trim_silence=trim_silence,
+                hedge=hedge,
+                poll=watch_poll,
+                metrics_log=metrics_log
+            )
+
+        elif transcribe and batch:
+            # Batch transcription mode
+            handle_batch_transcription(
+                pattern=batch,
+                api_key=api_key,
+                model=whisper_model,
+                format=format,
+                language=language,
+                tier=tier,
+                workers=workers,
+                cache=build_cache(no_cache, cache_dir),
+                index=build_index(no_index),
+                preprocess=preprocess,
+                trim_silence=trim_silence,
+                resume=not no_resume,
+                hedge=hedge
+            )
+
+        elif transcribe:
             # Transcription mode
             handle_transcription(
                 file=file,
@@ -98,7 +215,32 @@ def cli(
                 output=output,
                 format=format,
                 language=language,
-                tier=tier
+                tier=tier,
+                workers=workers,
+                cache=build_cache(no_cache, cache_dir),
+                index=build_index(no_index),
+                preprocess=preprocess,
+                trim_silence=trim_silence,
+                resume=not no_resume,
+                hedge=hedge,
+                show_stats=show_stats,
+                metrics_log=metrics_log,
+                # The daemon has its own cache, index, checkpoint and hedging settings
+                use_daemon=not (no_daemon or no_cache or cache_dir or no_index or no_resume or hedge)
+            )
+
+        elif batch_in:
+            # Batch prompt mode
+            handle_prompt_batch(
+                batch_in=batch_in,
+                batch_out=batch_out,
+                api_key=api_key,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system_prompt=system,
+                workers=workers,
+                cache=build_completion_cache(chat_cache)
             )
 
         elif query:
@@ -109,7 +251,11 @@ def cli(
                 model=model,
                 temperature=temperature,
                 max_tokens=max_tokens,
-                system_prompt=system
+                system_prompt=system,
+                cache=build_completion_cache(chat_cache),
+                show_stats=show_stats,
+                metrics_log=metrics_log,
+                use_daemon=not (no_daemon or chat_cache)
             )
 
         else:
@@ -118,17 +264,63 @@ def cli(
                 api_key=api_key,
                 model=model,
                 temperature=temperature,
-                system_prompt=system
+                system_prompt=system,
+                summarize=not no_summary,
+                history_tokens=history_tokens
             )
 
-    except KeyboardInterrupt:
+    except KeyboardInterrupt as e:
         console.print("\n[yellow]Operation cancelled.[/yellow]")
+        if isinstance(e, ResumableInterrupt):
+            console.print("[dim]Finished chunks and files are checkpointed; run the same command again to resume.[/dim]")
         sys.exit(0)
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         sys.exit(1)
 
 
+def build_cache(no_cache: bool, cache_dir: Optional[Path]) -> Optional["TranscriptionCache"]:
+    """Create the transcription cache unless disabled."""
+    if no_cache:
+        return None
+    from groq_cli.cache import TranscriptionCache
+    return TranscriptionCache(cache_dir)
+
+
+def build_index(no_index: bool) -> Optional["TranscriptIndex"]:
+    """Open the transcript search index unless disabled."""
+    if no_index:
+        return None
+    import sqlite3
+    from groq_cli.index import TranscriptIndex
+    try:
+        return TranscriptIndex()
+    except (ValueError, sqlite3.Error) as e:
+        # Transcription never needs the index, so a broken one only disables it
+        console.print(f"[yellow]Transcript index unavailable ({e}); transcripts will not be indexed[/yellow]")
+        return None
+
+
+def build_completion_cache(enabled: bool) -> Optional["CompletionCache"]:
+    """Create the chat completion cache if requested."""
+    if not enabled:
+        return None
+    from groq_cli.cache import CompletionCache
+    return CompletionCache()
+
+
+def report_stats(stats: Optional[dict], show_stats: bool, metrics_log: Optional[Path]) -> None:
+    """Print request stats and/or append them to the metrics log."""
+    if stats is None or not (show_stats or metrics_log):
+        return
+    from groq_cli.stats import append_metrics, print_stats
+    if show_stats:
+        console.print()
+        print_stats(stats, console)
+    if metrics_log:
+        append_metrics(metrics_log, stats)
+
+
 def handle_transcription(
     file: Optional[Path],
     api_key: str,
@@ -136,7 +328,17 @@ def handle_transcription(
     output: Optional[str],
     format: str,
     language: Optional[str],
-    tier: str
+    tier: str,
+    workers: int = DEFAULT_WORKERS,
+    cache: Optional["TranscriptionCache"] = None,
+    index: Optional["TranscriptIndex"] = None,
+    preprocess: Optional[bool] = None,
+    trim_silence: bool = False,
+    resume: bool = True,
+    hedge: bool = False,
+    show_stats: bool = False,
+    metrics_log: Optional[Path] = None,
+    use_daemon: bool = False
 ) -> None:
     """Handle transcription mode."""
     if not file:
@@ -144,23 +346,52 @@ def handle_transcription(
         console.print("[yellow]Usage: groq -t -f audio.mp3[/yellow]")
         sys.exit(1)
 
-    # Initialize transcriber
-    transcriber = WhisperTranscriber(api_key=api_key, tier=tier)
-
     # Perform transcription
     console.print(f"[blue]Processing: {file.name}[/blue]")
     console.print(f"[dim]Model: {model}[/dim]")
     if language:
         console.print(f"[dim]Language: {language}[/dim]")
 
-    result = transcriber.transcribe(
+    if output or format != 'text':
+        # Generate default output filename
+        output = Path(output) if output else file.with_suffix(f'.{format if format != "text" else "txt"}')
+
+    params = dict(
         file_path=file,
         model=model,
         language=language,
-        response_format="verbose_json" if format in ['srt', 'vtt', 'json'] else "text",
-        include_timestamps=(format in ['srt', 'vtt', 'json'])
+        # Segment times are needed to index where things were said
+        response_format="verbose_json" if format in ['srt', 'vtt', 'json'] or index is not None else "text",
+        include_timestamps=(format in ['srt', 'vtt', 'json']),
+        workers=workers,
+        preprocess=preprocess,
+        trim_silence=trim_silence
     )
 
+    forwarded = None
+    if use_daemon:
+        from groq_cli.daemon import forward_transcription
+        with console.status("[blue]Transcribing on daemon...[/blue]"):
+            forwarded = forward_transcription(api_key, output=output, format=format, tier=tier, **params)
+
+    transcriber = None
+    if forwarded is not None:
+        result = forwarded['transcript']
+    else:
+        from groq_cli.manifest import default_jobs_dir
+        from groq_cli.transcriber import WhisperTranscriber
+        transcriber = WhisperTranscriber(
+            api_key=api_key, tier=tier, cache=cache, hedge=hedge, index=index,
+            jobs_dir=default_jobs_dir(), resume=resume
+        )
+        try:
+            result = transcriber.transcribe(**params)
+        except KeyboardInterrupt:
+            # Only chunked files with resume on leave a manifest behind
+            if transcriber.last_checkpointed:
+                raise ResumableInterrupt() from None
+            raise
+
     # Display transcript
     console.print("\n[green]Transcription:[/green]")
     console.print("-" * 50)
@@ -170,6 +401,8 @@ def handle_transcription(
         transcript_text = result
         # Convert to dict format for consistency
         result = {'text': transcript_text}
+        if transcriber is not None:
+            result['stats'] = transcriber.last_stats
     else:
         transcript_text = result.get('text', '')
 
@@ -184,14 +417,11 @@ def handle_transcription(
     console.print("-" * 50)
 
     # Save to file if requested
-    if output or format != 'text':
-        if not output:
-            # Generate default output filename
-            output = file.with_suffix(f'.{format if format != "text" else "txt"}')
+    if output:
+        if transcriber is None:
+            console.print(f"[green]Transcript saved to: {forwarded['saved_to']}[/green]")
         else:
-            output = Path(output)
-
-        transcriber.save_transcript(result, output, format=format)
+            transcriber.save_transcript(result, output, format=format)
 
     # Display statistics if available
     if 'duration' in result:
@@ -199,6 +429,122 @@ def handle_transcription(
     if 'language' in result:
         console.print(f"[dim]Detected language: {result['language']}[/dim]")
 
+    report_stats(result.get('stats'), show_stats, metrics_log)
+
+
+def handle_batch_transcription(
+    pattern: str,
+    api_key: str,
+    model: str,
+    format: str,
+    language: Optional[str],
+    tier: str,
+    workers: int = DEFAULT_WORKERS,
+    cache: Optional["TranscriptionCache"] = None,
+    index: Optional["TranscriptIndex"] = None,
+    preprocess: Optional[bool] = None,
+    trim_silence: bool = False,
+    resume: bool = True,
+    hedge: bool = False
+) -> None:
+    """Handle batch transcription of a directory or glob."""
+    from groq_cli.batch import find_audio_files, print_batch_summary, transcribe_batch
+    from groq_cli.manifest import JobManifest, default_jobs_dir
+    from groq_cli.transcriber import WhisperTranscriber
+
+    files = find_audio_files(pattern)
+    if not files:
+        console.print(f"[red]Error: No supported audio files found for: {pattern}[/red]")
+        sys.exit(1)
+
+    console.print(f"[blue]Found {len(files)} audio files[/blue]")
+    console.print(f"[dim]Model: {model} | Workers: {workers}[/dim]")
+
+    # One transcriber (and one HTTP client) serves every job
+    transcriber = WhisperTranscriber(
+        api_key=api_key, tier=tier, cache=cache, hedge=hedge, index=index,
+        jobs_dir=default_jobs_dir(), resume=resume
+    )
+    # The same pattern and settings find the same manifest on a re-run
+    manifest = JobManifest.open('batch', {
+        'pattern': os.path.abspath(pattern),
+        'model': model,
+        'language': language,
+        'format': format,
+        'preprocess': preprocess,
+        'trim_silence': trim_silence
+    }, fresh=not resume)
+    try:
+        summary = transcribe_batch(
+            transcriber,
+            files,
+            model=model,
+            language=language,
+            format=format,
+            workers=workers,
+            preprocess=preprocess,
+            trim_silence=trim_silence,
+            manifest=manifest
+        )
+    except KeyboardInterrupt:
+        if resume:
+            raise ResumableInterrupt() from None
+        raise
+    print_batch_summary(summary)
+
+    if summary['failed']:
+        sys.exit(1)
+
+
+def handle_watch(
+    directory: Path,
+    api_key: str,
+    model: str,
+    format: str,
+    language: Optional[str],
+    tier: str,
+    workers: int = DEFAULT_WORKERS,
+    cache: Optional["TranscriptionCache"] = None,
+    index: Optional["TranscriptIndex"] = None,
+    preprocess: Optional[bool] = None,
+    trim_silence: bool = False,
+    hedge: bool = False,
+    poll: bool = False,
+    metrics_log: Optional[Path] = None
+) -> None:
+    """Handle watch-folder transcription."""
+    from groq_cli.manifest import default_jobs_dir
+    from groq_cli.transcriber import WhisperTranscriber
+    from groq_cli.watch import FolderWatcher
+
+    transcriber = WhisperTranscriber(
+        api_key=api_key, tier=tier, cache=cache, hedge=hedge, index=index, jobs_dir=default_jobs_dir()
+    )
+    watcher = FolderWatcher(
+        transcriber,
+        directory,
+        format=format,
+        workers=workers,
+        poll=poll,
+        metrics_log=metrics_log,
+        model=model,
+        language=language,
+        preprocess=preprocess,
+        trim_silence=trim_silence
+    )
+
+    console.print(f"[green]Watching {watcher.directory} ({'polling' if watcher.poll else 'inotify'})[/green]")
+    console.print(f"[dim]Model: {model} | Workers: {workers} | Format: {format}. Press Ctrl+C to stop.[/dim]")
+    try:
+        watcher.run()
+    finally:
+        counters = watcher.counters()
+        console.print(
+            f"\n[cyan]Watched: {counters['done']} transcribed, {counters['failed']} failed"
+            + (f", mean latency {counters['latency_mean']:.1f}s" if counters['latency_mean'] is not None else "")
+            + "[/cyan]"
+        )
+
 
 def handle_chat(
     query: str,
@@ -206,42 +552,109 @@ def handle_chat(
     model: str,
     temperature: float,
     max_tokens: int,
-    system_prompt: Optional[str]
+    system_prompt: Optional[str],
+    cache: Optional["CompletionCache"] = None,
+    show_stats: bool = False,
+    metrics_log: Optional[Path] = None,
+    use_daemon: bool = False
 ) -> None:
     """Handle single chat completion."""
-    # Initialize chat completer
-    chat = ChatCompleter(api_key=api_key)
-
     # Display model info
     console.print(f"[dim]Using model: {model}[/dim]")
     if system_prompt:
         console.print(f"[dim]System: {system_prompt}[/dim]")
     console.print()
 
-    # Stream the response
-    result = chat.stream_completion(
+    params = dict(
         query=query,
         model=model,
         temperature=temperature,
         max_tokens=max_tokens,
-        system_prompt=system_prompt,
-        maintain_history=False
+        system_prompt=system_prompt
     )
 
+    # A running daemon answers without loading the SDK or reconnecting
+    result = None
+    if use_daemon:
+        from groq_cli.daemon import forward_chat
+        result = forward_chat(api_key, **params)
+
+    if result is None:
+        from groq_cli.chat import ChatCompleter
+
+        # Initialize chat completer
+        chat = ChatCompleter(api_key=api_key, cache=cache)
+
+        # Stream the response
+        result = chat.stream_completion(maintain_history=False, **params)
+
     console.print()  # Final newline
 
     # Show tools used if compound model
     if result.get("tools_used") and "compound" in model:
         console.print(f"[dim]Tools used: {', '.join(result['tools_used'])}[/dim]")
 
+    report_stats(result.get('stats'), show_stats, metrics_log)
+
+
+def handle_prompt_batch(
+    batch_in: Path,
+    batch_out: Optional[Path],
+    api_key: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    system_prompt: Optional[str],
+    workers: int = DEFAULT_WORKERS,
+    cache: Optional["CompletionCache"] = None
+) -> None:
+    """Handle batch chat completions from a JSONL file."""
+    import asyncio
+    from groq_cli.chat import AsyncChatCompleter
+    from groq_cli.prompt_batch import print_prompt_batch_summary, read_prompts, run_prompt_batch
+
+    if batch_out is None:
+        batch_out = batch_in.with_suffix('.results.jsonl')
+
+    prompts = read_prompts(batch_in)
+    console.print(f"[blue]Loaded {len(prompts)} prompts from {batch_in.name}[/blue]")
+    console.print(f"[dim]Default model: {model} | Concurrency: {workers}[/dim]")
+
+    async def run() -> dict:
+        # One async client serves every request
+        completer = AsyncChatCompleter(api_key=api_key, cache=cache)
+        try:
+            return await run_prompt_batch(
+                completer,
+                prompts,
+                batch_out,
+                max_concurrency=workers,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system_prompt=system_prompt
+            )
+        finally:
+            await completer.close()
+
+    summary = asyncio.run(run())
+    print_prompt_batch_summary(summary, batch_out)
+
+    if summary['failed']:
+        sys.exit(1)
+
 
 def handle_interactive(
     api_key: str,
     model: str,
     temperature: float,
-    system_prompt: Optional[str]
+    system_prompt: Optional[str],
+    summarize: bool = True,
+    history_tokens: int = DEFAULT_HISTORY_TOKENS
 ) -> None:
     """Handle interactive chat mode."""
+    from groq_cli.chat import ChatCompleter
+
     # Display welcome message
     console.print("[bold green]Welcome to Groq Interactive Chat![/bold green]")
     console.print(f"[dim]Model: {model} | Temperature: {temperature}[/dim]")
@@ -250,14 +663,59 @@ def handle_interactive(
     console.print()
 
     # Initialize chat and start interactive session
-    chat = ChatCompleter(api_key=api_key)
+    chat = ChatCompleter(api_key=api_key, history_tokens=history_tokens)
     chat.interactive_chat(
         model=model,
         temperature=temperature,
-        system_prompt=system_prompt
+        system_prompt=system_prompt,
+        summarize=summarize
     )
 
 
+def handle_search(query: str, file: Optional[Path] = None) -> None:
+    """Handle a search of indexed transcripts."""
+    from rich.markup import escape
+    from groq_cli.index import TranscriptIndex
+
+    index = TranscriptIndex()
+    try:
+        hits = index.search(query, source=file)
+    finally:
+        index.close()
+
+    if not hits:
+        console.print(f"[yellow]No transcripts mention: {query}[/yellow]")
+        return
+    for hit in hits:
+        # file:milliseconds, as editors and players can seek to it
+        console.print(f"[cyan]{escape(hit['file'])}:{hit['start_ms']}[/cyan]  {escape(hit['text'])}", highlight=False)
+
+
+def handle_daemon(
+    api_key: str,
+    tier: str,
+    cache: Optional["TranscriptionCache"] = None,
+    index: Optional["TranscriptIndex"] = None
+) -> None:
+    """Handle daemon mode."""
+    import signal
+    import threading
+    from groq_cli.daemon import create_daemon
+
+    server = create_daemon(api_key=api_key, tier=tier, cache=cache, index=index)
+
+    # Stop cleanly (and remove the socket) when terminated
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    console.print(f"[green]Daemon listening on {server.socket_path}[/green]")
+    console.print("[dim]Chat and transcription calls with the same API key now forward here. Press Ctrl+C to stop.[/dim]")
+    threading.Thread(target=server.warm, daemon=True).start()
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
 def main():
     """Entry point for the CLI."""
     cli()
@@ -0,0 +1,188 @@
+"""Checkpoint manifests that let interrupted chunked and batch jobs resume."""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from groq_cli.cache import default_cache_dir
+
+MANIFEST_VERSION = 1
+
+
+def default_jobs_dir() -> Path:
+    """Get the per-user directory for job manifests."""
+    return default_cache_dir().parent / 'jobs'
+
+
+def job_id(kind: str, params: Dict[str, Any]) -> str:
+    """
+    Identify a job by what it does, so re-running a command finds its manifest.
+
+    Args:
+        kind: 'chunks' or 'batch'
+        params: Everything that determines the job's results
+
+    Returns:
+        Short hex id
+    """
+    key = json.dumps({'kind': kind, **params}, sort_keys=True, default=str)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:20]
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Replace a file so readers see either the old or the new contents, even after a crash."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class JobManifest:
+    """
+    State of each chunk or file in a long-running job, kept on disk.
+
+    Every change rewrites the manifest atomically, so a crash, kill or
+    Ctrl-C loses at most the items that were still in flight. Chunk
+    results are stored next to it; batch items point at the transcript
+    already saved beside their source. Safe to update from worker threads.
+    """
+
+    def __init__(self, path: Union[str, Path], kind: str, params: Dict[str, Any], fresh: bool = False):
+        """
+        Open a job's manifest, loading earlier progress unless fresh.
+
+        Args:
+            path: Manifest file
+            kind: 'chunks' or 'batch'
+            params: Parameters that identify the job (stored for reference)
+            fresh: Discard any earlier progress
+        """
+        self.path = Path(path)
+        self.results_dir = self.path.with_suffix('')
+        self.kind = kind
+        self.params = params
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if fresh:
+            self.remove()
+        else:
+            self._load()
+        self.resumed = sum(1 for item in self.items.values() if item.get('state') == 'done')
+
+    @classmethod
+    def open(
+        cls,
+        kind: str,
+        params: Dict[str, Any],
+        jobs_dir: Optional[Union[str, Path]] = None,
+        fresh: bool = False
+    ) -> "JobManifest":
+        """
+        Open the manifest for a job, identified by its parameters.
+
+        Args:
+            kind: 'chunks' or 'batch'
+            params: Everything that determines the job's results
+            jobs_dir: Directory for manifests (defaults to the user cache dir)
+            fresh: Discard any earlier progress
+
+        Returns:
+            The job's manifest
+        """
+        jobs_dir = Path(jobs_dir) if jobs_dir else default_jobs_dir()
+        jobs_dir.mkdir(parents=True, exist_ok=True)
+        return cls(jobs_dir / f"{kind}-{job_id(kind, params)}.json", kind, params, fresh=fresh)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get('version') == MANIFEST_VERSION and data.get('kind') == self.kind:
+            self.items = data.get('items', {})
+
+    def _save(self) -> None:
+        # Called with the lock held
+        write_atomic(self.path, json.dumps({
+            'version': MANIFEST_VERSION,
+            'kind': self.kind,
+            'params': self.params,
+            'updated': time.time(),
+            'items': self.items
+        }, ensure_ascii=False, indent=1, default=str))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get an item's entry, if one was recorded."""
+        with self._lock:
+            return self.items.get(key)
+
+    def is_done(self, key: str) -> bool:
+        """Whether an item finished and its result path (if any) still exists."""
+        item = self.get(key)
+        if not item or item.get('state') != 'done':
+            return False
+        return item.get('result') is None or Path(item['result']).exists()
+
+    def mark(self, key: str, state: str, **fields: Any) -> None:
+        """
+        Record an item's state and save the manifest.
+
+        Args:
+            key: Chunk or file key
+            state: 'done' or 'failed'
+            **fields: Extra details (result path, error, audio_seconds, ...)
+        """
+        with self._lock:
+            self.items[key] = {'state': state, 'updated': time.time(), **fields}
+            self._save()
+
+    def save_result(self, key: str, result: Any) -> Path:
+        """
+        Store an item's result next to the manifest and mark it done.
+
+        Args:
+            key: Chunk key
+            result: JSON-serialisable result
+
+        Returns:
+            Path of the stored result
+        """
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        path = self.results_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}.json"
+        write_atomic(path, json.dumps(result, ensure_ascii=False))
+        self.mark(key, 'done', result=str(path))
+        return path
+
+    def load_result(self, key: str) -> Optional[Any]:
+        """
+        Load a finished item's stored result.
+
+        Returns:
+            The result, or None if the item is unfinished or its file is gone
+        """
+        if not self.is_done(key):
+            return None
+        try:
+            with open(self.get(key)['result'], 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, TypeError, json.JSONDecodeError):
+            return None
+
+    def remove(self) -> None:
+        """Delete the manifest and any stored results, once the job is complete."""
+        with self._lock:
+            self.items = {}
+            shutil.rmtree(self.results_dir, ignore_errors=True)
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,216 @@
+"""Batch chat completions from a JSONL prompt file."""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+from rich.console import Console
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn, TimeElapsedColumn
+
+from groq_cli.chat import AsyncChatCompleter
+
+console = Console()
+
+# Per-line fields that map onto stream_completion arguments
+PROMPT_FIELDS = {
+    'query': 'query',
+    'model': 'model',
+    'system': 'system_prompt',
+    'temperature': 'temperature',
+    'max_tokens': 'max_tokens'
+}
+
+
+def read_prompts(input_path: Path) -> List[Dict[str, Any]]:
+    """
+    Read prompts from a JSONL file.
+
+    Each line is an object with a 'query' and optional 'id', 'model',
+    'system', 'temperature' and 'max_tokens'. Lines without an id are
+    numbered by their position, so ids stay stable between runs.
+
+    Args:
+        input_path: Path to the JSONL prompt file
+
+    Returns:
+        List of prompt dictionaries, each with an 'id'
+
+    Raises:
+        ValueError: If a line is not valid JSON, has no query, or has an
+            id that is not a string, number, boolean or null
+    """
+    prompts = []
+    with open(input_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                prompt = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{input_path.name}:{line_number}: invalid JSON ({e})")
+            if not isinstance(prompt, dict) or not prompt.get('query'):
+                raise ValueError(f"{input_path.name}:{line_number}: missing 'query'")
+            prompt.setdefault('id', len(prompts))
+            if isinstance(prompt['id'], (list, dict)):
+                # Ids are matched against earlier results, so they must be hashable
+                raise ValueError(f"{input_path.name}:{line_number}: 'id' must be a string, number, boolean or null")
+            prompts.append(prompt)
+    return prompts
+
+
+def completed_ids(output_path: Path) -> Set[Any]:
+    """
+    Collect ids that already have a successful result in an output file.
+
+    Lines that are not valid JSON objects, or whose id is not a scalar,
+    are ignored.
+
+    Args:
+        output_path: Path to the JSONL results file
+
+    Returns:
+        Set of completed prompt ids
+    """
+    done = set()
+    if not output_path.exists():
+        return done
+
+    with open(output_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(record, dict) or isinstance(record.get('id'), (list, dict)):
+                continue
+            if 'error' not in record:
+                done.add(record.get('id'))
+    return done
+
+
+def drop_partial_line(output_path: Path) -> None:
+    """
+    Truncate an unterminated last line left behind by a crash.
+
+    Args:
+        output_path: Path to the JSONL results file
+    """
+    if not output_path.exists():
+        return
+
+    with open(output_path, 'rb+') as f:
+        end = f.seek(0, 2)
+        position = end
+        while position > 0:
+            step = min(64 * 1024, position)
+            f.seek(position - step)
+            block = f.read(step)
+            if position == end and block.endswith(b'\n'):
+                return
+            newline = block.rfind(b'\n')
+            if newline != -1:
+                f.truncate(position - step + newline + 1)
+                return
+            position -= step
+        f.truncate(0)
+
+
+async def run_prompt_batch(
+    completer: AsyncChatCompleter,
+    prompts: List[Dict[str, Any]],
+    output_path: Path,
+    max_concurrency: int = 8,
+    **defaults: Any
+) -> Dict[str, Any]:
+    """
+    Run prompts concurrently and append results to a JSONL file in input order.
+
+    Prompts whose id already has a successful result in the output file are
+    skipped, so an interrupted run can be resumed with the same command.
+    Failed prompts are written with an 'error' field and retried on the
+    next run.
+
+    Args:
+        completer: Async completer whose client is shared by every request
+        prompts: Prompts from read_prompts
+        output_path: JSONL file to append results to
+        max_concurrency: Limit on in-flight requests
+        **defaults: stream_completion arguments for fields a line leaves out
+
+    Returns:
+        Summary dictionary with counts and throughput
+    """
+    drop_partial_line(output_path)
+    done = completed_ids(output_path)
+    pending = [prompt for prompt in prompts if prompt['id'] not in done]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(index: int, prompt: Dict[str, Any]):
+        kwargs = dict(defaults)
+        kwargs.update({arg: prompt[field] for field, arg in PROMPT_FIELDS.items() if field in prompt})
+        async with semaphore:
+            try:
+                result = await completer.stream_completion(echo=False, **kwargs)
+                record = {'id': prompt['id'], 'model': kwargs.get('model'), **result}
+            except Exception as e:
+                record = {'id': prompt['id'], 'model': kwargs.get('model'), 'error': str(e)}
+        return index, record
+
+    succeeded = 0
+    failed = 0
+    started = time.perf_counter()
+
+    # Results are buffered until every earlier prompt has finished, so the
+    # output file always holds an in-order prefix of the pending prompts
+    buffered: Dict[int, Dict[str, Any]] = {}
+    next_index = 0
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console
+    ) as progress, open(output_path, 'a', encoding='utf-8') as out:
+        task = progress.add_task("Running prompts...", total=len(pending))
+        tasks = [asyncio.ensure_future(run(index, prompt)) for index, prompt in enumerate(pending)]
+        try:
+            for future in asyncio.as_completed(tasks):
+                index, record = await future
+                if 'error' in record:
+                    failed += 1
+                else:
+                    succeeded += 1
+                buffered[index] = record
+
+                while next_index in buffered:
+                    out.write(json.dumps(buffered.pop(next_index), ensure_ascii=False) + "\n")
+                    next_index += 1
+                out.flush()
+                progress.advance(task)
+        finally:
+            for pending_task in tasks:
+                pending_task.cancel()
+
+    elapsed = time.perf_counter() - started
+    return {
+        'total': len(prompts),
+        'skipped': len(prompts) - len(pending),
+        'succeeded': succeeded,
+        'failed': failed,
+        'elapsed': elapsed,
+        'prompts_per_min': succeeded / (elapsed / 60) if elapsed > 0 else 0.0
+    }
+
+
+def print_prompt_batch_summary(summary: Dict[str, Any], output_path: Path) -> None:
+    """Print the summary for a prompt batch run."""
+    console.print("\n[bold cyan]Batch Summary:[/bold cyan]")
+    console.print(f"  Prompts: {summary['succeeded']} completed, {summary['skipped']} already done")
+    if summary['failed']:
+        console.print(f"  [red]Failed: {summary['failed']} (re-run the same command to retry)[/red]")
+    console.print(f"  Throughput: {summary['prompts_per_min']:.1f} prompts/min in {summary['elapsed']:.1f} seconds")
+    console.print(f"  Results: {output_path}")
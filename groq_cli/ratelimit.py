@@ -0,0 +1,302 @@
+"""Client-side rate limiting shared by every request a process makes.
+
+A RateLimiter holds token buckets for requests, tokens and audio seconds,
+plus an AIMD concurrency limit. It learns the account's quotas from the
+x-ratelimit-* and retry-after headers of every response, via an httpx
+response hook, so parallel and batch workloads slow down before the API
+starts answering 429.
+"""
+
+import asyncio
+import contextlib
+import re
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+# Buckets a request can draw from, keyed as in the x-ratelimit-*-<kind> headers
+KINDS = ('requests', 'tokens', 'audio_seconds')
+
+# Concurrency starts here and grows by one per window of successes
+INITIAL_CONCURRENCY = 8
+MAX_CONCURRENCY = 64
+
+# Several 429s from one burst should halve the limit once, not once each
+DECREASE_COOLDOWN = 1.0
+
+# Pause after a 429 that carries no retry-after header
+DEFAULT_RETRY_AFTER = 1.0
+
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+_DURATION_UNITS = {'h': 3600.0, 'm': 60.0, 's': 1.0, 'ms': 0.001}
+
+
+def parse_duration(value: str) -> Optional[float]:
+    """
+    Parse a reset header such as '7.66s', '2m59.56s' or '150ms'.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds, or None if the value is not a duration
+    """
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts or ''.join(number + unit for number, unit in parts) != value:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+class TokenBucket:
+    """Token bucket; a bucket with no rate is unlimited. Not thread-safe on its own."""
+
+    def __init__(self, rate: Optional[float] = None, capacity: Optional[float] = None):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Refill rate per second (None for unlimited)
+            capacity: Maximum level (defaults to one minute of refill)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else (rate * 60 if rate else None)
+        self.level = self.capacity or 0.0
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        if self.rate:
+            self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount can be taken (0 if it can be taken now)."""
+        if not self.rate or amount <= 0:
+            return 0.0
+        self._refill(now)
+        # A request larger than the bucket goes through once it is full
+        needed = min(amount, self.capacity)
+        return max(0.0, (needed - self.level) / self.rate)
+
+    def take(self, amount: float) -> None:
+        if self.rate:
+            self.level -= amount
+
+    def observe(self, limit: float, remaining: float, reset: Optional[float], now: float) -> None:
+        """
+        Align the bucket with what the server reports.
+
+        The server's remaining count replaces the local estimate, and the
+        refill rate is set so the bucket is full again when the server
+        says the window resets.
+        """
+        self.capacity = limit
+        if reset and reset > 0 and limit > remaining:
+            self.rate = (limit - remaining) / reset
+        elif not self.rate:
+            # Nothing used yet in this window; assume a per-minute quota
+            self.rate = limit / 60
+        self._refill(now)
+        self.level = min(self.level, remaining)
+
+
+class RateLimiter:
+    """
+    Token buckets plus an adaptive concurrency limit, shared across threads.
+
+    Use slot() around each synchronous request and acquire_async/release
+    around each asynchronous one. Quotas may be given up front; otherwise
+    they are learned from response headers once attach() has hooked the
+    limiter into an httpx client.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        audio_seconds_per_hour: Optional[float] = None,
+        initial_concurrency: int = INITIAL_CONCURRENCY,
+        max_concurrency: int = MAX_CONCURRENCY
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Known request quota (None to learn it)
+            tokens_per_minute: Known token quota (None to learn it)
+            audio_seconds_per_hour: Known audio quota (None to learn it)
+            initial_concurrency: Starting limit on in-flight requests
+            max_concurrency: Ceiling for the concurrency limit
+        """
+        self.buckets: Dict[str, TokenBucket] = {
+            'requests': TokenBucket(requests_per_minute / 60 if requests_per_minute else None),
+            'tokens': TokenBucket(tokens_per_minute / 60 if tokens_per_minute else None),
+            'audio_seconds': TokenBucket(
+                audio_seconds_per_hour / 3600 if audio_seconds_per_hour else None,
+                audio_seconds_per_hour
+            )
+        }
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(min(initial_concurrency, max_concurrency))
+        self.active = 0
+        self.rate_limited = 0
+
+        self._blocked_until = 0.0
+        self._last_decrease = float('-inf')
+        self._cond = threading.Condition()
+
+    def limits(self, kind: str) -> bool:
+        """Whether a quota is known for a bucket kind."""
+        return bool(self.buckets[kind].rate)
+
+    def _try_acquire(self, amounts: Dict[str, float]) -> Optional[float]:
+        # Returns 0 once the slot is taken, else seconds to wait (None
+        # means wait for a release)
+        now = time.monotonic()
+        wait = max(0.0, self._blocked_until - now)
+        for kind, amount in amounts.items():
+            wait = max(wait, self.buckets[kind].wait_time(amount, now))
+        if wait > 0:
+            return wait
+        if self.active >= int(self.concurrency):
+            return None
+        for kind, amount in amounts.items():
+            self.buckets[kind].take(amount)
+        self.active += 1
+        return 0.0
+
+    def acquire(self, requests: float = 1, tokens: float = 0, audio_seconds: float = 0) -> None:
+        """Block until a request may be sent, then take its slot."""
+        amounts = {'requests': requests, 'tokens': tokens, 'audio_seconds': audio_seconds}
+        with self._cond:
+            while True:
+                wait = self._try_acquire(amounts)
+                if wait == 0:
+                    return
+                self._cond.wait(wait)
+
+    async def acquire_async(self, requests: float = 1, tokens: float = 0, audio_seconds: float = 0) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        amounts = {'requests': requests, 'tokens': tokens, 'audio_seconds': audio_seconds}
+        while True:
+            with self._cond:
+                wait = self._try_acquire(amounts)
+            if wait == 0:
+                return
+            await asyncio.sleep(wait if wait is not None else 0.01)
+
+    def release(self, success: bool = True) -> None:
+        """
+        Give back a slot taken by acquire.
+
+        Args:
+            success: The request completed; grows the concurrency limit by
+                about one per window of successes, but only while the limit
+                is actually in use and not right after a back-off
+        """
+        with self._cond:
+            saturated = self.active >= int(self.concurrency)
+            self.active -= 1
+            recovering = time.monotonic() - self._last_decrease < DECREASE_COOLDOWN
+            if success and saturated and not recovering:
+                self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+            self._cond.notify_all()
+
+    @contextlib.contextmanager
+    def slot(self, requests: float = 1, tokens: float = 0, audio_seconds: float = 0) -> Iterator[None]:
+        """Hold a request slot for the duration of a with block."""
+        self.acquire(requests, tokens, audio_seconds)
+        success = False
+        try:
+            yield
+            success = True
+        finally:
+            self.release(success)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """
+        Back off after a 429: pause new requests and halve concurrency.
+
+        Args:
+            retry_after: Seconds the server asked us to wait
+        """
+        with self._cond:
+            now = time.monotonic()
+            self.rate_limited += 1
+            self._blocked_until = max(self._blocked_until, now + (retry_after or DEFAULT_RETRY_AFTER))
+            if now - self._last_decrease >= DECREASE_COOLDOWN:
+                self.concurrency = max(1.0, self.concurrency / 2)
+                self._last_decrease = now
+            self._cond.notify_all()
+
+    def observe_headers(self, headers: Any, status_code: int = 200) -> None:
+        """
+        Update quotas from a response's rate-limit headers.
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+            status_code: Response status; 429 triggers a back-off
+        """
+        now = time.monotonic()
+        with self._cond:
+            for kind in KINDS:
+                suffix = kind.replace('_', '-')
+                limit = headers.get(f'x-ratelimit-limit-{suffix}')
+                remaining = headers.get(f'x-ratelimit-remaining-{suffix}')
+                if limit is None or remaining is None:
+                    continue
+                try:
+                    limit, remaining = float(limit), float(remaining)
+                except ValueError:
+                    continue
+                reset = headers.get(f'x-ratelimit-reset-{suffix}')
+                self.buckets[kind].observe(limit, remaining, parse_duration(reset) if reset else None, now)
+            self._cond.notify_all()
+
+        if status_code == 429:
+            retry_after = headers.get('retry-after')
+            self.on_rate_limited(parse_duration(retry_after) if retry_after else None)
+
+    def attach(self, http_client: Any) -> Any:
+        """
+        Hook the limiter into an httpx client so it sees every response.
+
+        Safe to call more than once for the same client.
+
+        Args:
+            http_client: httpx.Client or httpx.AsyncClient
+
+        Returns:
+            The same client
+        """
+        hooks = http_client.event_hooks
+        responses = hooks.setdefault('response', [])
+        if any(getattr(hook, '__self__', None) is self for hook in responses):
+            return http_client
+        import httpx
+        responses.append(self._observe_async if isinstance(http_client, httpx.AsyncClient) else self._observe)
+        http_client.event_hooks = hooks
+        return http_client
+
+    def _observe(self, response: Any) -> None:
+        self.observe_headers(response.headers, response.status_code)
+
+    async def _observe_async(self, response: Any) -> None:
+        self.observe_headers(response.headers, response.status_code)
+
+
+_shared: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def shared_limiter() -> RateLimiter:
+    """The process-wide limiter used by engines that are not given one."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = RateLimiter()
+        return _shared
@@ -0,0 +1,227 @@
+"""Retries with jittered exponential backoff, and hedged requests."""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Awaitable, Callable, Deque, List, Optional
+
+import httpx
+from groq import APIConnectionError, APIStatusError, APITimeoutError
+
+from groq_cli.ratelimit import parse_duration
+
+DEFAULT_ATTEMPTS = 4
+BASE_DELAY = 0.5
+MAX_DELAY = 20.0
+
+# Statuses worth another attempt: timeout, conflict, rate limit, server errors
+RETRYABLE_STATUSES = {408, 409, 429, 500, 502, 503, 504}
+
+# Statuses that mean the request was refused before any work was done, so
+# even a non-idempotent request can be repeated safely
+UNPROCESSED_STATUSES = {429, 503}
+
+# Hedging needs a few samples before a percentile means anything
+HEDGE_MIN_SAMPLES = 5
+HEDGE_PERCENTILE = 0.95
+HEDGE_MIN_DELAY = 1.0
+
+
+class RetryPolicy:
+    """Decides whether and when to retry a failed API call."""
+
+    def __init__(
+        self,
+        attempts: int = DEFAULT_ATTEMPTS,
+        base_delay: float = BASE_DELAY,
+        max_delay: float = MAX_DELAY,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            attempts: Total tries, including the first
+            base_delay: Backoff ceiling for the first retry, in seconds
+            max_delay: Upper bound on any single backoff
+            sleep: Sleep function (replaceable in tests)
+        """
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self.retries = 0
+
+    def should_retry(self, error: BaseException, attempt: int, idempotent: bool = True) -> bool:
+        """
+        Whether a failed attempt may be tried again.
+
+        Args:
+            error: Exception from the attempt
+            attempt: Zero-based number of the attempt that failed
+            idempotent: Repeating the request has no extra effect; if not,
+                only errors that show the request was never processed (a
+                failed connect, 429, 503) qualify
+
+        Returns:
+            True if another attempt should be made
+        """
+        if attempt + 1 >= self.attempts:
+            return False
+        if isinstance(error, APITimeoutError):
+            # The server may have done the work, unless it was never reached
+            return idempotent or isinstance(error.__cause__, httpx.ConnectTimeout)
+        if isinstance(error, APIConnectionError):
+            # A dropped connection may come after the body was sent; only a
+            # failure to connect shows the server never saw the request
+            return idempotent or isinstance(error.__cause__, (httpx.ConnectError, httpx.ConnectTimeout))
+        if isinstance(error, APIStatusError):
+            statuses = RETRYABLE_STATUSES if idempotent else UNPROCESSED_STATUSES
+            return error.status_code in statuses
+        return False
+
+    def backoff(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        Uses the server's retry-after when it sent one, otherwise full
+        jitter: a uniform draw up to an exponentially growing ceiling, so
+        many clients failing together do not retry in lockstep.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            error: Exception from the attempt
+
+        Returns:
+            Delay in seconds
+        """
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        if retry_after:
+            seconds = parse_duration(retry_after)
+            if seconds is not None:
+                return min(seconds, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def call(
+        self,
+        fn: Callable[[], Any],
+        idempotent: bool = True,
+        retry_if: Optional[Callable[[BaseException], bool]] = None
+    ) -> Any:
+        """
+        Call fn, retrying transient failures.
+
+        Args:
+            fn: Function making one attempt
+            idempotent: See should_retry
+            retry_if: Extra condition checked on each failure (e.g. "no
+                tokens have been shown yet")
+
+        Returns:
+            fn's return value
+        """
+        attempt = 0
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                if not self.should_retry(e, attempt, idempotent) or (retry_if and not retry_if(e)):
+                    raise
+                self.sleep(self.backoff(attempt, e))
+                self.retries += 1
+                attempt += 1
+
+    async def call_async(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        idempotent: bool = True,
+        retry_if: Optional[Callable[[BaseException], bool]] = None
+    ) -> Any:
+        """Async counterpart of call; fn returns an awaitable."""
+        attempt = 0
+        while True:
+            try:
+                return await fn()
+            except Exception as e:
+                if not self.should_retry(e, attempt, idempotent) or (retry_if and not retry_if(e)):
+                    raise
+                await asyncio.sleep(self.backoff(attempt, e))
+                self.retries += 1
+                attempt += 1
+
+
+class LatencyTracker:
+    """Recent request latencies per unit of work, for picking a hedge delay."""
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, units: float = 1.0) -> None:
+        with self._lock:
+            self._samples.append(seconds / max(units, 1e-9))
+
+    def percentile(self, fraction: float = HEDGE_PERCENTILE) -> Optional[float]:
+        """Latency per unit at the given percentile, or None with too few samples."""
+        with self._lock:
+            if len(self._samples) < HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _run_in_thread(fn: Callable[[], Any]) -> Future:
+    # Daemon threads, so an abandoned slow request never holds up exit
+    future: Future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="groq-hedge", daemon=True).start()
+    return future
+
+
+def hedged_call(fn: Callable[[], Any], tracker: LatencyTracker, units: float = 1.0) -> Any:
+    """
+    Call fn, sending a duplicate if it runs past the usual tail latency.
+
+    The duplicate goes out once the first attempt has taken longer than
+    the tracker's p95 latency for this much work. Whichever finishes first
+    wins; if it failed, the other is awaited. Only safe for idempotent calls.
+
+    Args:
+        fn: Function making one request
+        tracker: Latency history shared by comparable requests
+        units: Size of this request in the tracker's units (e.g. MB)
+
+    Returns:
+        Result of the first successful attempt
+    """
+    started = time.monotonic()
+    per_unit = tracker.percentile()
+    attempts: List[Future] = [_run_in_thread(fn)]
+
+    if per_unit is not None:
+        done, _ = wait(attempts, timeout=max(HEDGE_MIN_DELAY, per_unit * units))
+        if not done:
+            attempts.append(_run_in_thread(fn))
+
+    pending = set(attempts)
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for attempt in done:
+            if attempt.exception() is None:
+                tracker.record(time.monotonic() - started, units)
+                return attempt.result()
+            error = error or attempt.exception()
+    raise error
@@ -0,0 +1,145 @@
+"""Per-request phase timings for chat and transcription requests."""
+
+import contextlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+# Upper bounds of the inter-token latency histogram buckets, in ms
+INTER_TOKEN_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 250, 500, 1000)
+
+# Phases in display order; other names are shown after these
+PHASE_ORDER = ('client_init', 'read', 'trim', 'preprocess', 'queue', 'send', 'upload', 'server', 'parse', 'write')
+
+
+def _bucket_label(index: int) -> str:
+    if index < len(INTER_TOKEN_BUCKETS_MS):
+        return f"<={INTER_TOKEN_BUCKETS_MS[index]}ms"
+    return f">{INTER_TOKEN_BUCKETS_MS[-1]}ms"
+
+
+class RequestStats(dict):
+    """
+    Phase timings and counters for one chat or transcription request.
+
+    A plain dict underneath, so it serialises as-is into batch results,
+    daemon frames and the metrics log. Phases (in seconds) accumulate:
+    a retried request adds each attempt's time, and the phases of a
+    chunked transcription sum over chunks that ran in parallel, so they
+    can exceed the total. Safe to update from several threads.
+    """
+
+    def __init__(self, kind: str, **info: Any):
+        """
+        Start timing a request.
+
+        Args:
+            kind: 'chat' or 'transcription'
+            **info: Descriptive fields (model, file, ...)
+        """
+        super().__init__(kind=kind, **info)
+        self['phases'] = {}
+        self['counters'] = {}
+        self['total'] = None
+        self.started = time.perf_counter()
+        self._last_token: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time to a phase."""
+        with self._lock:
+            self['phases'][phase] = self['phases'].get(phase, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a with block as part of a phase."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self['counters'][name] = self['counters'].get(name, 0) + amount
+
+    def token(self) -> None:
+        """Note that a streamed token arrived."""
+        now = time.perf_counter()
+        with self._lock:
+            if self._last_token is None:
+                self['ttft'] = now - self.started
+                self['inter_token_ms'] = dict.fromkeys(map(_bucket_label, range(len(INTER_TOKEN_BUCKETS_MS) + 1)), 0)
+            else:
+                gap_ms = (now - self._last_token) * 1000
+                index = next((i for i, bound in enumerate(INTER_TOKEN_BUCKETS_MS) if gap_ms <= bound), len(INTER_TOKEN_BUCKETS_MS))
+                self['inter_token_ms'][_bucket_label(index)] += 1
+            self._last_token = now
+            self['counters']['chunks'] = self['counters'].get('chunks', 0) + 1
+
+    def finish(self, tokens: Optional[int] = None) -> "RequestStats":
+        """
+        Record the total time and, for streams, the token rate.
+
+        Args:
+            tokens: Completion tokens as reported by the API (defaults to
+                the number of streamed chunks)
+
+        Returns:
+            self
+        """
+        self['total'] = time.perf_counter() - self.started
+        if 'ttft' in self:
+            tokens = tokens or self['counters'].get('chunks', 0)
+            streaming = self['total'] - self['ttft']
+            self['tokens'] = tokens
+            self['tokens_per_s'] = tokens / streaming if streaming > 0 else None
+        return self
+
+
+def print_stats(stats: Dict[str, Any], console: Any) -> None:
+    """
+    Print request stats as a table.
+
+    Args:
+        stats: RequestStats (or one decoded from JSON)
+        console: Rich console to print to
+    """
+    from rich.table import Table
+
+    table = Table(title=f"{stats.get('kind', 'request').capitalize()} stats", show_header=False, title_justify="left")
+    table.add_column("Metric", style="dim")
+    table.add_column("Value", justify="right")
+
+    phases = stats.get('phases', {})
+    ordered = [name for name in PHASE_ORDER if name in phases] + [name for name in phases if name not in PHASE_ORDER]
+    for name in ordered:
+        table.add_row(name, f"{phases[name] * 1000:.1f} ms")
+    if stats.get('ttft') is not None:
+        table.add_row("time to first token", f"{stats['ttft'] * 1000:.1f} ms")
+    if stats.get('total') is not None:
+        table.add_row("total", f"{stats['total'] * 1000:.1f} ms")
+    if stats.get('tokens_per_s'):
+        table.add_row("tokens/s", f"{stats['tokens']} tokens, {stats['tokens_per_s']:.0f}/s")
+    for name, value in stats.get('counters', {}).items():
+        table.add_row(name, str(value))
+    histogram = {label: n for label, n in stats.get('inter_token_ms', {}).items() if n}
+    if histogram:
+        table.add_row("inter-token gaps", "  ".join(f"{label}: {n}" for label, n in histogram.items()))
+    console.print(table)
+
+
+def append_metrics(path: Union[str, Path], stats: Dict[str, Any]) -> None:
+    """
+    Append one stats record to a JSONL metrics log.
+
+    Args:
+        path: Log file (created if missing)
+        stats: RequestStats to record
+    """
+    record = {'timestamp': time.time(), **stats}
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
@@ -0,0 +1,234 @@
+"""Streaming SRT, WebVTT and JSON writers for transcripts.
+
+Segments are formatted in batches and written to a buffered file as they
+go, so a long transcript is never held as one document string. Timestamps
+for a whole batch are rounded, split and formatted at once with numpy
+array operations once a transcript is long enough to pay for the import
+(or numpy is already loaded), and in plain Python otherwise.
+"""
+
+import json
+import sys
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+# Segments formatted per write
+WRITE_BATCH = 2000
+
+# Buffer of the output file, so each batch is about one system call
+WRITE_BUFFER = 256 * 1024
+
+# Timestamps formatted in pure Python before importing numpy (about 0.1 s)
+# pays for itself; a process that already has numpy loaded uses it at once
+NUMPY_AFTER = 50_000
+
+_TWO_DIGITS = [f"{i:02d}" for i in range(100)]
+_THREE_DIGITS = [f"{i:03d}" for i in range(1000)]
+
+# Width of HH:MM:SS,mmm
+_STAMP_WIDTH = 12
+
+
+def _numpy(vectorise: Optional[bool]):
+    if vectorise is None:
+        return sys.modules.get('numpy')
+    if not vectorise:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _format_python(seconds: Sequence[float], decimal: str) -> List[str]:
+    two, three = _TWO_DIGITS, _THREE_DIGITS
+    formatted = []
+    for value in seconds:
+        # Rounded to the nearest millisecond; truncating turns 2.3 into 2.299
+        secs, ms = divmod(max(0, int(value * 1000 + 0.5)), 1000)
+        mins, secs = divmod(secs, 60)
+        hours, mins = divmod(mins, 60)
+        formatted.append(f"{hours:02d}:{two[mins]}:{two[secs]}{decimal}{three[ms]}")
+    return formatted
+
+
+def _format_numpy(np: Any, seconds: Sequence[float], decimal: str) -> Optional[List[str]]:
+    millis = np.maximum(np.floor(np.asarray(seconds, dtype=np.float64) * 1000 + 0.5), 0).astype(np.int64)
+    secs, ms = np.divmod(millis, 1000)
+    mins, secs = np.divmod(secs, 60)
+    hours, mins = np.divmod(mins, 60)
+    if len(hours) and hours.max() > 99:
+        # Wider than the fixed-size layout below
+        return None
+
+    # One row of ASCII codes per timestamp, digits filled in column by column
+    chars = np.empty((len(millis), _STAMP_WIDTH), dtype=np.uint8)
+    chars[:, 0], chars[:, 1] = np.divmod(hours, 10)
+    chars[:, 3], chars[:, 4] = np.divmod(mins, 10)
+    chars[:, 6], chars[:, 7] = np.divmod(secs, 10)
+    chars[:, 9], rest = np.divmod(ms, 100)
+    chars[:, 10], chars[:, 11] = np.divmod(rest, 10)
+    chars += ord('0')
+    chars[:, 2] = chars[:, 5] = ord(':')
+    chars[:, 8] = ord(decimal)
+    text = chars.tobytes().decode('ascii')
+    return [text[i:i + _STAMP_WIDTH] for i in range(0, len(text), _STAMP_WIDTH)]
+
+
+def format_timestamps(seconds: Sequence[float], decimal: str = ",", vectorise: Optional[bool] = None) -> List[str]:
+    """
+    Format many times as HH:MM:SS,mmm in one pass.
+
+    Args:
+        seconds: Times in seconds
+        decimal: Separator before the milliseconds (',' for SRT, '.' for WebVTT)
+        vectorise: Split and format with numpy (True), in Python (False),
+            or with numpy only if it is already imported (None)
+
+    Returns:
+        Formatted timestamps, in input order
+    """
+    np = _numpy(vectorise)
+    if np is not None:
+        formatted = _format_numpy(np, seconds, decimal)
+        if formatted is not None:
+            return formatted
+    return _format_python(seconds, decimal)
+
+
+def _batches(segments: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(segments)
+    while True:
+        batch = list(islice(iterator, WRITE_BATCH))
+        if not batch:
+            return
+        yield batch
+
+
+def _cues(batch: List[Dict[str, Any]], decimal: str, done: int) -> Iterator[Tuple[str, str, str]]:
+    times = format_timestamps(
+        [segment.get('start', 0) for segment in batch] + [segment.get('end', 0) for segment in batch],
+        decimal,
+        # Short transcripts are not worth the numpy import
+        vectorise=True if done * 2 >= NUMPY_AFTER else None
+    )
+    return zip(times[:len(batch)], times[len(batch):], (segment.get('text', '').strip() for segment in batch))
+
+
+def iter_srt(segments: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Yield an SRT document in blocks of cues.
+
+    Args:
+        segments: Segment dicts with start, end and text
+
+    Yields:
+        Consecutive pieces of the document
+    """
+    index = 0
+    for batch in _batches(segments):
+        parts = []
+        for start, end, text in _cues(batch, ",", index):
+            # Cues are separated by a blank line, with none after the last
+            separator = "\n" if index else ""
+            index += 1
+            parts.append(f"{separator}{index}\n{start} --> {end}\n{text}\n")
+        yield "".join(parts)
+
+
+def iter_vtt(segments: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Yield a WebVTT document in blocks of cues.
+
+    Args:
+        segments: Segment dicts with start, end and text
+
+    Yields:
+        Consecutive pieces of the document
+    """
+    yield "WEBVTT\n"
+    done = 0
+    for batch in _batches(segments):
+        yield "".join(f"\n{start} --> {end}\n{text}\n" for start, end, text in _cues(batch, ".", done))
+        done += len(batch)
+    if not done:
+        yield "\n"
+
+
+def _is_plain_json(value: Any) -> bool:
+    return isinstance(value, (dict, list, str, int, float, bool)) or value is None
+
+
+def iter_json(transcript_data: Mapping[str, Any]) -> Iterator[str]:
+    """
+    Yield a transcript as indented JSON, a few values at a time.
+
+    The output is the same as json.dumps(transcript_data, indent=2,
+    ensure_ascii=False), without building the document as one string.
+    Values that are other sequences (such as the rows of a Transcript)
+    are encoded in batches of items.
+
+    Args:
+        transcript_data: Transcript dict or mapping
+
+    Yields:
+        Consecutive pieces of the document
+    """
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    if isinstance(transcript_data, dict) and all(map(_is_plain_json, transcript_data.values())):
+        pieces = encoder.iterencode(transcript_data)
+        while True:
+            # The encoder yields every bracket and separator on its own
+            block = "".join(islice(pieces, WRITE_BATCH))
+            if not block:
+                return
+            yield block
+
+    if not transcript_data:
+        yield "{}"
+        return
+    yield "{"
+    for position, (key, value) in enumerate(transcript_data.items()):
+        yield ("," if position else "") + f"\n  {encoder.encode(str(key))}: "
+        if _is_plain_json(value):
+            yield encoder.encode(value).replace("\n", "\n  ")
+            continue
+        if not value:
+            yield "[]"
+            continue
+        for number, batch in enumerate(_batches(value)):
+            # "[\n  item,\n  item\n]" re-indented one level, without the brackets
+            items = encoder.encode(batch)[2:-2].replace("\n", "\n  ")
+            yield ("[\n  " if number == 0 else ",\n  ") + items
+        yield "\n  ]"
+    yield "\n}"
+
+
+def write_transcript(transcript_data: Mapping[str, Any], output_path: Union[str, Path], format: str) -> None:
+    """
+    Write a transcript in the given format through a buffered file.
+
+    Args:
+        transcript_data: Transcript dict or Transcript (text, and segments
+            for srt/vtt)
+        output_path: File to write
+        format: 'text', 'json', 'srt' or 'vtt'
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if format == "text":
+        pieces: Iterable[str] = [transcript_data.get('text', '')]
+    elif format == "json":
+        pieces = iter_json(transcript_data)
+    elif format == "srt":
+        pieces = iter_srt(transcript_data.get('segments', []))
+    elif format == "vtt":
+        pieces = iter_vtt(transcript_data.get('segments', []))
+    else:
+        raise ValueError(f"Unsupported format: {format}")
+
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER) as f:
+        f.writelines(pieces)
@@ -0,0 +1,157 @@
+"""Rolling summaries of old conversation turns, made in the background."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from rich.console import Console
+
+from groq_cli.history import SUMMARY_PREFIX, estimate_tokens
+
+console = Console()
+
+# Cheap, fast model for summaries; the conversation itself may use any model
+SUMMARY_MODEL = "llama-3.1-8b-instant"
+SUMMARY_MAX_TOKENS = 400
+
+# Start summarising once the verbatim history passes this many tokens;
+# below the history budget, so turns are summarised before they are evicted
+SUMMARY_TRIGGER_TOKENS = 2500
+
+# Most recent messages always kept verbatim (two exchanges)
+KEEP_RECENT_MESSAGES = 4
+
+SUMMARY_INSTRUCTIONS = (
+    "Update the running summary of a conversation with the new turns below. "
+    "Keep facts, decisions, names, numbers and open questions; drop pleasantries. "
+    "Write at most 200 words of plain prose."
+)
+
+
+class RollingSummarizer:
+    """
+    Folds the oldest turns of a chat history into a running summary.
+
+    Works through the completer's get_history/set_history. update() is
+    called after a turn; when the history is long it starts a summary
+    request on a background thread and returns at once. apply() is called
+    before the next turn and swaps the summarised turns for the summary if
+    the request has finished, so no turn ever waits on it.
+    """
+
+    def __init__(
+        self,
+        completer: Any,
+        model: str = SUMMARY_MODEL,
+        trigger_tokens: int = SUMMARY_TRIGGER_TOKENS,
+        keep_recent: int = KEEP_RECENT_MESSAGES
+    ):
+        """
+        Initialize the summarizer.
+
+        Args:
+            completer: ChatCompleter whose history is summarised; its client
+                makes the summary requests
+            model: Model for summary requests
+            trigger_tokens: Verbatim history size that starts a summary
+            keep_recent: Most recent messages never summarised
+        """
+        self.completer = completer
+        self.model = model
+        self.trigger_tokens = trigger_tokens
+        self.keep_recent = keep_recent
+        self.summaries = 0
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summary")
+        self._pending: Optional[Future] = None
+        self._folded: List[Dict[str, str]] = []
+
+    def update(self) -> bool:
+        """
+        Start a background summary if the history has grown past the trigger.
+
+        Returns:
+            True if a summary request was started
+        """
+        self.apply()
+        if self._pending is not None:
+            return False
+
+        system, summary, turns = self._split(self.completer.get_history())
+        old = turns[:-self.keep_recent] if self.keep_recent else turns
+        # Summarise whole exchanges so the kept turns start with a user message
+        if len(old) % 2 and old[-1]["role"] == "user":
+            old = old[:-1]
+        if not old or sum(estimate_tokens(m["content"]) for m in turns) <= self.trigger_tokens:
+            return False
+
+        self._folded = old
+        self._pending = self._executor.submit(self._summarize, summary, old)
+        return True
+
+    def apply(self) -> bool:
+        """
+        Replace summarised turns with the summary, if it is ready.
+
+        Never blocks. A failed summary request is dropped, and the turns
+        stay in the history (subject to normal token-budget eviction).
+
+        Returns:
+            True if the history was updated
+        """
+        if self._pending is None or not self._pending.done():
+            return False
+
+        future, folded = self._pending, self._folded
+        self._pending, self._folded = None, []
+        try:
+            summary = future.result()
+        except Exception as e:
+            console.print(f"[dim]Could not summarise earlier turns: {e}[/dim]")
+            return False
+
+        # Turns may have been evicted or added meanwhile; drop exactly the
+        # ones that were summarised
+        folded_ids = {id(message) for message in folded}
+        system, _, turns = self._split(self.completer.get_history())
+        history = [{"role": "system", "content": content} for content in (system, SUMMARY_PREFIX + summary) if content]
+        history.extend(message for message in turns if id(message) not in folded_ids)
+        self.completer.set_history(history)
+        self.summaries += 1
+        return True
+
+    def reset(self) -> None:
+        """Forget any in-flight summary, e.g. after the history is cleared."""
+        if self._pending is not None:
+            self._pending.cancel()
+        self._pending, self._folded = None, []
+
+    def close(self) -> None:
+        """Stop the background worker without waiting for it."""
+        self.reset()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _split(self, messages: List[Dict[str, str]]):
+        system, summary, turns = None, None, []
+        for message in messages:
+            if message["role"] != "system":
+                turns.append(message)
+            elif message["content"].startswith(SUMMARY_PREFIX):
+                summary = message["content"][len(SUMMARY_PREFIX):]
+            else:
+                system = message["content"]
+        return system, summary, turns
+
+    def _summarize(self, previous: Optional[str], turns: List[Dict[str, str]]) -> str:
+        transcript = "\n\n".join(f"{m['role'].upper()}: {m['content']}" for m in turns)
+        prompt = f"Current summary:\n{previous or '(none)'}\n\nNew turns:\n{transcript}"
+        with self.completer.rate_limiter.slot(tokens=estimate_tokens(prompt)):
+            response = self.completer.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": SUMMARY_INSTRUCTIONS},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.2,
+                max_tokens=SUMMARY_MAX_TOKENS
+            )
+        return response.choices[0].message.content.strip()
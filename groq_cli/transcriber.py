@@ -1,18 +1,42 @@
 """Whisper transcription module for Groq API."""
 
+import io
 import os
-import json
+import sqlite3
+import subprocess
+import tempfile
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, Any, Literal
-from groq import Groq, GroqError, RateLimitError, APIError
+from typing import Optional, Dict, Any, List, Literal, Tuple, Union
+from groq import DefaultHttpxClient, Groq, GroqError, RateLimitError, APIError
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
 
+from groq_cli.cache import TranscriptionCache
+from groq_cli.index import TranscriptIndex
+from groq_cli.manifest import JobManifest
+from groq_cli.audio import (
+    CHUNK_OVERLAP, extract_chunk, get_audio_duration, max_chunk_seconds, plan_chunks, reencode_audio
+)
+from groq_cli.ratelimit import RateLimiter, shared_limiter
+from groq_cli.retry import LatencyTracker, RetryPolicy, hedged_call
+from groq_cli.stats import RequestStats
+from groq_cli.subtitles import iter_srt, iter_vtt, write_transcript
+from groq_cli.transcript import Transcript
+from groq_cli.utils import DEFAULT_WORKERS, format_file_size
+from groq_cli.vad import TimelineMap, trim_silence
+
 console = Console()
 
 # Supported audio formats
 SUPPORTED_FORMATS = {'.flac', '.mp3', '.mp4', '.mpeg', '.mpga', '.m4a', '.ogg', '.wav', '.webm'}
 
+# Formats that always shrink when re-encoded to 16 kHz mono FLAC
+LOSSLESS_FORMATS = {'.wav', '.flac'}
+
 # File size limits in MB
 FILE_SIZE_LIMITS = {
     'free': 25,
@@ -21,31 +45,95 @@ FILE_SIZE_LIMITS = {
 
 ResponseFormat = Literal["json", "text", "verbose_json", "srt", "vtt"]
 
+
+class _TimedFile(io.BufferedReader):
+    """Audio file that notes when it was last read, i.e. when the upload body was fully sent."""
+
+    def __init__(self, path: Path):
+        super().__init__(io.FileIO(path, 'rb'))
+        self.last_read: Optional[float] = None
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        data = super().read(size)
+        self.last_read = time.perf_counter()
+        return data
+
+
 class WhisperTranscriber:
     """Handles audio transcription using Groq's Whisper API."""
 
-    def __init__(self, api_key: Optional[str] = None, tier: str = 'free'):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        tier: str = 'free',
+        cache: Optional[TranscriptionCache] = None,
+        http_client: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge: bool = False,
+        index: Optional[TranscriptIndex] = None,
+        jobs_dir: Optional[Path] = None,
+        resume: bool = True
+    ):
         """
         Initialize the transcriber with API credentials.
 
         Args:
             api_key: Groq API key (defaults to GROQ_API_KEY env var)
             tier: Account tier ('free' or 'developer')
+            cache: Optional cache of previous transcriptions
+            http_client: Optional httpx.Client to share a connection pool
+            rate_limiter: Limiter for this transcriber's requests (defaults
+                to the process-wide one)
+            retry_policy: Retry policy for failed requests
+            hedge: Send a duplicate of any request that runs past the p95
+                latency of earlier ones, and keep whichever finishes first
+            index: Optional search index fed with each finished transcript
+            jobs_dir: Directory for checkpoint manifests of chunked jobs, so
+                an interrupted file resumes from its finished chunks (None
+                disables checkpointing)
+            resume: Reuse finished chunks from an earlier run (False starts over)
         """
         self.api_key = api_key or os.environ.get('GROQ_API_KEY')
         if not self.api_key:
             raise ValueError("API key required. Set GROQ_API_KEY or pass api_key parameter.")
 
-        self.client = Groq(api_key=self.api_key)
+        self.rate_limiter = rate_limiter or shared_limiter()
+        http_client = self.rate_limiter.attach(http_client or DefaultHttpxClient())
+        # Response headers arrive in the requesting thread; their time splits
+        # server processing from downloading and parsing the body
+        self._response_seen = threading.local()
+        hooks = http_client.event_hooks
+        hooks.setdefault('response', []).append(self._note_response)
+        http_client.event_hooks = hooks
+        # Retries are handled by retry_policy, which honours retry-after
+        self.client = Groq(api_key=self.api_key, http_client=http_client, max_retries=0)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.hedge = hedge
+        # Seconds per uploaded MB, across every request this transcriber makes
+        self.latency = LatencyTracker()
         self.tier = tier
         self.max_file_size = FILE_SIZE_LIMITS.get(tier, 25) * 1024 * 1024  # Convert to bytes
-
-    def validate_file(self, file_path: Path) -> None:
+        self.cache = cache
+        self.index = index
+        self.jobs_dir = jobs_dir
+        self.resume = resume
+        # Stats of the most recent transcribe call (also on dict results)
+        self.last_stats: Optional[RequestStats] = None
+        # Whether the most recent transcribe call checkpointed chunks that a
+        # later call can resume from
+        self.last_checkpointed = False
+
+    def _note_response(self, response: Any) -> None:
+        self._response_seen.at = time.perf_counter()
+
+    def validate_file(self, file_path: Path, check_size: bool = True) -> None:
         """
         Validate audio file format and size.
 
         Args:
             file_path: Path to the audio file
+            check_size: Reject files over the tier size limit
 
         Raises:
             ValueError: If file is invalid
@@ -62,7 +150,7 @@ class WhisperTranscriber:
 
         # Check file size
         file_size = file_path.stat().st_size
-        if file_size > self.max_file_size:
+        if check_size and file_size > self.max_file_size:
             size_mb = file_size / (1024 * 1024)
             max_mb = self.max_file_size / (1024 * 1024)
             raise ValueError(
@@ -77,11 +165,20 @@ class WhisperTranscriber:
         language: Optional[str] = None,
         response_format: ResponseFormat = "verbose_json",
         temperature: float = 0.0,
-        include_timestamps: bool = True
+        include_timestamps: bool = True,
+        chunk_oversized: bool = True,
+        workers: int = DEFAULT_WORKERS,
+        quiet: bool = False,
+        preprocess: Optional[bool] = False,
+        trim_silence: bool = False,
+        compact: bool = False
     ) -> Dict[str, Any]:
         """
         Transcribe an audio file using Groq's Whisper API.
 
+        Files over the tier size limit are split into overlapping chunks
+        and the results stitched back together.
+
         Args:
             file_path: Path to the audio file
             model: Whisper model to use
@@ -89,19 +186,196 @@ class WhisperTranscriber:
             response_format: Output format
             temperature: Sampling temperature (0-1)
             include_timestamps: Include word/segment timestamps
+            chunk_oversized: Split files over the size limit instead of rejecting them
+            workers: Number of chunks to transcribe concurrently
+            quiet: Suppress progress display and status messages
+            preprocess: Re-encode to 16 kHz mono locally before uploading
+                (None re-encodes lossless formats only)
+            trim_silence: Cut long silences before upload and cut chunks at
+                silences; timestamps are mapped back to the original audio
+            compact: Return verbose_json results as a columnar Transcript
+                (a read-only mapping with the same keys) instead of a dict
 
         Returns:
-            Transcription response dictionary
+            Transcription response dictionary, with request stats under
+            'stats' (plain-text results have them on last_stats only)
         """
         file_path = Path(file_path).resolve()
-        self.validate_file(file_path)
+        stats = RequestStats('transcription', model=model, file=file_path.name)
+        self.last_stats = stats
+        self.last_checkpointed = False
+        if preprocess is None:
+            preprocess = file_path.suffix.lower() in LOSSLESS_FORMATS
+
+        # A file over the limit may still fit once re-encoded
+        with stats.phase('read'):
+            self.validate_file(file_path, check_size=not (chunk_oversized or preprocess))
 
         # Prepare timestamp granularities if needed
         timestamp_granularities = None
         if include_timestamps and response_format == "verbose_json":
             timestamp_granularities = ["word", "segment"]
 
-        console.print(f"[blue]Transcribing {file_path.name} using {model}...[/blue]")
+        cache_key = None
+        if self.cache is not None:
+            # Hashing reads the whole file
+            with stats.phase('read'):
+                cache_key = self.cache.make_key(file_path, {
+                    "model": model,
+                    "language": language,
+                    "temperature": temperature,
+                    "response_format": response_format,
+                    "timestamp_granularities": timestamp_granularities,
+                    "preprocess": preprocess,
+                    "trim_silence": trim_silence
+                })
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if not quiet:
+                    console.print(f"[green]✓ Loaded transcription of {file_path.name} from cache[/green]")
+                stats.count('cache_hits')
+                self._add_to_index(file_path, cached, response_format)
+                return self._with_stats(self._compact(cached) if compact else cached, stats)
+
+        with tempfile.TemporaryDirectory(prefix="groq_upload_") as tmp_dir:
+            upload_path = file_path
+            timeline = None
+            if trim_silence:
+                with stats.phase('trim'):
+                    upload_path, timeline = self._trim_silence(file_path, Path(tmp_dir), quiet=quiet)
+            if preprocess:
+                with stats.phase('preprocess'):
+                    upload_path = self._preprocess(upload_path, Path(tmp_dir), quiet=quiet)
+
+            # Timestamps are needed to map a trimmed transcript back
+            request_format = "verbose_json" if timeline else response_format
+
+            if upload_path.stat().st_size > self.max_file_size:
+                if not chunk_oversized:
+                    self.validate_file(upload_path)
+                result = self._transcribe_chunked(
+                    upload_path,
+                    model=model,
+                    language=language,
+                    response_format=request_format,
+                    temperature=temperature,
+                    include_timestamps=include_timestamps,
+                    workers=workers,
+                    quiet=quiet,
+                    cut_points=timeline.joins if timeline else None,
+                    stats=stats,
+                    manifest=self._chunk_manifest(file_path, {
+                        'model': model,
+                        'language': language,
+                        'temperature': temperature,
+                        'include_timestamps': include_timestamps,
+                        'preprocess': preprocess,
+                        'trim_silence': trim_silence
+                    })
+                )
+            else:
+                result = self._transcribe_single(
+                    upload_path,
+                    model=model,
+                    language=language,
+                    response_format=request_format,
+                    temperature=temperature,
+                    timestamp_granularities=timestamp_granularities or (["segment"] if timeline else None),
+                    quiet=quiet,
+                    stats=stats
+                )
+
+        if timeline:
+            result = timeline.remap_transcript(result)
+            result['duration'] = timeline.original_duration
+            result = self._format_result(result, response_format)
+
+        if cache_key:
+            self.cache.put(cache_key, result)
+        self._add_to_index(file_path, result, response_format)
+        if compact:
+            result = self._compact(result)
+        return self._with_stats(result, stats)
+
+    def _chunk_manifest(self, file_path: Path, params: Dict[str, Any]) -> Optional[JobManifest]:
+        """Open the checkpoint manifest for chunking a file, if checkpointing is on."""
+        if self.jobs_dir is None:
+            return None
+        stat = file_path.stat()
+        # A modified file is a different job
+        params = {'file': str(file_path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, **params}
+        manifest = JobManifest.open('chunks', params, jobs_dir=self.jobs_dir, fresh=not self.resume)
+        self.last_checkpointed = self.resume
+        return manifest
+
+    def _add_to_index(self, file_path: Path, result: Any, response_format: ResponseFormat) -> None:
+        # Subtitle strings are not indexed; an index failure never loses the transcript
+        if self.index is None or response_format in ("srt", "vtt"):
+            return
+        try:
+            self.index.add(file_path, result)
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Could not index {file_path.name}: {e}[/yellow]")
+
+    def _compact(self, result: Any) -> Any:
+        # Only timestamped results have rows worth storing as columns
+        if isinstance(result, dict) and ('segments' in result or 'words' in result):
+            return Transcript.from_dict(result)
+        return result
+
+    def _with_stats(self, result: Any, stats: RequestStats) -> Any:
+        # A copy, so the cached or merged dict is never mutated
+        stats.finish()
+        if isinstance(result, Transcript):
+            return result.replace(stats=stats)
+        if isinstance(result, dict):
+            return {**result, 'stats': stats}
+        return result
+
+    def _preprocess(self, file_path: Path, dest_dir: Path, quiet: bool = False) -> Path:
+        """
+        Re-encode a file to 16 kHz mono before upload.
+
+        Falls back to the original file when no local encoder can handle it
+        or when re-encoding would not make the upload smaller.
+        """
+        original_size = file_path.stat().st_size
+        started = time.perf_counter()
+        try:
+            encoded = reencode_audio(file_path, dest_dir)
+        except (ImportError, ValueError, wave.Error, subprocess.CalledProcessError) as e:
+            if not quiet:
+                console.print(f"[dim]Skipping preprocessing: {e}[/dim]")
+            return file_path
+        elapsed = time.perf_counter() - started
+
+        encoded_size = encoded.stat().st_size
+        if encoded_size >= original_size:
+            if not quiet:
+                console.print(f"[dim]Preprocessing would not shrink {file_path.name}; uploading original[/dim]")
+            return file_path
+
+        if not quiet:
+            console.print(
+                f"[dim]Preprocessed: {format_file_size(original_size)} → {format_file_size(encoded_size)} "
+                f"(saved {format_file_size(original_size - encoded_size)}) in {elapsed:.2f}s[/dim]"
+            )
+        return encoded
+
+    def _transcribe_single(
+        self,
+        file_path: Path,
+        model: str,
+        language: Optional[str],
+        response_format: ResponseFormat,
+        temperature: float,
+        timestamp_granularities: Optional[List[str]],
+        quiet: bool = False,
+        stats: Optional[RequestStats] = None
+    ) -> Any:
+        """Transcribe a file that fits in one request."""
+        if not quiet:
+            console.print(f"[blue]Transcribing {file_path.name} using {model}...[/blue]")
 
         try:
             with Progress(
@@ -109,42 +383,25 @@ class WhisperTranscriber:
                 TextColumn("[progress.description]{task.description}"),
                 BarColumn(),
                 TimeRemainingColumn(),
-                console=console
+                console=console,
+                disable=quiet
             ) as progress:
                 task = progress.add_task("Uploading and processing...", total=None)
 
-                with open(file_path, "rb") as audio_file:
-                    # Create transcription request
-                    params = {
-                        "file": (file_path.name, audio_file.read()),
-                        "model": model,
-                        "response_format": response_format,
-                        "temperature": temperature
-                    }
-
-                    if language:
-                        params["language"] = language
-
-                    if timestamp_granularities:
-                        params["timestamp_granularities"] = timestamp_granularities
-
-                    transcription = self.client.audio.transcriptions.create(**params)
+                result = self._request_transcription(
+                    file_path,
+                    model=model,
+                    language=language,
+                    response_format=response_format,
+                    temperature=temperature,
+                    timestamp_granularities=timestamp_granularities,
+                    stats=stats
+                )
 
                 progress.update(task, completed=True)
 
-            # Convert response to dictionary if needed
-            if hasattr(transcription, 'model_dump'):
-                result = transcription.model_dump()
-            elif hasattr(transcription, 'text'):
-                # It's a transcription object with text attribute
-                result = {'text': transcription.text}
-            elif isinstance(transcription, str):
-                # It's just a string
-                result = transcription
-            else:
-                result = transcription
-
-            console.print("[green]✓ Transcription completed successfully![/green]")
+            if not quiet:
+                console.print("[green]✓ Transcription completed successfully![/green]")
             return result
 
         except RateLimitError as e:
@@ -157,9 +414,276 @@ class WhisperTranscriber:
             console.print(f"[red]Unexpected error: {e}[/red]")
             raise
 
+    def _request_transcription(
+        self,
+        file_path: Path,
+        model: str,
+        language: Optional[str],
+        response_format: ResponseFormat,
+        temperature: float,
+        timestamp_granularities: Optional[List[str]],
+        audio_seconds: Optional[float] = None,
+        stats: Optional[RequestStats] = None
+    ) -> Any:
+        """Send a single file to the transcription endpoint, with retries and optional hedging."""
+        if audio_seconds is None:
+            audio_seconds = self._audio_seconds(file_path)
+
+        def send() -> Tuple[Any, Dict[str, float]]:
+            if stats is not None:
+                stats.count('attempts')
+            queued = time.perf_counter()
+            with _TimedFile(file_path) as audio_file, self.rate_limiter.slot(audio_seconds=audio_seconds):
+                # Pass the open handle so the multipart body is streamed from disk
+                # in small blocks instead of being read into memory first
+                params = {
+                    "file": (file_path.name, audio_file),
+                    "model": model,
+                    "response_format": response_format,
+                    "temperature": temperature
+                }
+
+                if language:
+                    params["language"] = language
+
+                if timestamp_granularities:
+                    params["timestamp_granularities"] = timestamp_granularities
+
+                sent = time.perf_counter()
+                self._response_seen.at = None
+                transcription = self.client.audio.transcriptions.create(**params)
+                returned = time.perf_counter()
+
+            uploaded = audio_file.last_read or sent
+            headers = self._response_seen.at
+            if headers is None or not uploaded <= headers <= returned:
+                headers = returned
+            return transcription, {
+                'queue': sent - queued,
+                'upload': uploaded - sent,
+                'server': headers - uploaded,
+                'parse': returned - headers
+            }
+
+        # Transcription has no side effects, so every transient error is retried
+        if self.hedge:
+            size_mb = file_path.stat().st_size / (1024 * 1024)
+            transcription, timings = self.retry_policy.call(lambda: hedged_call(send, self.latency, units=size_mb))
+        else:
+            transcription, timings = self.retry_policy.call(send)
+
+        parse_started = time.perf_counter()
+        # Convert response to dictionary if needed
+        if hasattr(transcription, 'model_dump'):
+            transcription = transcription.model_dump()
+        elif hasattr(transcription, 'text'):
+            # It's a transcription object with text attribute
+            transcription = {'text': transcription.text}
+        # Otherwise a plain string (text/srt/vtt) or an already-decoded dict
+
+        if stats is not None:
+            timings['parse'] += time.perf_counter() - parse_started
+            for phase, seconds in timings.items():
+                stats.add(phase, seconds)
+            stats.count('requests')
+        return transcription
+
+    def _audio_seconds(self, file_path: Path) -> float:
+        """Duration to charge against an audio quota, if one is known."""
+        if not self.rate_limiter.limits('audio_seconds'):
+            return 0.0
+        try:
+            return get_audio_duration(file_path)
+        except Exception:
+            return 0.0
+
+    def _transcribe_chunked(
+        self,
+        file_path: Path,
+        model: str,
+        language: Optional[str],
+        response_format: ResponseFormat,
+        temperature: float,
+        include_timestamps: bool,
+        workers: int = DEFAULT_WORKERS,
+        quiet: bool = False,
+        cut_points: Optional[List[float]] = None,
+        stats: Optional[RequestStats] = None,
+        manifest: Optional[JobManifest] = None
+    ) -> Any:
+        """
+        Transcribe an oversized file as overlapping chunks and merge the results.
+
+        With a manifest, each finished chunk is checkpointed as it arrives and
+        chunks finished by an earlier run are loaded instead of re-sent.
+        """
+        duration = get_audio_duration(file_path)
+        chunk_seconds = max_chunk_seconds(file_path, self.max_file_size)
+        # Low-bitrate limits can force short chunks; keep the overlap proportional
+        overlap = min(CHUNK_OVERLAP, chunk_seconds / 4)
+        chunks = plan_chunks(duration, chunk_seconds=chunk_seconds, overlap=overlap, cut_points=cut_points)
+
+        # Chunks are always fetched as verbose_json so the overlap can be resolved
+        timestamp_granularities = ["segment"]
+        if include_timestamps:
+            timestamp_granularities.insert(0, "word")
+
+        workers = max(1, min(workers, len(chunks)))
+        if not quiet:
+            console.print(
+                f"[blue]Transcribing {file_path.name} in {len(chunks)} chunks "
+                f"using {model} ({workers} workers)...[/blue]"
+            )
+
+        def chunk_key(start: float, end: float) -> str:
+            return f"{start:.3f}-{end:.3f}"
+
+        def transcribe_chunk(start: float, end: float, tmp_dir: Path) -> Any:
+            started = time.perf_counter()
+            chunk_path = extract_chunk(file_path, start, end, tmp_dir)
+            if stats is not None:
+                stats.add('read', time.perf_counter() - started)
+            try:
+                result = self._request_transcription(
+                    chunk_path,
+                    model=model,
+                    language=language,
+                    response_format="verbose_json",
+                    temperature=temperature,
+                    timestamp_granularities=timestamp_granularities,
+                    audio_seconds=end - start,
+                    stats=stats
+                )
+                # Checkpointed from the worker, so chunks still in flight on
+                # Ctrl-C are kept once they finish
+                if manifest is not None:
+                    manifest.save_result(chunk_key(start, end), result)
+                return result
+            finally:
+                # A hedged duplicate may still have the file open; the temp
+                # directory cleanup removes it in that case
+                try:
+                    chunk_path.unlink()
+                except OSError:
+                    pass
+
+        chunk_results: List[Any] = [None] * len(chunks)
+        pending = list(range(len(chunks)))
+        if manifest is not None:
+            for index, (start, end) in enumerate(chunks):
+                result = manifest.load_result(chunk_key(start, end))
+                if result is not None:
+                    chunk_results[index] = (start, end, self._compact(result))
+            pending = [index for index, result in enumerate(chunk_results) if result is None]
+            if stats is not None and len(pending) < len(chunks):
+                stats.count('resumed_chunks', len(chunks) - len(pending))
+            if not quiet and len(pending) < len(chunks):
+                console.print(f"[dim]Resuming: {len(chunks) - len(pending)} of {len(chunks)} chunks already done[/dim]")
+
+        try:
+            with tempfile.TemporaryDirectory(prefix="groq_chunks_") as tmp_dir, Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TimeRemainingColumn(),
+                console=console,
+                disable=quiet
+            ) as progress:
+                task = progress.add_task("Uploading and processing chunks...", total=len(chunks), completed=len(chunks) - len(pending))
+
+                # Every worker shares self.client and its connection pool
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="groq-chunk")
+                try:
+                    futures = {
+                        executor.submit(transcribe_chunk, *chunks[index], Path(tmp_dir)): index
+                        for index in pending
+                    }
+                    for future in as_completed(futures):
+                        index = futures[future]
+                        start, end = chunks[index]
+                        # Held as columns while the remaining chunks are in flight
+                        chunk_results[index] = (start, end, self._compact(future.result()))
+                        progress.advance(task)
+                finally:
+                    # Don't keep uploading the remaining chunks after a failure
+                    executor.shutdown(wait=True, cancel_futures=True)
+
+        except RateLimitError:
+            console.print("[red]Rate limit exceeded. Please wait and try again.[/red]")
+            raise
+        except APIError as e:
+            console.print(f"[red]API Error: {e}[/red]")
+            raise
+        except Exception as e:
+            console.print(f"[red]Unexpected error: {e}[/red]")
+            raise
+
+        merged = merge_chunk_transcripts(chunk_results)
+        merged['duration'] = duration
+        if manifest is not None:
+            manifest.remove()
+
+        if not quiet:
+            console.print("[green]✓ Transcription completed successfully![/green]")
+
+        return self._format_result(merged, response_format)
+
+    def _format_result(self, transcript_data: Dict[str, Any], response_format: ResponseFormat) -> Any:
+        """Shape a locally assembled verbose_json transcript like the API would for response_format."""
+        if response_format == "text":
+            return transcript_data['text']
+        if response_format == "json":
+            return {'text': transcript_data['text']}
+        if response_format == "srt":
+            return self._convert_to_srt(transcript_data)
+        if response_format == "vtt":
+            return self._convert_to_vtt(transcript_data)
+        return transcript_data
+
+    def _trim_silence(self, file_path: Path, dest_dir: Path, quiet: bool = False) -> Tuple[Path, Optional[TimelineMap]]:
+        """
+        Cut long silences out of a file before upload.
+
+        Falls back to the original file when the audio cannot be decoded
+        locally, there is little silence to remove, or the trimmed audio
+        would be a larger upload than the (compressed) source.
+        """
+        started = time.perf_counter()
+        try:
+            trimmed, timeline = trim_silence(file_path, dest_dir)
+        except (ImportError, ValueError, wave.Error) as e:
+            if not quiet:
+                console.print(f"[dim]Skipping silence trimming: {e}[/dim]")
+            return file_path, None
+
+        if trimmed is None:
+            if not quiet:
+                console.print(f"[dim]No long silences found in {file_path.name}[/dim]")
+            return file_path, None
+
+        original_size = file_path.stat().st_size
+        if trimmed.stat().st_size >= original_size:
+            # The trimmed copy is 16-bit PCM, often larger than an mp3 or m4a source
+            try:
+                trimmed = reencode_audio(trimmed, dest_dir)
+            except (ImportError, ValueError, wave.Error, subprocess.CalledProcessError):
+                pass
+            if trimmed.stat().st_size >= original_size:
+                if not quiet:
+                    console.print(f"[dim]Trimming would not shrink {file_path.name}; uploading original[/dim]")
+                return file_path, None
+
+        if not quiet:
+            removed = timeline.original_duration - timeline.trimmed_duration
+            console.print(
+                f"[dim]Trimmed {removed:.1f}s of silence "
+                f"({removed / timeline.original_duration:.0%}) in {time.perf_counter() - started:.2f}s[/dim]"
+            )
+        return trimmed, timeline
+
     def save_transcript(
         self,
-        transcript_data: Dict[str, Any],
+        transcript_data: Union[Dict[str, Any], Transcript],
         output_path: Optional[Path] = None,
         format: str = "text"
     ) -> Path:
@@ -167,99 +691,97 @@ class WhisperTranscriber:
         Save transcription to a file.
 
         Args:
-            transcript_data: Transcription response data
+            transcript_data: Transcription response data (dict or Transcript)
             output_path: Optional output file path
             format: Output format ('text', 'json', 'srt', 'vtt')
 
         Returns:
             Path to saved file
         """
+        started = time.perf_counter()
+        stats = transcript_data.get('stats')
+        if isinstance(transcript_data, Transcript):
+            transcript_data = transcript_data.replace(stats=None)
+        elif 'stats' in transcript_data:
+            transcript_data = {key: value for key, value in transcript_data.items() if key != 'stats'}
+
         if output_path is None:
             output_path = Path(f"transcript.{format if format != 'text' else 'txt'}")
 
         output_path = Path(output_path).resolve()
 
-        if format == "text":
-            # Save plain text
-            text = transcript_data.get('text', '')
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(text)
-
-        elif format == "json":
-            # Save full JSON response
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(transcript_data, f, indent=2, ensure_ascii=False)
-
-        elif format == "srt":
-            # Convert to SRT format
-            srt_content = self._convert_to_srt(transcript_data)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(srt_content)
-
-        elif format == "vtt":
-            # Convert to WebVTT format
-            vtt_content = self._convert_to_vtt(transcript_data)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(vtt_content)
+        # Streamed in batches of segments rather than built as one string
+        write_transcript(transcript_data, output_path, format)
 
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        if isinstance(stats, RequestStats):
+            stats.add('write', time.perf_counter() - started)
 
         console.print(f"[green]Transcript saved to: {output_path}[/green]")
         return output_path
 
     def _convert_to_srt(self, transcript_data: Dict[str, Any]) -> str:
         """Convert transcript to SRT subtitle format."""
-        segments = transcript_data.get('segments', [])
-        if not segments:
-            return ""
+        return "".join(iter_srt(transcript_data.get('segments', [])))
 
-        srt_lines = []
-        for i, segment in enumerate(segments, 1):
-            start_time = self._seconds_to_srt_time(segment.get('start', 0))
-            end_time = self._seconds_to_srt_time(segment.get('end', 0))
-            text = segment.get('text', '').strip()
+    def _convert_to_vtt(self, transcript_data: Dict[str, Any]) -> str:
+        """Convert transcript to WebVTT subtitle format."""
+        return "".join(iter_vtt(transcript_data.get('segments', [])))
 
-            srt_lines.append(f"{i}")
-            srt_lines.append(f"{start_time} --> {end_time}")
-            srt_lines.append(text)
-            srt_lines.append("")  # Empty line between subtitles
 
-        return "\n".join(srt_lines)
+def merge_chunk_transcripts(chunk_results: List[Tuple[float, float, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Stitch verbose_json results from overlapping chunks into one transcript.
 
-    def _convert_to_vtt(self, transcript_data: Dict[str, Any]) -> str:
-        """Convert transcript to WebVTT subtitle format."""
-        segments = transcript_data.get('segments', [])
-        if not segments:
-            return "WEBVTT\n\n"
-
-        vtt_lines = ["WEBVTT", ""]
-        for segment in segments:
-            start_time = self._seconds_to_vtt_time(segment.get('start', 0))
-            end_time = self._seconds_to_vtt_time(segment.get('end', 0))
-            text = segment.get('text', '').strip()
-
-            vtt_lines.append(f"{start_time} --> {end_time}")
-            vtt_lines.append(text)
-            vtt_lines.append("")  # Empty line between subtitles
-
-        return "\n".join(vtt_lines)
-
-    def _seconds_to_srt_time(self, seconds: float) -> str:
-        """Convert seconds to SRT time format (HH:MM:SS,mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
-
-    def _seconds_to_vtt_time(self, seconds: float) -> str:
-        """Convert seconds to WebVTT time format (HH:MM:SS.mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+    Timestamps are shifted by each chunk's offset. Inside an overlap, the
+    earlier chunk owns everything before the midpoint and the later chunk
+    owns everything after it, so words heard by both are kept only once.
+
+    Args:
+        chunk_results: List of (start, end, result) tuples in timeline order
+
+    Returns:
+        Merged verbose_json style dictionary
+    """
+    segments = []
+    words = []
+    texts = []
+    language = None
+
+    for i, (start, end, result) in enumerate(chunk_results):
+        lower = (start + chunk_results[i - 1][1]) / 2 if i > 0 else float('-inf')
+        upper = (chunk_results[i + 1][0] + end) / 2 if i < len(chunk_results) - 1 else float('inf')
+
+        if isinstance(result, str):
+            result = {'text': result}
+        language = language or result.get('language')
+        texts.append(result.get('text', '').strip())
+
+        for segment in result.get('segments') or []:
+            shifted = dict(segment)
+            shifted['start'] = segment.get('start', 0) + start
+            shifted['end'] = segment.get('end', 0) + start
+            if lower <= shifted['start'] < upper:
+                shifted['id'] = len(segments)
+                segments.append(shifted)
+
+        for word in result.get('words') or []:
+            shifted = dict(word)
+            shifted['start'] = word.get('start', 0) + start
+            shifted['end'] = word.get('end', 0) + start
+            if lower <= shifted['start'] < upper:
+                words.append(shifted)
+
+    if segments:
+        text = "".join(segment.get('text', '') for segment in segments).strip()
+    else:
+        text = " ".join(t for t in texts if t)
+
+    merged = {'text': text, 'segments': segments}
+    if words:
+        merged['words'] = words
+    if language:
+        merged['language'] = language
+    return merged
 
 
 # Convenience function for quick transcription
@@ -0,0 +1,306 @@
+"""Compact columnar storage for verbose_json transcripts.
+
+The API returns one dict per segment and per word. A Transcript keeps
+each field as a column instead: numbers in ``array`` arrays, strings in
+one interned text buffer shared by segments and words, and token lists
+flattened into a single array. Rows are rebuilt as dicts only when they
+are read, so existing code that expects the verbose_json dict keeps
+working against the Mapping view.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from groq_cli.subtitles import write_transcript
+
+# Item lists stored as columns; every other key is kept as-is
+ROW_KEYS = ('segments', 'words')
+
+_MISSING = object()
+
+
+class _TextBuffer:
+    """Strings stored once each in a single buffer, addressed by (offset, length)."""
+
+    def __init__(self):
+        self.text = ""
+        self._parts: List[str] = []
+        self._size = 0
+        self._offsets: Dict[str, int] = {}
+
+    def add(self, value: str) -> int:
+        offset = self._offsets.get(value)
+        if offset is None:
+            offset = self._offsets[value] = self._size
+            self._parts.append(value)
+            self._size += len(value)
+        return offset
+
+    def freeze(self) -> "_TextBuffer":
+        # The lookup table is only needed while building
+        self.text = "".join(self._parts)
+        self._parts = []
+        self._offsets = {}
+        return self
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _build_column(values: List[Any], buffer: _TextBuffer) -> Tuple[str, Any]:
+    """Pick the most compact storage that round-trips every value."""
+    if all(_is_int(v) for v in values):
+        return 'int', array('q', values)
+    if all(isinstance(v, float) for v in values):
+        # Mixed ints and floats are kept as objects, so 1 does not come back as 1.0
+        return 'float', array('d', values)
+    if all(isinstance(v, str) for v in values):
+        offsets = array('q', (buffer.add(v) for v in values))
+        return 'text', (offsets, array('q', map(len, values)))
+    if all(isinstance(v, list) and all(_is_int(x) for x in v) for v in values):
+        bounds = array('q', [0])
+        flat = array('q')
+        for v in values:
+            flat.extend(v)
+            bounds.append(len(flat))
+        return 'ints', (flat, bounds)
+    # Mixed, nested or missing in some rows
+    return 'object', values
+
+
+class Rows(Sequence):
+    """
+    Read-only sequence of segment or word dicts stored column by column.
+
+    Indexing builds the dict for one row; slicing returns another Rows.
+    column() gives the underlying arrays for vectorised work, e.g.
+    ``numpy.frombuffer(rows.column('start'))`` without a copy.
+    """
+
+    def __init__(self, columns: Dict[str, Tuple[str, Any]], length: int, buffer: _TextBuffer):
+        self._columns = columns
+        self._length = length
+        self._buffer = buffer
+        self._sorted: Optional[bool] = None
+
+    @classmethod
+    def from_items(cls, items: Iterable[Dict[str, Any]], buffer: _TextBuffer) -> "Rows":
+        """Build columns from dicts; the caller freezes the buffer afterwards."""
+        items = list(items)
+        keys: Dict[str, None] = {}
+        for item in items:
+            keys.update(dict.fromkeys(item))
+        columns = {key: _build_column([item.get(key, _MISSING) for item in items], buffer) for key in keys}
+        return cls(columns, len(items), buffer)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._take(range(self._length)[index])
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("row index out of range")
+        row = {}
+        for key, (kind, data) in self._columns.items():
+            value = self._value(kind, data, index)
+            if value is not _MISSING:
+                row[key] = value
+        return row
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self[i] for i in range(self._length))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (Rows, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def _value(self, kind: str, data: Any, index: int) -> Any:
+        if kind == 'text':
+            offset = data[0][index]
+            return self._buffer.text[offset:offset + data[1][index]]
+        if kind == 'ints':
+            flat, bounds = data
+            return flat[bounds[index]:bounds[index + 1]].tolist()
+        return data[index]
+
+    def column(self, key: str) -> Union[array, List[Any]]:
+        """
+        Get a numeric column, or the values of any other column as a list.
+
+        Args:
+            key: Field name ('start', 'end', 'avg_logprob', ...)
+
+        Returns:
+            The stored array for int and float columns, otherwise a list
+        """
+        kind, data = self._columns[key]
+        if kind in ('int', 'float'):
+            return data
+        return [self._value(kind, data, i) for i in range(self._length)]
+
+    def keys(self) -> List[str]:
+        """Field names present in at least one row."""
+        return list(self._columns)
+
+    def _take(self, indices: range) -> "Rows":
+        """Rows at a range of indices; contiguous ranges slice the arrays."""
+        if indices.step != 1:
+            # Strided slices are rare; rebuild from the dicts
+            return self._rebuild(self[i] for i in indices)
+        lo, hi = indices.start, max(indices.start, indices.stop)
+        columns = {}
+        for key, (kind, data) in self._columns.items():
+            if kind == 'text':
+                columns[key] = (kind, (data[0][lo:hi], data[1][lo:hi]))
+            elif kind == 'ints':
+                flat, bounds = data
+                base = bounds[lo]
+                columns[key] = (kind, (flat[base:bounds[hi]], array('q', (b - base for b in bounds[lo:hi + 1]))))
+            else:
+                columns[key] = (kind, data[lo:hi])
+        return Rows(columns, hi - lo, self._buffer)
+
+    @staticmethod
+    def _rebuild(items: Iterable[Dict[str, Any]]) -> "Rows":
+        buffer = _TextBuffer()
+        rows = Rows.from_items(items, buffer)
+        buffer.freeze()
+        return rows
+
+    def _times(self) -> Optional[Tuple[Sequence, Sequence]]:
+        times = []
+        for key in ('start', 'end'):
+            column = self._columns.get(key)
+            if not column:
+                return None
+            kind, data = column
+            # Mixed int and float times are kept as an object column
+            if kind not in ('int', 'float') and not (
+                kind == 'object' and all(_is_int(v) or isinstance(v, float) for v in data)
+            ):
+                return None
+            times.append(data)
+        return times[0], times[1]
+
+    def between(self, start: float, end: float) -> "Rows":
+        """
+        Rows that overlap a time range.
+
+        Binary search when start and end times are both non-decreasing
+        (as the API returns them), otherwise a linear scan.
+
+        Args:
+            start: Range start in seconds
+            end: Range end in seconds
+
+        Returns:
+            Rows with end > start and start < end, in order
+        """
+        times = self._times()
+        if times is None:
+            return self._take(range(0))
+        starts, ends = times
+        if self._sorted is None:
+            self._sorted = all(a <= b for a, b in zip(starts, starts[1:])) and all(a <= b for a, b in zip(ends, ends[1:]))
+        if self._sorted:
+            lo = bisect_right(ends, start)
+            return self._take(range(lo, max(lo, bisect_left(starts, end))))
+        return self._rebuild(self[i] for i in range(self._length) if ends[i] > start and starts[i] < end)
+
+
+class Transcript(Mapping):
+    """
+    A verbose_json transcript with segments and words stored as columns.
+
+    Behaves as a read-only mapping with the same keys as the dict it was
+    built from ('segments' and 'words' are Rows), so ``result['text']``
+    and ``result.get('segments', [])`` work unchanged.
+    """
+
+    def __init__(self, fields: Dict[str, Any], buffer: Optional[_TextBuffer] = None):
+        """
+        Wrap already-built fields; use from_dict to convert a transcript.
+
+        Args:
+            fields: Top-level keys in order, with Rows for segments and words
+            buffer: Text buffer shared by the rows
+        """
+        self._fields = fields
+        self._buffer = buffer or _TextBuffer()
+
+    @classmethod
+    def from_dict(cls, transcript_data: Dict[str, Any]) -> "Transcript":
+        """
+        Convert a verbose_json dict (or another Transcript).
+
+        Args:
+            transcript_data: Transcript as returned by the API
+
+        Returns:
+            Transcript holding the same data
+        """
+        if isinstance(transcript_data, Transcript):
+            return transcript_data
+        buffer = _TextBuffer()
+        fields = {
+            key: Rows.from_items(value, buffer) if key in ROW_KEYS and isinstance(value, list) else value
+            for key, value in transcript_data.items()
+        }
+        return cls(fields, buffer.freeze())
+
+    def __getitem__(self, key: str) -> Any:
+        return self._fields[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Rebuild the plain verbose_json dict."""
+        return {key: list(value) if isinstance(value, Rows) else value for key, value in self._fields.items()}
+
+    def replace(self, **fields: Any) -> "Transcript":
+        """Copy with some top-level fields replaced (None removes a field)."""
+        updated = {**self._fields, **fields}
+        return Transcript({key: value for key, value in updated.items() if value is not None}, self._buffer)
+
+    def between(self, start: float, end: float) -> "Transcript":
+        """
+        The part of the transcript that overlaps a time range.
+
+        Args:
+            start: Range start in seconds
+            end: Range end in seconds
+
+        Returns:
+            Transcript with the overlapping segments and words, and its
+            text rebuilt from those segments
+        """
+        fields = {
+            key: value.between(start, end) if isinstance(value, Rows) else value
+            for key, value in self._fields.items()
+        }
+        segments = fields.get('segments')
+        if isinstance(segments, Rows) and 'text' in segments.keys():
+            fields['text'] = "".join(segments.column('text')).strip()
+        return Transcript(fields, self._buffer)
+
+    def save(self, output_path: Union[str, Path], format: str = "json") -> None:
+        """
+        Write the transcript in one of the transcript formats.
+
+        Args:
+            output_path: File to write
+            format: 'text', 'json', 'srt' or 'vtt'
+        """
+        write_transcript(self, output_path, format)
@@ -8,6 +8,9 @@ from rich.console import Console
 
 console = Console()
 
+# Concurrent requests for chunked, batch and prompt-batch jobs
+DEFAULT_WORKERS = 4
+
 
 def validate_api_key(api_key: Optional[str] = None) -> str:
     """
@@ -0,0 +1,249 @@
+"""Energy-based voice activity detection and silence trimming."""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from groq_cli.audio import TARGET_SAMPLE_RATE, _require_numpy, read_pcm_blocks, write_wav_pcm
+
+# Energy framing
+FRAME_SECONDS = 0.03
+
+# Silences shorter than this are left in place
+MIN_SILENCE_SECONDS = 1.0
+
+# Audio kept on either side of each speech region
+SPEECH_PADDING_SECONDS = 0.25
+
+# Not worth re-uploading a trimmed copy when almost nothing was cut
+MIN_TRIM_FRACTION = 0.05
+
+SILENCE_FLOOR_DB = -60.0
+
+
+def frame_energies(blocks: Iterable[Any], sample_rate: int = TARGET_SAMPLE_RATE, frame_seconds: float = FRAME_SECONDS):
+    """
+    Compute per-frame RMS energy in dBFS.
+
+    Args:
+        blocks: Iterable of mono float PCM arrays
+        sample_rate: Sample rate of the blocks
+        frame_seconds: Frame length in seconds
+
+    Returns:
+        numpy array of frame energies in dB
+    """
+    np = _require_numpy()
+    frame_len = max(1, int(sample_rate * frame_seconds))
+    leftover = np.zeros(0, dtype=np.float32)
+    energies = []
+
+    for block in blocks:
+        data = np.concatenate((leftover, block)) if len(leftover) else block
+        count = len(data) // frame_len
+        frames = data[:count * frame_len].reshape(count, frame_len)
+        rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+        energies.append(20 * np.log10(rms + 1e-10))
+        leftover = data[count * frame_len:]
+
+    if len(leftover):
+        rms = np.sqrt(np.mean(np.square(leftover, dtype=np.float64)))
+        energies.append(np.array([20 * np.log10(rms + 1e-10)]))
+
+    return np.concatenate(energies) if energies else np.zeros(0)
+
+
+def detect_speech(
+    energies_db,
+    frame_seconds: float = FRAME_SECONDS,
+    threshold_db: Optional[float] = None,
+    min_silence: float = MIN_SILENCE_SECONDS,
+    padding: float = SPEECH_PADDING_SECONDS,
+    duration: Optional[float] = None
+) -> List[Tuple[float, float]]:
+    """
+    Find speech regions from frame energies.
+
+    The default threshold adapts to the recording: 10 dB over the noise
+    floor, but never within 15 dB of the loud frames.
+
+    Args:
+        energies_db: Frame energies from frame_energies
+        frame_seconds: Frame length in seconds
+        threshold_db: Fixed speech threshold in dBFS
+        min_silence: Shortest silence to remove, in seconds
+        padding: Audio kept around each speech region, in seconds
+        duration: Exact audio length, if known (regions are clipped to it)
+
+    Returns:
+        List of (start, end) speech regions in seconds
+    """
+    np = _require_numpy()
+    if len(energies_db) == 0:
+        return []
+
+    if duration is None:
+        duration = len(energies_db) * frame_seconds
+    if threshold_db is None:
+        floor = np.percentile(energies_db, 10)
+        loud = np.percentile(energies_db, 95)
+        threshold_db = max(min(floor + 10, loud - 15), SILENCE_FLOOR_DB)
+
+    voiced = (energies_db > threshold_db).astype(np.int8)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], voiced, [0]))))
+    if len(edges) == 0:
+        return []
+
+    starts = np.clip(edges[0::2] * frame_seconds - padding, 0, duration)
+    ends = np.clip(edges[1::2] * frame_seconds + padding, 0, duration)
+
+    # Bridge gaps that are too short to be worth cutting
+    keep_gap = (starts[1:] - ends[:-1]) >= min_silence
+    starts = starts[np.concatenate(([True], keep_gap))]
+    ends = ends[np.concatenate((keep_gap, [True]))]
+
+    return [(float(s), float(e)) for s, e in zip(starts, ends)]
+
+
+def extract_regions(
+    blocks: Iterable[Any],
+    regions: List[Tuple[float, float]],
+    sample_rate: int = TARGET_SAMPLE_RATE
+) -> Iterator[Any]:
+    """
+    Yield only the samples that fall inside the given regions.
+
+    Args:
+        blocks: Iterable of mono float PCM arrays
+        regions: Sorted (start, end) regions in seconds
+        sample_rate: Sample rate of the blocks
+
+    Yields:
+        PCM slices in timeline order
+    """
+    bounds = [(int(start * sample_rate), int(end * sample_rate)) for start, end in regions]
+    index = 0
+    offset = 0
+
+    for block in blocks:
+        block_end = offset + len(block)
+        while index < len(bounds) and bounds[index][0] < block_end:
+            start, end = bounds[index]
+            lo = max(start, offset) - offset
+            hi = min(end, block_end) - offset
+            if hi > lo:
+                yield block[lo:hi]
+            if end > block_end:
+                break
+            index += 1
+        offset = block_end
+
+
+class TimelineMap:
+    """Maps timestamps on a silence-trimmed timeline back to the original."""
+
+    def __init__(self, regions: List[Tuple[float, float]], original_duration: Optional[float] = None):
+        """
+        Initialize from the regions that were kept.
+
+        Args:
+            regions: Sorted (start, end) regions on the original timeline
+            original_duration: Length of the untrimmed audio in seconds
+        """
+        self.original_starts = [start for start, _ in regions]
+        self.trimmed_starts = []
+        position = 0.0
+        for start, end in regions:
+            self.trimmed_starts.append(position)
+            position += end - start
+        self.trimmed_duration = position
+        self.original_duration = original_duration if original_duration is not None else regions[-1][1]
+
+    @property
+    def joins(self) -> List[float]:
+        """Points on the trimmed timeline where a silence was cut out."""
+        return self.trimmed_starts[1:]
+
+    def to_original(self, times, is_end: bool = False):
+        """
+        Convert trimmed-timeline times to original-timeline times.
+
+        Args:
+            times: Array of seconds on the trimmed timeline
+            is_end: Treat times as region ends, so a time exactly on a join
+                stays with the region before it
+
+        Returns:
+            numpy array of seconds on the original timeline
+        """
+        np = _require_numpy()
+        times = np.asarray(times, dtype=np.float64)
+        trimmed = np.asarray(self.trimmed_starts)
+        side = 'left' if is_end else 'right'
+        index = np.clip(np.searchsorted(trimmed, times, side=side) - 1, 0, len(trimmed) - 1)
+        return np.asarray(self.original_starts)[index] + (times - trimmed[index])
+
+    def remap_transcript(self, transcript_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Shift segment and word timestamps back onto the original timeline.
+
+        Args:
+            transcript_data: verbose_json style transcript
+
+        Returns:
+            New transcript dictionary with remapped timestamps
+        """
+        remapped = dict(transcript_data)
+        for key in ('segments', 'words'):
+            items = transcript_data.get(key) or []
+            if not items:
+                continue
+            starts = self.to_original([item.get('start', 0) for item in items])
+            ends = self.to_original([item.get('end', 0) for item in items], is_end=True)
+            remapped[key] = [
+                {**item, 'start': float(start), 'end': float(end)}
+                for item, start, end in zip(items, starts, ends)
+            ]
+        return remapped
+
+
+def trim_silence(
+    file_path: Path,
+    dest_dir: Path,
+    min_silence: float = MIN_SILENCE_SECONDS,
+    threshold_db: Optional[float] = None
+) -> Tuple[Optional[Path], Optional[TimelineMap]]:
+    """
+    Write a copy of a file with long silent stretches removed.
+
+    Decodes the audio twice (once to measure, once to write) so memory
+    stays bounded by the block size rather than the file length.
+
+    Args:
+        file_path: Path to source audio file
+        dest_dir: Directory to write the trimmed file into
+        min_silence: Shortest silence to remove, in seconds
+        threshold_db: Fixed speech threshold in dBFS
+
+    Returns:
+        (trimmed file, timeline map), or (None, None) when there is nothing
+        worth trimming or no speech at all
+    """
+    sample_count = 0
+
+    def counted(blocks):
+        nonlocal sample_count
+        for block in blocks:
+            sample_count += len(block)
+            yield block
+
+    energies = frame_energies(counted(read_pcm_blocks(file_path)))
+    duration = sample_count / TARGET_SAMPLE_RATE
+    regions = detect_speech(energies, threshold_db=threshold_db, min_silence=min_silence, duration=duration)
+
+    timeline = TimelineMap(regions, original_duration=duration) if regions else None
+    if timeline is None or timeline.trimmed_duration > duration * (1 - MIN_TRIM_FRACTION):
+        return None, None
+
+    dest = dest_dir / f"{file_path.stem}_trimmed.wav"
+    write_wav_pcm(dest, extract_regions(read_pcm_blocks(file_path), regions))
+    return dest, timeline
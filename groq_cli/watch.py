@@ -0,0 +1,449 @@
+"""Watch-folder ingestion: transcribe recordings as they land in a directory.
+
+On Linux the directory tree is watched with inotify (through ctypes, so
+there is no extra dependency); elsewhere, or with poll=True for network
+mounts whose remote writes raise no local events, it is rescanned every
+few seconds. A file is queued only once its size and mtime have stopped
+changing for a settle period, so recordings still being copied are not
+picked up half-written. A bounded queue feeds a fixed pool of workers
+that share one WhisperTranscriber, and transcripts are written next to
+their sources. A file whose transcription fails is retried a few times
+before the watcher gives up on that version of it.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from rich.console import Console
+
+from groq_cli.batch import output_path_for
+from groq_cli.stats import append_metrics
+from groq_cli.transcriber import SUPPORTED_FORMATS, WhisperTranscriber
+from groq_cli.utils import DEFAULT_WORKERS
+
+console = Console()
+
+# Seconds a file's size and mtime must stay unchanged before it is queued
+SETTLE_SECONDS = 2.0
+
+# Rescan interval when polling, and how often pending files are re-checked
+POLL_SECONDS = 2.0
+CHECK_SECONDS = 0.5
+
+# Files queued but not yet started; further ready files wait for room
+MAX_QUEUED = 64
+
+# Transcription attempts per version of a file before it is given up on
+MAX_ATTEMPTS = 3
+
+# inotify event flags (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# Deletes and moves away are watched too, so the watcher can forget those files
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class _Inotify:
+    """Minimal recursive inotify watcher over libc."""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, Path] = {}
+
+    def add_tree(self, root: Path) -> None:
+        """Watch a directory and every directory below it."""
+        for directory, _, _ in os.walk(root):
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+            if wd >= 0:
+                self._dirs[wd] = Path(directory)
+
+    def read(self, timeout: float) -> Tuple[List[Path], bool]:
+        """
+        Wait for events.
+
+        Returns:
+            (files that changed, whether the kernel queue overflowed and
+            events were lost)
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return [], False
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return [], False
+
+        changed, overflowed = [], False
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                overflowed = True
+                continue
+            if mask & IN_IGNORED:
+                # The directory was deleted or unmounted and its watch removed
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # A new folder may already hold files copied in with it
+                    self.add_tree(directory / name)
+                    changed.extend(_scan(directory / name))
+            else:
+                changed.append(directory / name)
+        return changed, overflowed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _scan(root: Path) -> Iterator[Path]:
+    for directory, _, names in os.walk(root):
+        for name in names:
+            yield Path(directory) / name
+
+
+def inotify_available() -> bool:
+    """Whether this platform can watch directories with inotify."""
+    return sys.platform.startswith('linux')
+
+
+class FolderWatcher:
+    """
+    Transcribes audio files as they appear in a directory tree.
+
+    Counters (see counters()) report files seen, queued, in progress,
+    done, retried and failed (given up on), the queue depth, and the
+    latency from a file first being seen to its transcript being written.
+    """
+
+    def __init__(
+        self,
+        transcriber: WhisperTranscriber,
+        directory: Path,
+        format: str = "text",
+        workers: int = DEFAULT_WORKERS,
+        settle: float = SETTLE_SECONDS,
+        poll: bool = False,
+        max_queued: int = MAX_QUEUED,
+        metrics_log: Optional[Path] = None,
+        **transcribe_options: Any
+    ):
+        """
+        Set up a watcher (call run() to start it).
+
+        Args:
+            transcriber: Transcriber whose client is shared by every worker
+            directory: Directory to watch recursively
+            format: Transcript format to save ('text', 'json', 'srt', 'vtt')
+            workers: Number of files to transcribe concurrently
+            settle: Seconds a file must stay unchanged before it is queued
+            poll: Rescan periodically instead of using inotify
+            max_queued: Cap on files waiting for a worker
+            metrics_log: Append each file's request stats and the watcher
+                counters to this JSONL file
+            **transcribe_options: model, language, preprocess, trim_silence
+        """
+        self.transcriber = transcriber
+        self.directory = Path(directory).resolve()
+        self.format = format
+        self.workers = max(1, workers)
+        self.settle = settle
+        self.poll = poll or not inotify_available()
+        self.metrics_log = metrics_log
+        self.transcribe_options = transcribe_options
+
+        self._queue: "queue.Queue[Optional[Tuple[Path, Tuple[int, int], float]]]" = queue.Queue(maxsize=max(1, max_queued))
+        # path -> (size, mtime_ns, first seen, last change)
+        self._pending: Dict[Path, Tuple[int, int, float, float]] = {}
+        # path -> (size, mtime_ns) of the version already queued or handled;
+        # entries are dropped once the file is gone
+        self._handled: Dict[Path, Tuple[int, int]] = {}
+        # path -> (size, mtime_ns) of the failing version and attempts so far
+        self._failures: Dict[Path, Tuple[Tuple[int, int], int]] = {}
+        self._lock = threading.Lock()
+        self._counters = {'seen': 0, 'queued': 0, 'in_progress': 0, 'done': 0, 'retried': 0, 'failed': 0}
+        # Running totals, so a watcher left up for days stays constant-size
+        self._latency = {'last': None, 'total': 0.0, 'max': None}
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def counters(self) -> Dict[str, Any]:
+        """
+        Snapshot of the watcher's counters.
+
+        Returns:
+            Counts plus queue_depth, pending (files still settling) and
+            latency_last/mean/max in seconds (None before the first file)
+        """
+        with self._lock:
+            snapshot: Dict[str, Any] = dict(self._counters)
+            snapshot['pending'] = len(self._pending)
+            snapshot['latency_last'] = self._latency['last']
+            snapshot['latency_mean'] = self._latency['total'] / snapshot['done'] if snapshot['done'] else None
+            snapshot['latency_max'] = self._latency['max']
+        snapshot['queue_depth'] = self._queue.qsize()
+        return snapshot
+
+    def _is_candidate(self, path: Path) -> bool:
+        # Hidden names are usually partial downloads or editor temp files
+        return path.suffix.lower() in SUPPORTED_FORMATS and not path.name.startswith('.')
+
+    def _is_transcribed(self, path: Path, signature: Tuple[int, int]) -> bool:
+        output = output_path_for(path, self.format)
+        try:
+            return output.stat().st_mtime_ns >= signature[1]
+        except FileNotFoundError:
+            return False
+
+    def notice(self, path: Path, now: Optional[float] = None) -> None:
+        """
+        Note that a file was created or changed.
+
+        Args:
+            path: File that changed
+            now: Current monotonic time (for tests)
+        """
+        if not self._is_candidate(path):
+            return
+        now = time.monotonic() if now is None else now
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._forget(path)
+            return
+        if not path.is_file():
+            return
+        signature = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            if self._handled.get(path) == signature:
+                return
+            previous = self._pending.get(path)
+            if previous is None:
+                self._counters['seen'] += 1
+                self._pending[path] = (*signature, now, now)
+            elif previous[:2] != signature:
+                self._pending[path] = (*signature, previous[2], now)
+
+    def _forget(self, path: Path) -> None:
+        with self._lock:
+            self._pending.pop(path, None)
+            self._handled.pop(path, None)
+            self._failures.pop(path, None)
+
+    def check_pending(self, now: Optional[float] = None) -> List[Path]:
+        """
+        Queue files whose size and mtime have settled.
+
+        Args:
+            now: Current monotonic time (for tests)
+
+        Returns:
+            Files queued by this call
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            paths = list(self._pending)
+        for path in paths:
+            # Re-stat, since polling and network mounts may not report every write
+            self.notice(path, now)
+
+        queued = []
+        with self._lock:
+            settled = [(path, entry) for path, entry in self._pending.items() if now - entry[3] >= self.settle]
+        for path, (size, mtime_ns, first_seen, _) in settled:
+            try:
+                self._queue.put_nowait((path, (size, mtime_ns), first_seen))
+            except queue.Full:
+                # Left pending; retried once a worker frees a slot
+                break
+            with self._lock:
+                self._pending.pop(path, None)
+                self._handled[path] = (size, mtime_ns)
+                self._counters['queued'] += 1
+            queued.append(path)
+        return queued
+
+    def scan(self, skip_transcribed: bool = False) -> None:
+        """
+        Notice every audio file in the tree.
+
+        Args:
+            skip_transcribed: Ignore files whose transcript is newer than
+                they are (used at start-up)
+        """
+        with self._lock:
+            known = set(self._handled) | set(self._pending)
+        found = set()
+        for path in _scan(self.directory):
+            found.add(path)
+            if skip_transcribed and self._is_candidate(path):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                signature = (stat.st_size, stat.st_mtime_ns)
+                if self._is_transcribed(path, signature):
+                    with self._lock:
+                        self._handled[path] = signature
+                    continue
+            self.notice(path)
+        # Deletes are not reported when polling or after an overflow
+        for path in known - found:
+            self._forget(path)
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, signature, first_seen = item
+            with self._lock:
+                self._counters['in_progress'] += 1
+            try:
+                self._transcribe(path, signature, first_seen)
+            finally:
+                with self._lock:
+                    self._counters['in_progress'] -= 1
+
+    def _transcribe(self, path: Path, signature: Tuple[int, int], first_seen: float) -> None:
+        try:
+            result = self.transcriber.transcribe(
+                path,
+                response_format="verbose_json",
+                include_timestamps=(self.format in ['srt', 'vtt', 'json']),
+                workers=1,
+                quiet=True,
+                compact=True,
+                **self.transcribe_options
+            )
+            output = self.transcriber.save_transcript(result, output_path_for(path, self.format), format=self.format)
+        except Exception as e:
+            self._failed(path, signature, first_seen, e)
+            return
+
+        latency = time.monotonic() - first_seen
+        with self._lock:
+            self._failures.pop(path, None)
+            self._counters['done'] += 1
+            self._latency['last'] = latency
+            self._latency['total'] += latency
+            self._latency['max'] = max(latency, self._latency['max'] or 0.0)
+        counters = self.counters()
+        console.print(
+            f"[dim]{path.name}: {latency:.1f}s after arrival | queue {counters['queue_depth']} | "
+            f"done {counters['done']} | failed {counters['failed']}[/dim]"
+        )
+        if self.metrics_log:
+            append_metrics(self.metrics_log, {**(result.get('stats') or {}), 'output': str(output), 'watch': counters})
+
+    def _failed(self, path: Path, signature: Tuple[int, int], first_seen: float, error: Exception) -> None:
+        """Put a failed file back to settle and be queued again, until MAX_ATTEMPTS."""
+        with self._lock:
+            previous, attempts = self._failures.get(path, (signature, 0))
+            attempts = attempts + 1 if previous == signature else 1
+            retry = attempts < MAX_ATTEMPTS and self._handled.get(path) == signature
+            if retry:
+                self._failures[path] = (signature, attempts)
+                self._handled.pop(path)
+                now = time.monotonic()
+                self._pending.setdefault(path, (*signature, first_seen, now))
+                self._counters['retried'] += 1
+            else:
+                # Kept in _handled, so this version is not tried again
+                self._failures.pop(path, None)
+                self._counters['failed'] += 1
+        if retry:
+            console.print(f"[yellow]{path.name}: {error} (attempt {attempts} of {MAX_ATTEMPTS}, will retry)[/yellow]")
+        else:
+            console.print(f"[red]✗ {path.name}: {error}[/red]")
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"groq-watch-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """Drop queued files, let running transcriptions finish, and stop the workers."""
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def shutdown(self) -> None:
+        """Ask a running run() loop to return, from another thread."""
+        self._stop.set()
+
+    def run(self) -> None:
+        """Watch until Ctrl+C or shutdown(), then let running transcriptions finish."""
+        inotify = None
+        if not self.poll:
+            try:
+                inotify = _Inotify()
+                inotify.add_tree(self.directory)
+            except (OSError, AttributeError) as e:
+                console.print(f"[yellow]inotify unavailable ({e}); polling instead[/yellow]")
+                self.poll = True
+
+        self.start()
+        # Files that arrived while nothing was watching
+        self.scan(skip_transcribed=True)
+        last_scan = time.monotonic()
+        try:
+            while not self._stop.is_set():
+                if inotify is not None:
+                    changed, overflowed = inotify.read(CHECK_SECONDS)
+                    for path in changed:
+                        self.notice(path)
+                    if overflowed:
+                        self.scan()
+                else:
+                    self._stop.wait(CHECK_SECONDS)
+                    if time.monotonic() - last_scan >= POLL_SECONDS:
+                        self.scan()
+                        last_scan = time.monotonic()
+                self.check_pending()
+        finally:
+            if inotify is not None:
+                inotify.close()
+            self.stop()
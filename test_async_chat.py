@@ -0,0 +1,34 @@
+"""Tests for the async chat completer and concurrent fan-out."""
+
+import asyncio
+
+from groq_cli.chat import AsyncChatCompleter
+from conftest import FakeAsyncCompletions, attach_completions
+
+
+def make_completer(max_concurrency=8):
+    return attach_completions(AsyncChatCompleter(api_key="test-key", max_concurrency=max_concurrency), FakeAsyncCompletions())
+
+
+def test_stream_completion_maintains_history(capsys):
+    completer, _ = make_completer()
+
+    result = asyncio.run(completer.stream_completion("hello async world", maintain_history=True))
+
+    stats = result.pop("stats")
+    assert result == {"text": "hello async world ", "tools_used": []}
+    assert stats["counters"] == {"attempts": 1, "chunks": 3}
+    assert stats["tokens"] == 3 and 0 < stats["ttft"] <= stats["total"]
+    assert sum(stats["inter_token_ms"].values()) == 2
+    assert capsys.readouterr().out == "hello async world "
+    assert [m["role"] for m in completer.get_history()] == ["user", "assistant"]
+
+
+def test_gather_preserves_order_and_bounds_concurrency():
+    completer, fake = make_completer(max_concurrency=3)
+    prompts = [f"prompt number {i}" for i in range(20)] + [{"query": "dict prompt", "model": "llama-3.1-8b-instant"}]
+
+    results = asyncio.run(completer.gather_completions(prompts))
+
+    assert [r["text"].strip() for r in results] == [f"prompt number {i}" for i in range(20)] + ["dict prompt"]
+    assert fake.peak == 3
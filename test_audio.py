@@ -0,0 +1,160 @@
+"""Tests for local audio decoding and re-encoding."""
+
+import math
+import struct
+import wave
+from pathlib import Path
+
+import pytest
+
+from groq_cli.audio import get_audio_duration, read_pcm_blocks, reencode_audio
+from conftest import make_transcriber
+
+np = pytest.importorskip("numpy")
+
+
+def write_tone(path: Path, seconds: float, rate: int = 44100, channels: int = 2, freq: float = 440.0) -> Path:
+    """Write a 16-bit sine tone WAV file."""
+    frames = bytearray()
+    for i in range(int(seconds * rate)):
+        sample = int(16000 * math.sin(2 * math.pi * freq * i / rate))
+        frames += struct.pack('<h', sample) * channels
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(bytes(frames))
+    return path
+
+
+def test_read_pcm_blocks_resamples_across_blocks(tmp_path):
+    source = write_tone(tmp_path / 'tone.wav', 2.0)
+
+    samples = np.concatenate(list(read_pcm_blocks(source, block_seconds=0.3)))
+
+    assert abs(len(samples) - 32000) <= 1
+    # The tone should survive resampling: check the dominant frequency
+    spectrum = np.abs(np.fft.rfft(samples))
+    peak_hz = np.argmax(spectrum) * 16000 / len(samples)
+    assert abs(peak_hz - 440.0) < 2.0
+
+
+def test_reencode_downmixes_and_shrinks(tmp_path, monkeypatch):
+    monkeypatch.setattr('groq_cli.audio.find_ffmpeg', lambda: None)
+    source = write_tone(tmp_path / 'stereo.wav', 2.0)
+
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir()
+
+    encoded = reencode_audio(source, out_dir)
+
+    with wave.open(str(encoded), 'rb') as wav:
+        assert wav.getnchannels() == 1
+        assert wav.getframerate() == 16000
+    assert abs(get_audio_duration(encoded) - 2.0) < 1e-3
+    assert encoded.stat().st_size < source.stat().st_size / 5
+
+
+def write_bursts(path: Path, pattern, rate: int = 16000) -> Path:
+    """Write a mono WAV alternating tone and silence: pattern is [(seconds, is_tone), ...]."""
+    pieces = []
+    for seconds, is_tone in pattern:
+        t = np.arange(int(seconds * rate)) / rate
+        pieces.append(0.5 * np.sin(2 * np.pi * 300 * t) if is_tone else np.zeros(len(t)))
+    samples = (np.concatenate(pieces) * 32767).astype('<i2')
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(samples.tobytes())
+    return path
+
+
+def test_detect_speech_and_timeline_remap(tmp_path):
+    from groq_cli.vad import trim_silence
+
+    source = write_bursts(tmp_path / 'calls.wav', [(2, True), (5, False), (3, True), (0.5, False), (1, True)])
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir()
+
+    trimmed, timeline = trim_silence(source, out_dir)
+
+    # The 5 s gap is cut down to the padding; the 0.5 s gap is kept
+    assert len(timeline.original_starts) == 2
+    assert abs(get_audio_duration(trimmed) - timeline.trimmed_duration) < 0.01
+    assert abs(timeline.trimmed_duration - 7.0) < 0.2
+
+    # A time just after the join lands after the long silence
+    join = timeline.joins[0]
+    assert abs(timeline.to_original([join + 0.1])[0] - (timeline.original_starts[1] + 0.1)) < 1e-9
+    assert timeline.to_original([join], is_end=True)[0] < 3.0
+
+    remapped = timeline.remap_transcript({'segments': [{'start': 0.5, 'end': join}, {'start': join + 0.3, 'end': join + 1}]})
+    assert remapped['segments'][1]['start'] > 6.5
+
+
+def test_chunks_cut_at_silence():
+    from groq_cli.audio import plan_chunks
+
+    chunks = plan_chunks(30.0, chunk_seconds=10.0, overlap=2.0, cut_points=[4.0, 7.0, 12.0, 21.0])
+    assert chunks == [(0.0, 7.0), (7.0, 17.0), (15.0, 21.0), (21.0, 30.0)]
+
+
+def test_transcribe_with_trimmed_silence_maps_back(tmp_path):
+    source = write_bursts(tmp_path / 'call.wav', [(3, True), (20, False), (3, True)])
+    transcriber, fake = make_transcriber()
+
+    result = transcriber.transcribe(source, trim_silence=True)
+
+    assert result['duration'] == 26.0
+    starts = [segment['start'] for segment in result['segments']]
+    assert all(s < 3.5 or s > 22.5 for s in starts)
+    assert result['segments'][-1]['end'] <= 26.0
+
+
+def write_float_wav(path: Path, seconds: float, rate: int = 16000) -> Path:
+    """Write a 32-bit float (format 3) WAV file, which the wave module cannot open."""
+    data = np.zeros(int(seconds * rate), dtype='<f4').tobytes()
+    header = struct.pack('<4sI4s4sIHHIIHH4sI', b'RIFF', 36 + len(data), b'WAVE', b'fmt ', 16,
+                         3, 1, rate, rate * 4, 4, 32, b'data', len(data))
+    path.write_bytes(header + data)
+    return path
+
+
+class RecordingTranscriptions:
+    def __init__(self):
+        self.uploads = []
+
+    def create(self, **params):
+        name, data = params['file']
+        self.uploads.append((name, data if isinstance(data, bytes) else data.read()))
+        return "hello"
+
+
+def test_float_wav_is_uploaded_without_preprocessing(tmp_path, monkeypatch):
+    monkeypatch.setattr('groq_cli.audio.find_ffmpeg', lambda: None)
+    source = write_float_wav(tmp_path / 'float.wav', 1.0)
+    transcriber, fake = make_transcriber(RecordingTranscriptions())
+
+    assert transcriber.transcribe(source, preprocess=True, quiet=True) == "hello"
+    assert fake.uploads == [('float.wav', source.read_bytes())]
+
+
+def test_trim_silence_keeps_original_when_not_smaller(tmp_path, monkeypatch):
+    monkeypatch.setattr('groq_cli.audio.find_ffmpeg', lambda: None)
+    # Undecodable here, so trimming is skipped rather than failing
+    float_source = write_float_wav(tmp_path / 'float.wav', 1.0)
+    # 8-bit 8 kHz: the 16-bit 16 kHz trimmed copy would be four times the size per second
+    narrow_source = tmp_path / 'narrow.wav'
+    with wave.open(str(narrow_source), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(1)
+        wav.setframerate(8000)
+        tone = (128 + 60 * np.sin(2 * np.pi * 300 * np.arange(16000) / 8000)).astype('u1').tobytes()
+        wav.writeframes(tone + b'\x80' * 8000 * 4 + tone)
+
+    transcriber, fake = make_transcriber(RecordingTranscriptions())
+
+    for source in (float_source, narrow_source):
+        assert transcriber.transcribe(source, trim_silence=True, preprocess=False, quiet=True) == "hello"
+    assert fake.uploads == [(source.name, source.read_bytes()) for source in (float_source, narrow_source)]
@@ -0,0 +1,45 @@
+"""Tests for batch transcription of directories and globs."""
+
+from groq_cli.batch import find_audio_files, transcribe_batch
+from conftest import make_transcriber, write_wav
+
+
+def test_find_audio_files_walks_directory_and_glob(tmp_path):
+    (tmp_path / 'nested').mkdir()
+    first = write_wav(tmp_path / 'a.wav', 1.0)
+    second = write_wav(tmp_path / 'nested' / 'b.WAV', 1.0)
+    (tmp_path / 'notes.txt').write_text('not audio')
+
+    assert find_audio_files(str(tmp_path)) == sorted([first.resolve(), second.resolve()])
+    assert find_audio_files(str(tmp_path / '*.wav')) == [first.resolve()]
+
+
+def test_transcribe_batch_saves_next_to_sources(tmp_path):
+    files = [write_wav(tmp_path / f'call{i}.wav', 3.0) for i in range(5)]
+
+    transcriber, fake = make_transcriber()
+
+    summary = transcribe_batch(transcriber, files, format='srt', workers=3)
+
+    assert summary['succeeded'] == 5
+    assert not summary['failed']
+    assert all(path.with_suffix('.srt').exists() for path in files)
+    assert summary['audio_seconds'] == 15.0
+    assert summary['files_per_min'] > 0
+
+
+def test_sources_sharing_a_stem_get_separate_transcripts(tmp_path):
+    (tmp_path / 'nested').mkdir()
+    files = [
+        write_wav(tmp_path / 'call.wav', 1.0),
+        write_wav(tmp_path / 'call.mp3', 2.0),
+        write_wav(tmp_path / 'nested' / 'call.wav', 3.0),
+    ]
+    transcriber, _ = make_transcriber()
+
+    assert transcribe_batch(transcriber, files, workers=3)['succeeded'] == 3
+
+    assert sorted(path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob('*.txt')) == [
+        'call.mp3.txt', 'call.wav.txt', 'nested/call.txt'
+    ]
+    assert (tmp_path / 'call.mp3.txt').read_text(encoding='utf-8').strip() == 'tick tick'
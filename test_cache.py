@@ -0,0 +1,109 @@
+"""Tests for the transcription and chat completion caches."""
+
+import io
+import os
+import time
+from groq_cli.cache import CompletionCache, TranscriptionCache
+from groq_cli.chat import ChatCompleter
+from conftest import FakeCompletions, attach_completions, make_transcriber, write_wav
+
+
+def test_key_depends_on_content_and_params(tmp_path):
+    cache = TranscriptionCache(tmp_path / 'cache')
+    first = write_wav(tmp_path / 'a.wav', 1.0)
+    copy = tmp_path / 'copy.wav'
+    copy.write_bytes(first.read_bytes())
+    other = write_wav(tmp_path / 'b.wav', 2.0)
+
+    params = {'model': 'whisper-large-v3-turbo', 'language': None}
+    assert cache.make_key(first, params) == cache.make_key(copy, params)
+    assert cache.make_key(first, params) != cache.make_key(other, params)
+    assert cache.make_key(first, params) != cache.make_key(first, {**params, 'language': 'en'})
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    cache = TranscriptionCache(tmp_path, max_bytes=350)
+    for i, key in enumerate(['used', 'old', 'new']):
+        cache.put(key, {'text': 'x' * 80})
+        os.utime(tmp_path / f'{key}.json', (1000 + i, 1000 + i))
+
+    cache.get('used')
+    cache.put('newest', {'text': 'x' * 80})
+
+    assert cache.get('old') is None
+    assert cache.get('used') == {'text': 'x' * 80}
+    assert cache.get('newest') == {'text': 'x' * 80}
+
+
+def test_size_is_tracked_without_rescanning(tmp_path, monkeypatch):
+    cache = TranscriptionCache(tmp_path, max_bytes=1100)
+    sweeps = []
+    evict = cache.evict
+    monkeypatch.setattr(cache, 'evict', lambda: sweeps.append(1) or evict())
+
+    for i in range(10):
+        cache.put(f'key{i}', {'text': 'x' * 80})
+    # Only the first put scans; overwriting an entry does not grow the total
+    cache.put('key0', {'text': 'x' * 80})
+    assert len(sweeps) == 1
+
+    cache.put('key10', {'text': 'x' * 80})
+    assert len(sweeps) == 2
+    # Evicted down to 90% of the cap, so the next put fits without a sweep
+    assert sum(path.stat().st_size for path in tmp_path.glob('*.json')) <= 990
+    cache.put('key11', {'text': 'x' * 80})
+    assert len(sweeps) == 2
+
+
+def test_cache_hit_skips_network(tmp_path):
+    audio = write_wav(tmp_path / 'call.wav', 2.0)
+    transcriber, fake = make_transcriber(cache=TranscriptionCache(tmp_path / 'cache'))
+
+    first = transcriber.transcribe(audio)
+    second = transcriber.transcribe(audio)
+    transcriber.transcribe(audio, language='en')
+
+    assert second.pop('stats')['counters'] == {'cache_hits': 1}
+    first.pop('stats')
+    assert second == first
+    assert len(fake.calls) == 2
+
+
+def make_completer(cache):
+    return attach_completions(ChatCompleter(api_key='test-key', cache=cache), FakeCompletions(reply=('Hello', ' there')))
+
+
+def test_completion_cache_replays_deterministic_requests(tmp_path):
+    completer, fake = make_completer(CompletionCache(tmp_path / 'completions.sqlite3'))
+
+    first = completer.stream_completion('hi', model='llama-3.1-8b-instant', temperature=0, output=io.StringIO())
+    replay = io.StringIO()
+    second = completer.stream_completion('hi', model='llama-3.1-8b-instant', temperature=0, output=replay)
+    completer.stream_completion('hi', model='llama-3.1-8b-instant', temperature=0.7, output=io.StringIO())
+    completer.stream_completion('hi', model='groq/compound', temperature=0, output=io.StringIO())
+
+    assert second['text'] == first['text'] == 'Hello there'
+    assert second['stats']['counters'] == {'cache_hits': 1, 'chunks': 1}
+    assert replay.getvalue() == 'Hello there'
+    # Sampled and compound requests always go to the API
+    assert len(fake.calls) == 3
+
+    # A fresh process finds the entry on disk
+    reopened, fake = make_completer(CompletionCache(tmp_path / 'completions.sqlite3'))
+    reopened.stream_completion('hi', model='llama-3.1-8b-instant', temperature=0, output=io.StringIO())
+    assert fake.calls == []
+
+
+def test_completion_cache_expiry_and_size_eviction(tmp_path):
+    cache = CompletionCache(tmp_path / 'completions.sqlite3', ttl=60, max_bytes=300, memory_entries=1)
+    for key in ('used', 'old', 'new'):
+        cache.put(key, {'text': 'x' * 80})
+        time.sleep(0.01)
+    cache.get('used')
+    cache.put('newest', {'text': 'x' * 80})
+
+    assert cache.get('old') is None
+    assert cache.get('used') == {'text': 'x' * 80}
+
+    cache.ttl = 0
+    assert cache.get('used') is None
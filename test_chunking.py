@@ -0,0 +1,83 @@
+"""Tests for chunked transcription of oversized audio files."""
+
+from groq_cli.audio import extract_chunk, get_audio_duration, plan_chunks
+from groq_cli.transcriber import merge_chunk_transcripts
+from conftest import make_transcriber, write_wav
+
+
+def test_plan_chunks_overlap():
+    chunks = plan_chunks(25.0, chunk_seconds=10.0, overlap=2.0)
+    assert chunks == [(0.0, 10.0), (8.0, 18.0), (16.0, 25.0)]
+
+
+def test_plan_chunks_short_file():
+    assert plan_chunks(5.0, chunk_seconds=10.0, overlap=2.0) == [(0.0, 5.0)]
+
+
+def test_merge_shifts_timestamps_and_drops_overlap_duplicates():
+    first = {
+        'text': ' hello there world',
+        'segments': [{'id': 0, 'start': 0.0, 'end': 9.5, 'text': ' hello there world'}],
+        'words': [
+            {'word': 'hello', 'start': 0.5, 'end': 1.0},
+            {'word': 'there', 'start': 8.2, 'end': 8.6},
+            {'word': 'world', 'start': 9.2, 'end': 9.6},
+        ],
+        'language': 'english',
+    }
+    second = {
+        'text': ' there world again',
+        'segments': [{'id': 0, 'start': 1.5, 'end': 5.0, 'text': ' again'}],
+        'words': [
+            {'word': 'there', 'start': 0.2, 'end': 0.6},
+            {'word': 'world', 'start': 1.2, 'end': 1.6},
+            {'word': 'again', 'start': 2.0, 'end': 2.5},
+        ],
+    }
+
+    merged = merge_chunk_transcripts([(0.0, 10.0, first), (8.0, 18.0, second)])
+
+    assert [w['word'] for w in merged['words']] == ['hello', 'there', 'world', 'again']
+    assert merged['words'][-1]['start'] == 10.0
+    assert [s['start'] for s in merged['segments']] == [0.0, 9.5]
+    assert [s['id'] for s in merged['segments']] == [0, 1]
+    assert merged['text'] == 'hello there world again'
+    assert merged['language'] == 'english'
+
+
+def test_extract_wav_chunk(tmp_path):
+    source = write_wav(tmp_path / 'long.wav', 3.0)
+    chunk = extract_chunk(source, 1.0, 2.5, tmp_path)
+    assert abs(get_audio_duration(chunk) - 1.5) < 1e-3
+
+
+def test_transcribe_splits_oversized_file(tmp_path):
+    source = write_wav(tmp_path / 'call.wav', 30.0)
+
+    transcriber, fake = make_transcriber()
+    # 8 kHz 16-bit mono is 16 KB/s, so 200 KB allows ~11 s chunks
+    transcriber.max_file_size = 200 * 1024
+
+    result = transcriber.transcribe(source)
+
+    assert len(fake.calls) == 4
+    assert all(call['response_format'] == 'verbose_json' for call in fake.calls)
+    assert result['duration'] == 30.0
+    starts = [segment['start'] for segment in result['segments']]
+    assert starts == sorted(starts)
+    assert max(b - a for a, b in zip(starts, starts[1:])) <= 1.0
+    assert abs(result['segments'][-1]['end'] - 30.0) < 1e-3
+    assert len(result['words']) == len(result['segments'])
+
+
+def test_parallel_chunks_reassembled_in_order(tmp_path):
+    source = write_wav(tmp_path / 'call.wav', 60.0)
+
+    transcriber, fake = make_transcriber()
+    transcriber.max_file_size = 200 * 1024
+
+    serial = transcriber.transcribe(source, workers=1)
+    parallel = transcriber.transcribe(source, workers=4)
+
+    assert parallel['segments'] == serial['segments']
+    assert parallel['words'] == serial['words']
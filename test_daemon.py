@@ -0,0 +1,127 @@
+"""Tests for forwarding CLI requests to a warm daemon over a Unix socket."""
+
+import io
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from groq_cli.daemon import DaemonServer, daemon_supported, forward_chat, forward_request, forward_transcription
+
+pytestmark = pytest.mark.skipif(not daemon_supported(), reason="needs Unix domain sockets")
+
+
+class FakeChat:
+    """Stand-in for ChatCompleter that echoes the query back word by word."""
+
+    def __init__(self):
+        self.calls = []
+
+    def stream_completion(self, query, output, maintain_history=False, **params):
+        self.calls.append(params)
+        for word in query.split():
+            output.write(word + " ")
+            output.flush()
+        return {"text": query + " ", "tools_used": []}
+
+
+class FakeTranscriber:
+    def transcribe(self, file_path, quiet=False, **params):
+        assert quiet and file_path.is_absolute()
+        return {"text": f"transcript of {file_path.name}", "segments": []}
+
+    def save_transcript(self, data, output_path, format="text"):
+        output_path.write_text(data["text"])
+        return output_path
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are length-limited, so avoid pytest's deep tmp_path
+    with tempfile.TemporaryDirectory(prefix="groq-") as tmp_dir:
+        yield Path(tmp_dir) / "d.sock"
+
+
+@pytest.fixture
+def server(socket_path):
+    server = DaemonServer(socket_path, "test-key", chat=FakeChat(), transcriber=FakeTranscriber())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_chat_streams_tokens_through_daemon(server, socket_path):
+    out = io.StringIO()
+    result = forward_chat("test-key", output=out, socket_path=socket_path, query="hello warm daemon", model="llama-3.1-8b-instant")
+
+    assert result == {"text": "hello warm daemon ", "tools_used": []}
+    assert out.getvalue() == "hello warm daemon "
+    assert server.chat.calls == [{"model": "llama-3.1-8b-instant"}]
+
+
+def test_transcription_is_saved_by_daemon(server, socket_path, tmp_path):
+    audio = tmp_path / "clip.wav"
+    audio.write_bytes(b"RIFF")
+    output = tmp_path / "clip.txt"
+
+    result = forward_transcription("test-key", socket_path=socket_path, output=output, format="text", file_path=audio)
+
+    assert result["transcript"]["text"] == "transcript of clip.wav"
+    assert Path(result["saved_to"]) == output.resolve()
+    assert output.read_text() == "transcript of clip.wav"
+
+    # A daemon on the free tier would chunk at the wrong size limit
+    assert forward_transcription("test-key", socket_path=socket_path, tier="developer", file_path=audio) is None
+
+
+def test_other_api_key_falls_back(server, socket_path):
+    assert forward_request({"op": "ping"}, "other-key", socket_path) is None
+    assert server.chat.calls == []
+
+
+def test_missing_or_stale_socket_falls_back(socket_path):
+    assert forward_request({"op": "ping"}, "test-key", socket_path) is None
+
+    # A socket file with nobody listening, as left by a killed daemon
+    import socket
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()
+    assert forward_request({"op": "ping"}, "test-key", socket_path) is None
+
+    # A new daemon replaces the stale file
+    server = DaemonServer(socket_path, "test-key", chat=FakeChat(), transcriber=FakeTranscriber())
+    server.server_close()
+    assert not socket_path.exists()
+
+
+def test_second_daemon_refuses_live_socket(server, socket_path):
+    with pytest.raises(ValueError, match="already listening"):
+        DaemonServer(socket_path, "test-key", chat=FakeChat(), transcriber=FakeTranscriber())
+    assert socket_path.stat().st_mode & 0o077 == 0
+
+
+def test_socket_open_to_others_is_not_trusted(server, socket_path):
+    socket_path.chmod(0o666)
+    assert forward_request({"op": "ping"}, "test-key", socket_path) is None
+
+
+def test_fallback_socket_without_getuid(monkeypatch, tmp_path):
+    import os
+    from groq_cli.daemon import default_socket_path
+
+    monkeypatch.delenv("GROQ_CLI_SOCKET", raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    assert default_socket_path(create=True) == Path(tmp_path) / f"groq-cli-{os.getuid()}" / "daemon.sock"
+    assert (tmp_path / f"groq-cli-{os.getuid()}").stat().st_mode & 0o777 == 0o700
+
+    # As on Windows: no uid suffix, and no daemon rather than a crash
+    monkeypatch.delattr(os, "getuid")
+    assert default_socket_path().name == "daemon.sock"
+    assert default_socket_path().parent.name == "groq-cli"
+    assert forward_chat("test-key", output=io.StringIO(), query="hi") is None
@@ -0,0 +1,59 @@
+"""Tests for token-budgeted conversation history."""
+
+import io
+
+from groq_cli.chat import ChatCompleter
+from groq_cli.history import ConversationHistory, context_tokens, estimate_tokens
+from conftest import attach_completions
+
+
+def test_trim_evicts_oldest_and_keeps_system_prompt():
+    history = ConversationHistory()
+    history.append("system", "be brief")
+    for i in range(10):
+        history.record(f"question {i} " * 10, f"answer {i} " * 10)
+
+    per_exchange = estimate_tokens("question 0 " * 10) + estimate_tokens("answer 0 " * 10)
+    history.trim(history.system_tokens + 3 * per_exchange)
+
+    messages = history.messages
+    assert messages[0] == {"role": "system", "content": "be brief"}
+    assert [m["content"].split()[1] for m in messages[1:]] == ["7", "7", "8", "8", "9", "9"]
+    assert history.total_tokens == 3 * per_exchange
+
+
+def test_history_never_starts_with_an_assistant_reply():
+    history = ConversationHistory()
+    history.record("short", "a much longer reply " * 20)
+    history.record("next", "fine")
+
+    history.trim(estimate_tokens("a much longer reply " * 20))
+
+    assert [m["role"] for m in history.messages] == ["user", "assistant"]
+    assert history.messages[0]["content"] == "next"
+
+
+def test_long_paste_is_evicted_to_fit_small_context():
+    history = ConversationHistory(max_tokens=100_000)
+    history.record("x" * 40_000, "summary of the paste")
+    history.record("follow up", "sure")
+
+    # gemma2-9b-it has an 8k window; the paste alone is ~10k tokens
+    history.fit_request("gemma2-9b-it", "another question", max_tokens=2000)
+
+    assert [m["content"] for m in history.messages] == ["follow up", "sure"]
+    assert history.total_tokens < context_tokens("gemma2-9b-it") - 2000
+
+
+def test_chat_completer_pins_system_prompt_in_requests():
+    completer, completions = attach_completions(ChatCompleter(api_key="test-key", history_tokens=200))
+
+    completer.conversation_history = [{"role": "system", "content": "pinned"}]
+    for i in range(30):
+        completer.stream_completion(f"turn {i} " * 20, maintain_history=True, output=io.StringIO())
+
+    last_request = completions.requests[-1]
+    assert last_request[0] == {"role": "system", "content": "pinned"}
+    assert 2 < len(last_request) < 20
+    assert last_request[-1]["content"].startswith("turn 29")
+    assert completer.get_history()[0]["role"] == "system"
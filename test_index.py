@@ -0,0 +1,67 @@
+"""Tests for the transcript search index."""
+
+from pathlib import Path
+
+from groq_cli.index import TranscriptIndex
+from conftest import make_transcriber, write_wav
+
+
+def test_search_by_text_and_time(tmp_path):
+    index = TranscriptIndex(tmp_path / 'index.sqlite3')
+    index.add(tmp_path / 'a.wav', {'text': '', 'segments': [
+        {'start': 1.2, 'end': 2.5, 'text': ' Machine learning is fun'},
+        {'start': 3.0, 'end': 4.0, 'text': ' A café about learning'},
+    ]})
+    index.add(tmp_path / 'b.wav', 'Plain text learning')
+
+    assert {(Path(hit['file']).name, hit['start_ms']) for hit in index.search('learning')} == {
+        ('a.wav', 1200), ('a.wav', 3000), ('b.wav', 0)
+    }
+    assert [hit['end_ms'] for hit in index.search('cafe')] == [4000]
+    assert [hit['start_ms'] for hit in index.search('"machine learning"')] == [1200]
+    assert [hit['start_ms'] for hit in index.search('learn*', source=tmp_path / 'a.wav', start=2.6)] == [3000]
+    # Not valid FTS5 syntax, searched as a phrase instead
+    assert [hit['start_ms'] for hit in index.search('is fun"')] == [1200]
+
+    # Re-indexing a file replaces its segments
+    index.add(tmp_path / 'a.wav', {'text': 'Something else'})
+    assert [hit['file'] for hit in index.search('machine')] == []
+    index.close()
+
+
+def test_transcriber_feeds_index(tmp_path):
+    audio = write_wav(tmp_path / 'call.wav', 3.0)
+    index = TranscriptIndex(tmp_path / 'index.sqlite3')
+    transcriber, _ = make_transcriber(index=index)
+
+    transcriber.transcribe(audio, quiet=True)
+    assert [hit['start_ms'] for hit in index.search('tick', limit=5)] == [0, 1000, 2000]
+
+    transcriber.transcribe(audio, response_format='srt', quiet=True)
+    assert len(index.search('tick')) == 3
+
+
+def test_search_errors_are_reported_not_raised(tmp_path, monkeypatch):
+    from click.testing import CliRunner
+    from groq_cli.main import cli
+
+    monkeypatch.delenv('LOCALAPPDATA', raising=False)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    (tmp_path / 'groq-cli').mkdir()
+    (tmp_path / 'groq-cli' / 'index.sqlite3').write_bytes(b'not a database' * 100)
+
+    result = CliRunner().invoke(cli, ['--search', 'learning'], env={'GROQ_API_KEY': ''})
+    # A clean exit, not an uncaught sqlite3 error
+    assert isinstance(result.exception, SystemExit) and result.exit_code == 1
+    assert 'Error:' in result.output
+
+
+def test_broken_index_does_not_stop_transcription(tmp_path, monkeypatch):
+    from groq_cli.main import build_index
+
+    monkeypatch.delenv('LOCALAPPDATA', raising=False)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    (tmp_path / 'groq-cli').mkdir()
+    (tmp_path / 'groq-cli' / 'index.sqlite3').write_bytes(b'not a database' * 100)
+
+    assert build_index(no_index=False) is None
@@ -0,0 +1,82 @@
+"""Tests for resumable chunked and batch jobs."""
+
+import json
+
+import pytest
+
+from groq_cli.batch import transcribe_batch
+from groq_cli.manifest import JobManifest
+from conftest import FailingTranscriptions, FakeTranscriptions, make_transcriber, write_wav
+
+
+def transcriber_with(transcriptions, tmp_path, resume=True):
+    return make_transcriber(transcriptions, jobs_dir=tmp_path / 'jobs', resume=resume)[0]
+
+
+def test_manifest_round_trip_is_atomic(tmp_path):
+    manifest = JobManifest.open('chunks', {'file': 'a.wav'}, jobs_dir=tmp_path)
+    manifest.save_result('0.000-10.000', {'text': 'hi'})
+    manifest.mark('10.000-20.000', 'failed', error='timeout')
+
+    reopened = JobManifest.open('chunks', {'file': 'a.wav'}, jobs_dir=tmp_path)
+    assert reopened.resumed == 1
+    assert reopened.load_result('0.000-10.000') == {'text': 'hi'}
+    assert reopened.load_result('10.000-20.000') is None
+    assert json.loads(manifest.path.read_text())['items']['10.000-20.000']['error'] == 'timeout'
+    assert not list(tmp_path.glob('.*.tmp'))
+
+    assert JobManifest.open('chunks', {'file': 'a.wav'}, jobs_dir=tmp_path, fresh=True).resumed == 0
+    assert not manifest.results_dir.exists()
+
+
+def test_chunked_transcription_resumes_finished_chunks(tmp_path):
+    source = write_wav(tmp_path / 'call.wav', 30.0)
+
+    interrupted = transcriber_with(FailingTranscriptions(succeed=2), tmp_path)
+    interrupted.max_file_size = 200 * 1024
+    with pytest.raises(RuntimeError):
+        interrupted.transcribe(source, workers=1, quiet=True)
+
+    fake = FakeTranscriptions()
+    resumed = transcriber_with(fake, tmp_path)
+    resumed.max_file_size = 200 * 1024
+    result = resumed.transcribe(source, workers=1, quiet=True)
+
+    # Four chunks in all; two were done before the drop
+    assert len(fake.calls) == 2
+    assert result['stats']['counters']['resumed_chunks'] == 2
+    assert abs(result['segments'][-1]['end'] - 30.0) < 1e-3
+    assert not list((tmp_path / 'jobs').iterdir())
+
+
+def test_batch_skips_files_done_in_earlier_run(tmp_path):
+    files = [write_wav(tmp_path / f'call{i}.wav', 2.0) for i in range(4)]
+
+    manifest = JobManifest.open('batch', {'pattern': str(tmp_path)}, jobs_dir=tmp_path / 'jobs')
+    first = transcribe_batch(transcriber_with(FailingTranscriptions(succeed=3), tmp_path), files, workers=1, manifest=manifest)
+    assert first['succeeded'] == 3 and len(first['failed']) == 1
+    assert manifest.path.exists()
+
+    fake = FakeTranscriptions()
+    manifest = JobManifest.open('batch', {'pattern': str(tmp_path)}, jobs_dir=tmp_path / 'jobs')
+    second = transcribe_batch(transcriber_with(fake, tmp_path), files, workers=1, manifest=manifest)
+    assert second['resumed'] == 3 and second['succeeded'] == 1
+    assert len(fake.calls) == 1
+    assert not manifest.path.exists()
+
+
+def test_only_chunked_resumable_runs_report_a_checkpoint(tmp_path):
+    short = write_wav(tmp_path / 'short.wav', 2.0)
+    long = write_wav(tmp_path / 'long.wav', 30.0)
+
+    transcriber = transcriber_with(FakeTranscriptions(), tmp_path)
+    transcriber.max_file_size = 200 * 1024
+    transcriber.transcribe(long, workers=1, quiet=True)
+    assert transcriber.last_checkpointed
+    transcriber.transcribe(short, quiet=True)
+    assert not transcriber.last_checkpointed
+
+    fresh = transcriber_with(FakeTranscriptions(), tmp_path, resume=False)
+    fresh.max_file_size = 200 * 1024
+    fresh.transcribe(long, workers=1, quiet=True)
+    assert not fresh.last_checkpointed
@@ -0,0 +1,60 @@
+"""Tests for the coalescing token sink."""
+
+import io
+import time
+
+from groq_cli.output import TokenSink
+
+
+class FakeTerminal(io.StringIO):
+    """StringIO that claims to be a TTY and counts writes."""
+
+    def __init__(self):
+        super().__init__()
+        self.write_count = 0
+
+    def isatty(self):
+        return True
+
+    def write(self, text):
+        self.write_count += 1
+        return super().write(text)
+
+
+def test_first_token_is_written_immediately():
+    terminal = FakeTerminal()
+    with TokenSink(terminal) as sink:
+        sink.write("Hello")
+        assert terminal.getvalue() == "Hello"
+
+
+def test_terminal_output_is_coalesced_and_complete():
+    terminal = FakeTerminal()
+    tokens = [f"t{i} " for i in range(5000)]
+    with TokenSink(terminal) as sink:
+        for token in tokens:
+            sink.write(token)
+
+    assert terminal.getvalue() == "".join(tokens)
+    assert terminal.write_count < 100
+
+
+def test_stalled_stream_flushes_after_interval():
+    terminal = FakeTerminal()
+    with TokenSink(terminal, flush_interval=0.01) as sink:
+        sink.write("first ")
+        sink.write("second")
+        time.sleep(0.1)
+        assert terminal.getvalue() == "first second"
+
+
+def test_pipe_output_is_written_in_bulk():
+    pipe = io.StringIO()
+    sink = TokenSink(pipe)
+    assert not sink.is_tty
+    for i in range(100):
+        sink.write("x")
+    assert pipe.getvalue() == "x"
+    sink.close()
+    assert pipe.getvalue() == "x" * 100
+    assert sink.writes == 2
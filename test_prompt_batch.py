@@ -0,0 +1,71 @@
+"""Tests for JSONL batch prompts."""
+
+import asyncio
+import json
+
+import pytest
+
+from groq_cli.prompt_batch import completed_ids, read_prompts, run_prompt_batch
+from groq_cli.chat import AsyncChatCompleter
+from conftest import FakeAsyncCompletions, attach_completions
+
+
+def make_completer():
+    return attach_completions(AsyncChatCompleter(api_key="test-key"), FakeAsyncCompletions())
+
+
+def write_jsonl(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding='utf-8')
+    return path
+
+
+def test_results_in_input_order_with_line_overrides(tmp_path):
+    prompts_path = write_jsonl(tmp_path / 'prompts.jsonl', [
+        {'query': f'question {i}', **({'model': 'llama-3.1-8b-instant'} if i == 3 else {})}
+        for i in range(12)
+    ])
+    output_path = tmp_path / 'results.jsonl'
+    completer, fake = make_completer()
+
+    summary = asyncio.run(run_prompt_batch(
+        completer, read_prompts(prompts_path), output_path, max_concurrency=4, model='groq/compound'
+    ))
+
+    records = [json.loads(line) for line in output_path.read_text(encoding='utf-8').splitlines()]
+    assert [r['id'] for r in records] == list(range(12))
+    assert records[5]['text'].strip() == 'question 5'
+    assert records[3]['model'] == 'llama-3.1-8b-instant'
+    assert records[4]['model'] == 'groq/compound'
+    assert summary['succeeded'] == 12
+    assert fake.peak <= 4
+
+
+def test_resume_skips_completed_ids(tmp_path):
+    prompts_path = write_jsonl(tmp_path / 'prompts.jsonl', [
+        {'id': name, 'query': f'ask {name}'} for name in ['a', 'b', 'c', 'd']
+    ])
+    output_path = tmp_path / 'results.jsonl'
+    output_path.write_text(
+        json.dumps({'id': 'a', 'text': 'done'}) + "\n"
+        + json.dumps({'id': 'b', 'error': 'boom'}) + "\n"
+        + '{"id": "c", "te',
+        encoding='utf-8'
+    )
+    completer, _ = make_completer()
+
+    summary = asyncio.run(run_prompt_batch(completer, read_prompts(prompts_path), output_path))
+
+    assert summary['skipped'] == 1
+    assert summary['succeeded'] == 3
+    lines = output_path.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['id'] for line in lines[-3:]] == ['b', 'c', 'd']
+
+
+def test_malformed_ids_and_result_lines(tmp_path):
+    results_path = tmp_path / 'results.jsonl'
+    results_path.write_text('[]\n"x"\n{"id": [1], "text": "odd"}\n{"id": "a", "text": "ok"}\n', encoding='utf-8')
+    assert completed_ids(results_path) == {'a'}
+
+    prompts_path = write_jsonl(tmp_path / 'prompts.jsonl', [{'id': 'a', 'query': 'fine'}, {'id': ['b'], 'query': 'list id'}])
+    with pytest.raises(ValueError, match="prompts.jsonl:2: 'id' must be"):
+        read_prompts(prompts_path)
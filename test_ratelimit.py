@@ -0,0 +1,138 @@
+"""Tests for the shared rate limiter against a local stub server that returns 429s."""
+
+import io
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from groq_cli.chat import ChatCompleter
+from groq_cli.ratelimit import RateLimiter, parse_duration
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers 429 when too many requests are in flight, otherwise a short SSE chat stream."""
+
+    def do_POST(self):
+        server = self.server
+        self.rfile.read(int(self.headers.get('content-length', 0)))
+        with server.lock:
+            server.active += 1
+            over = server.active > server.capacity or server.fail_next > 0
+            if server.fail_next > 0:
+                server.fail_next -= 1
+        try:
+            if over:
+                server.rejected += 1
+                self.send_response(429)
+                self.send_header('retry-after', '0.05')
+                self.send_header('content-type', 'application/json')
+                body = b'{"error": {"message": "rate limited"}}'
+                self.send_header('content-length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+
+            time.sleep(0.02)
+            server.served += 1
+            chunk = {
+                "id": "x", "object": "chat.completion.chunk", "created": 0, "model": "stub",
+                "choices": [{"index": 0, "delta": {"content": "pong"}, "finish_reason": None}]
+            }
+            body = f"data: {json.dumps(chunk)}\n\ndata: [DONE]\n\n".encode()
+            self.send_response(200)
+            self.send_header('content-type', 'text/event-stream')
+            self.send_header('x-ratelimit-limit-tokens', '6000')
+            self.send_header('x-ratelimit-remaining-tokens', '5900')
+            self.send_header('x-ratelimit-reset-tokens', '1s')
+            self.send_header('content-length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.lock = threading.Lock()
+    server.active = server.rejected = server.served = server.fail_next = 0
+    server.capacity = 2
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_parse_duration():
+    assert parse_duration("7.66s") == pytest.approx(7.66)
+    assert parse_duration("2m59.56s") == pytest.approx(179.56)
+    assert parse_duration("1h0m1s") == pytest.approx(3601)
+    assert parse_duration("150ms") == pytest.approx(0.15)
+    assert parse_duration("3") == 3
+    assert parse_duration("soon") is None
+
+
+def test_concurrency_backs_off_to_server_capacity(stub):
+    limiter = RateLimiter(initial_concurrency=8)
+    client = limiter.attach(httpx.Client())
+    url = f"http://127.0.0.1:{stub.server_address[1]}/openai/v1/chat/completions"
+
+    def call(_):
+        while True:
+            with limiter.slot():
+                status = client.post(url, json={}).status_code
+            if status == 200:
+                return
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(call, range(60)))
+
+    assert stub.served == 60
+    assert limiter.rate_limited == stub.rejected > 0
+    assert limiter.concurrency < 8
+    # Without backing off, nearly every one of the 8 concurrent calls beyond
+    # the first 2 would be rejected on every round
+    assert stub.rejected < 60
+
+
+def test_exhausted_quota_waits_for_refill():
+    limiter = RateLimiter()
+    limiter.observe_headers({
+        'x-ratelimit-limit-tokens': '1000',
+        'x-ratelimit-remaining-tokens': '0',
+        'x-ratelimit-reset-tokens': '400ms'
+    })
+
+    # The bucket refills at 1000 tokens per 400 ms, so 500 tokens take ~200 ms
+    started = time.perf_counter()
+    with limiter.slot(tokens=500):
+        pass
+    assert 0.15 < time.perf_counter() - started < 1.0
+
+    assert limiter.limits('tokens')
+    assert not limiter.limits('audio_seconds')
+
+
+def test_chat_completer_learns_from_sdk_responses(stub, monkeypatch):
+    monkeypatch.setenv("GROQ_BASE_URL", f"http://127.0.0.1:{stub.server_address[1]}")
+    stub.fail_next = 1
+    limiter = RateLimiter()
+    completer = ChatCompleter(api_key="test-key", rate_limiter=limiter)
+
+    result = completer.stream_completion("ping", model="stub", output=io.StringIO())
+
+    assert result["text"] == "pong"
+    # The SDK retried the 429; the limiter saw it and the success headers
+    assert limiter.rate_limited == 1
+    assert limiter.limits('tokens')
+    assert limiter.active == 0
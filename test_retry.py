@@ -0,0 +1,205 @@
+"""Tests for retries with backoff and hedged requests."""
+
+import asyncio
+import io
+import threading
+import time
+
+import httpx
+import pytest
+from groq import APIConnectionError, APIStatusError, APITimeoutError
+
+import groq_cli.retry as retry_module
+from groq_cli.chat import AsyncChatCompleter, ChatCompleter
+from groq_cli.retry import LatencyTracker, RetryPolicy, hedged_call
+from conftest import attach_completions, make_chunk
+
+REQUEST = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+
+
+def status_error(status, headers=None):
+    response = httpx.Response(status, headers=headers or {}, request=REQUEST)
+    return APIStatusError(f"status {status}", response=response, body=None)
+
+
+def connection_error(cause):
+    """APIConnectionError raised from an httpx error, as the SDK raises it."""
+    error = APIConnectionError(request=REQUEST)
+    error.__cause__ = cause
+    return error
+
+
+def make_policy(**kwargs):
+    delays = []
+    return RetryPolicy(sleep=delays.append, **kwargs), delays
+
+
+def flaky(errors, result="ok"):
+    """Function that raises each of errors in turn, then returns result."""
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+
+    return fn, calls
+
+
+def test_transient_errors_are_retried_with_growing_jittered_backoff():
+    policy, delays = make_policy(attempts=4, base_delay=1.0)
+    fn, calls = flaky([APIConnectionError(request=REQUEST), status_error(502), status_error(500)])
+
+    assert policy.call(fn) == "ok"
+    assert len(calls) == 4
+    assert 0 <= delays[0] <= 1 and 0 <= delays[1] <= 2 and 0 <= delays[2] <= 4
+
+
+def test_retry_after_header_sets_the_delay():
+    policy, delays = make_policy()
+    fn, _ = flaky([status_error(429, {"retry-after": "2.5"})])
+
+    policy.call(fn)
+    assert delays == [2.5]
+
+
+def test_client_errors_and_exhausted_attempts_raise():
+    policy, _ = make_policy(attempts=2)
+    fn, calls = flaky([status_error(400)])
+    with pytest.raises(APIStatusError):
+        policy.call(fn)
+    assert len(calls) == 1
+
+    fn, calls = flaky([status_error(503)] * 3)
+    with pytest.raises(APIStatusError):
+        policy.call(fn)
+    assert len(calls) == 2
+
+
+def test_non_idempotent_calls_only_retry_unprocessed_errors():
+    policy, _ = make_policy()
+    fn, calls = flaky([status_error(500)])
+    with pytest.raises(APIStatusError):
+        policy.call(fn, idempotent=False)
+
+    fn, calls = flaky([status_error(429)])
+    assert policy.call(fn, idempotent=False) == "ok"
+
+    # The body may have reached the server before the connection dropped
+    fn, calls = flaky([connection_error(httpx.ReadError("reset"))])
+    with pytest.raises(APIConnectionError):
+        policy.call(fn, idempotent=False)
+    assert len(calls) == 1
+
+    fn, calls = flaky([connection_error(httpx.ConnectError("refused")), connection_error(httpx.ConnectTimeout("slow"))])
+    assert policy.call(fn, idempotent=False) == "ok"
+    assert len(calls) == 3
+
+
+class FlakyCompletions:
+    """Fails the first create call with error, or fails mid-stream after one token."""
+
+    def __init__(self, fail_mid_stream=False, error=None):
+        self.fail_mid_stream = fail_mid_stream
+        self.error = error or connection_error(httpx.ConnectError("refused"))
+        self.calls = 0
+
+    def create(self, **params):
+        self.calls += 1
+        if not self.fail_mid_stream and self.calls == 1:
+            raise self.error
+
+        def stream():
+            yield make_chunk("partial ")
+            if self.fail_mid_stream:
+                raise APIConnectionError(request=REQUEST)
+            yield make_chunk("answer")
+
+        return stream()
+
+
+def make_completer(completions):
+    policy, _ = make_policy()
+    return attach_completions(ChatCompleter(api_key="test-key", retry_policy=policy), completions)[0]
+
+
+def test_chat_retries_before_first_token():
+    completions = FlakyCompletions()
+    out = io.StringIO()
+
+    result = make_completer(completions).stream_completion("hi", output=out)
+
+    assert result["text"] == "partial answer"
+    assert out.getvalue() == "partial answer"
+    assert completions.calls == 2
+
+
+def test_chat_does_not_retry_after_tokens_were_shown():
+    completions = FlakyCompletions(fail_mid_stream=True)
+
+    with pytest.raises(APIConnectionError):
+        make_completer(completions).stream_completion("hi", output=io.StringIO())
+    assert completions.calls == 1
+
+
+def test_chat_completions_are_retried_as_non_idempotent():
+    # A 500 or timeout may already have been billed; a 429 was never processed
+    completions = FlakyCompletions(error=status_error(500))
+    with pytest.raises(APIStatusError):
+        make_completer(completions).stream_completion("hi", output=io.StringIO())
+    assert completions.calls == 1
+
+    completions = FlakyCompletions(error=status_error(429))
+    assert make_completer(completions).stream_completion("hi", output=io.StringIO())["text"] == "partial answer"
+    assert completions.calls == 2
+
+    class AsyncCompletions:
+        calls = 0
+
+        async def create(self, **params):
+            self.calls += 1
+            raise APITimeoutError(request=REQUEST)
+
+    completer, completions = attach_completions(
+        AsyncChatCompleter(api_key="test-key", retry_policy=make_policy()[0]), AsyncCompletions()
+    )
+    with pytest.raises(APITimeoutError):
+        asyncio.run(completer.stream_completion("hi"))
+    assert completions.calls == 1
+
+
+def test_hedged_call_sends_duplicate_past_p95(monkeypatch):
+    monkeypatch.setattr(retry_module, "HEDGE_MIN_DELAY", 0.01)
+    tracker = LatencyTracker()
+    for _ in range(10):
+        tracker.record(0.02)
+
+    calls = []
+    release = threading.Event()
+
+    def request():
+        calls.append(1)
+        if len(calls) == 1:
+            # The straggler
+            release.wait(5)
+            return "slow"
+        return "fast"
+
+    started = time.perf_counter()
+    assert hedged_call(request, tracker) == "fast"
+    assert time.perf_counter() - started < 1
+    assert len(calls) == 2
+    release.set()
+
+
+def test_hedged_call_waits_for_samples_before_hedging():
+    calls = []
+
+    def request():
+        calls.append(1)
+        time.sleep(0.01)
+        return "only"
+
+    assert hedged_call(request, LatencyTracker()) == "only"
+    assert len(calls) == 1
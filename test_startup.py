@@ -0,0 +1,42 @@
+"""Cold-start import budget for the CLI entry point."""
+
+import os
+import subprocess
+import sys
+
+# Generous enough for slow CI machines; override to tighten locally
+IMPORT_BUDGET_MS = float(os.environ.get('GROQ_CLI_IMPORT_BUDGET_MS', '250'))
+
+# Only the handlers that need these may import them
+DEFERRED_MODULES = {'groq', 'httpx', 'pydantic', 'numpy', 'asyncio', 'rich.progress', 'rich.live'}
+
+
+def import_times(statement: str) -> dict:
+    """Run a statement under -X importtime and return cumulative microseconds per module."""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_entry_point_defers_engine_imports():
+    times = import_times('import groq_cli.main')
+    assert not DEFERRED_MODULES & set(times)
+
+
+def test_entry_point_import_budget():
+    times = import_times('import groq_cli.main')
+    assert times['groq_cli.main'] / 1000 < IMPORT_BUDGET_MS
+
+
+def test_daemon_client_defers_engine_imports():
+    # Forwarding to a warm daemon only pays off if the client stays light
+    times = import_times('import groq_cli.daemon')
+    assert not {'groq', 'httpx', 'pydantic'} & set(times)
@@ -0,0 +1,45 @@
+"""Tests for per-request timing stats."""
+
+import json
+import time
+
+from groq_cli.stats import RequestStats, append_metrics
+from conftest import make_transcriber, write_wav
+
+
+def test_token_timings_and_json_round_trip(tmp_path):
+    stats = RequestStats('chat', model='m')
+    with stats.phase('send'):
+        time.sleep(0.01)
+    for _ in range(3):
+        stats.token()
+        time.sleep(0.003)
+    stats.finish(tokens=6)
+
+    assert stats['phases']['send'] >= 0.01
+    assert stats['ttft'] >= stats['phases']['send']
+    assert stats['tokens'] == 6 and stats['tokens_per_s'] > 0
+    assert stats['counters'] == {'chunks': 3}
+    assert sum(stats['inter_token_ms'].values()) == 2
+
+    log = tmp_path / 'metrics.jsonl'
+    append_metrics(log, stats)
+    append_metrics(log, stats)
+    records = [json.loads(line) for line in log.read_text().splitlines()]
+    assert len(records) == 2
+    assert records[0]['phases'] == stats['phases']
+
+
+def test_transcription_phases_include_write(tmp_path):
+    audio = write_wav(tmp_path / 'call.wav', 2.0)
+    transcriber, _ = make_transcriber()
+
+    result = transcriber.transcribe(audio, quiet=True)
+    stats = result['stats']
+    assert stats is transcriber.last_stats
+    assert {'read', 'queue', 'upload', 'server', 'parse'} <= set(stats['phases'])
+    assert stats['counters'] == {'attempts': 1, 'requests': 1}
+
+    transcriber.save_transcript(result, tmp_path / 'call.json', format='json')
+    assert 'write' in stats['phases']
+    assert 'stats' not in json.loads((tmp_path / 'call.json').read_text())
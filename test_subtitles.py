@@ -0,0 +1,53 @@
+"""Tests for the streaming transcript writers."""
+
+import json
+
+import pytest
+
+from groq_cli import subtitles
+from groq_cli.subtitles import format_timestamps, write_transcript
+
+
+def test_timestamps_round_to_the_millisecond():
+    assert format_timestamps([0, 2.3, 61.0005, 3725.999]) == [
+        "00:00:00,000", "00:00:02,300", "00:01:01,001", "01:02:05,999"
+    ]
+    assert format_timestamps([2.3], ".") == ["00:00:02.300"]
+
+
+def test_vectorised_timestamps_match_python():
+    pytest.importorskip("numpy")
+    times = [-0.2, 0, 0.0005, 2.3, 59.9996, 3599.9995, 86399.999, 360000.5] + [i * 1.37 for i in range(5000)]
+    for decimal in (",", "."):
+        assert format_timestamps(times, decimal, vectorise=True) == format_timestamps(times, decimal, vectorise=False)
+
+
+def test_srt_and_vtt_across_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(subtitles, 'WRITE_BATCH', 2)
+    data = {'segments': [{'start': i, 'end': i + 0.5, 'text': f' Line {i}. '} for i in range(3)]}
+
+    write_transcript(data, tmp_path / 'out.srt', 'srt')
+    assert (tmp_path / 'out.srt').read_text(encoding='utf-8') == (
+        "1\n00:00:00,000 --> 00:00:00,500\nLine 0.\n\n"
+        "2\n00:00:01,000 --> 00:00:01,500\nLine 1.\n\n"
+        "3\n00:00:02,000 --> 00:00:02,500\nLine 2.\n"
+    )
+
+    write_transcript(data, tmp_path / 'out.vtt', 'vtt')
+    assert (tmp_path / 'out.vtt').read_text(encoding='utf-8').startswith(
+        "WEBVTT\n\n00:00:00.000 --> 00:00:00.500\nLine 0.\n\n00:00:01.000"
+    )
+
+    write_transcript({'segments': []}, tmp_path / 'empty.vtt', 'vtt')
+    assert (tmp_path / 'empty.vtt').read_text(encoding='utf-8') == "WEBVTT\n\n"
+
+
+def test_json_matches_json_dumps(tmp_path, monkeypatch):
+    monkeypatch.setattr(subtitles, 'WRITE_BATCH', 3)
+    data = {'text': 'Grüße', 'segments': [{'id': i, 'start': i / 3, 'words': []} for i in range(5)], 'empty': {}}
+
+    write_transcript(data, tmp_path / 'out.json', 'json')
+    assert (tmp_path / 'out.json').read_text(encoding='utf-8') == json.dumps(data, indent=2, ensure_ascii=False)
+
+    with pytest.raises(ValueError):
+        write_transcript(data, tmp_path / 'out.xml', 'xml')
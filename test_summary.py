@@ -0,0 +1,81 @@
+"""Tests for background rolling summaries of chat history."""
+
+import io
+import threading
+from types import SimpleNamespace
+
+from groq_cli.chat import ChatCompleter
+from groq_cli.history import SUMMARY_PREFIX
+from groq_cli.summary import RollingSummarizer
+from conftest import attach_completions, make_chunk
+
+
+class SummaryCompletions:
+    """Streams a fixed reply for chat turns; summary calls wait for a release event."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.summary_prompts = []
+
+    def create(self, stream=False, **params):
+        if stream:
+            return iter([make_chunk("reply " * 50)])
+        self.summary_prompts.append(params["messages"][-1]["content"])
+        self.release.wait(5)
+        message = SimpleNamespace(content=f"summary {len(self.summary_prompts)}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def make_completer():
+    completer, completions = attach_completions(ChatCompleter(api_key="test-key"), SummaryCompletions())
+    completer.conversation_history = [{"role": "system", "content": "pinned"}]
+    return completer, completions
+
+
+def chat_turn(completer, i):
+    completer.stream_completion(f"question {i} " * 20, maintain_history=True, output=io.StringIO())
+
+
+def test_summary_runs_in_background_and_replaces_old_turns():
+    completer, completions = make_completer()
+    summarizer = RollingSummarizer(completer, trigger_tokens=200, keep_recent=2)
+
+    for i in range(3):
+        chat_turn(completer, i)
+    assert summarizer.update()
+
+    # The summary request is blocked, but the next turn goes ahead
+    assert not summarizer.apply()
+    chat_turn(completer, 3)
+    assert len(completer.get_history()) == 9
+
+    completions.release.set()
+    summarizer._pending.result()
+    assert summarizer.apply()
+
+    history = completer.get_history()
+    assert history[0] == {"role": "system", "content": "pinned"}
+    assert history[1] == {"role": "system", "content": SUMMARY_PREFIX + "summary 1"}
+    # Turns 2 and 3 were kept verbatim: the kept tail plus the turn made meanwhile
+    assert [m["content"].split()[1] for m in history[2:] if m["role"] == "user"] == ["2", "3"]
+    assert "question 0" in completions.summary_prompts[0]
+    summarizer.close()
+
+
+def test_next_summary_builds_on_previous_and_bounds_payload():
+    completer, completions = make_completer()
+    completions.release.set()
+    summarizer = RollingSummarizer(completer, trigger_tokens=200, keep_recent=2)
+
+    for i in range(30):
+        summarizer.apply()
+        chat_turn(completer, i)
+        if summarizer.update():
+            summarizer._pending.result()
+
+    assert summarizer.summaries > 5
+    assert "summary 1" in completions.summary_prompts[1]
+    # Payload stops growing once summaries kick in
+    sizes = list(completer.request_bytes)
+    assert max(sizes[10:]) < 2 * sizes[3]
+    summarizer.close()
@@ -0,0 +1,69 @@
+"""Tests for the columnar Transcript."""
+
+import json
+
+from groq_cli.transcript import Transcript
+from groq_cli.transcriber import merge_chunk_transcripts
+
+
+def verbose_json(count=6):
+    segments = [
+        {'id': i, 'start': i * 2.0, 'end': i * 2.0 + 1.5, 'text': f' Line {i}.', 'tokens': [50364 + i, 11],
+         'avg_logprob': -0.2, 'no_speech_prob': 0.01}
+        for i in range(count)
+    ]
+    words = [{'word': 'Line', 'start': i * 2.0, 'end': i * 2.0 + 0.5} for i in range(count)]
+    return {'task': 'transcribe', 'duration': count * 2.0, 'text': 'Line 0. ...', 'segments': segments, 'words': words}
+
+
+def test_round_trip_and_dict_view():
+    data = verbose_json()
+    data['segments'][2]['extra'] = {'nested': [1]}
+    transcript = Transcript.from_dict(data)
+
+    assert transcript.to_dict() == data
+    assert transcript['text'] == data['text']
+    assert transcript['segments'][-1] == data['segments'][-1]
+    assert list(transcript['segments'][1:3]) == data['segments'][1:3]
+    assert transcript['segments'].column('start').tolist() == [s['start'] for s in data['segments']]
+    # Repeated words are stored once
+    assert transcript['words'].column('word') == ['Line'] * 6
+
+
+def test_between_selects_overlapping_rows():
+    transcript = Transcript.from_dict(verbose_json())
+
+    part = transcript.between(3.0, 6.5)
+    assert [s['id'] for s in part['segments']] == [1, 2, 3]
+    assert [w['start'] for w in part['words']] == [4.0, 6.0]
+    assert part['text'] == 'Line 1. Line 2. Line 3.'
+
+    # Out-of-order rows fall back to a scan
+    data = verbose_json()
+    data['segments'].reverse()
+    assert [s['id'] for s in Transcript.from_dict(data).between(3.0, 6.5)['segments']] == [3, 2, 1]
+
+
+def test_exports_match_dict(tmp_path):
+    data = verbose_json()
+    transcript = Transcript.from_dict(data)
+    for format in ('json', 'srt', 'vtt', 'text'):
+        transcript.save(tmp_path / f'columnar.{format}', format)
+    assert json.loads((tmp_path / 'columnar.json').read_text(encoding='utf-8')) == data
+    assert (tmp_path / 'columnar.srt').read_text(encoding='utf-8').startswith("1\n00:00:00,000 --> 00:00:01,500\nLine 0.\n")
+
+    merged = merge_chunk_transcripts([(0.0, 12.0, transcript)])
+    assert merged['segments'] == data['segments']
+
+
+def test_mixed_int_and_float_values_round_trip():
+    data = verbose_json()
+    data['segments'][0]['start'] = 0
+    data['segments'][1]['avg_logprob'] = -1
+    transcript = Transcript.from_dict(data)
+
+    exported = transcript.to_dict()
+    assert exported == data
+    assert type(exported['segments'][0]['start']) is int and type(exported['segments'][1]['start']) is float
+    assert json.dumps(exported) == json.dumps(data)
+    assert [s['id'] for s in transcript.between(0.0, 3.0)['segments']] == [0, 1]
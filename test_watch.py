@@ -0,0 +1,129 @@
+"""Tests for watch-folder transcription."""
+
+import threading
+import time
+
+import pytest
+
+from groq_cli.watch import FolderWatcher, inotify_available
+from conftest import FailingTranscriptions, make_transcriber, write_wav
+
+
+def make_watcher(tmp_path, **options):
+    transcriber, fake = make_transcriber()
+    return FolderWatcher(transcriber, tmp_path, **options), fake
+
+
+def test_files_are_queued_once_settled(tmp_path):
+    watcher, _ = make_watcher(tmp_path, settle=2.0)
+    recording = write_wav(tmp_path / 'call.wav', 1.0)
+    (tmp_path / 'notes.txt').write_text('not audio')
+
+    watcher.scan()
+    assert watcher.check_pending(now=time.monotonic()) == []
+
+    # Still being written: the settle clock restarts
+    with open(recording, 'ab') as f:
+        f.write(b'\x00' * 1024)
+    watcher.notice(recording, now=time.monotonic() + 1.5)
+    assert watcher.check_pending(now=time.monotonic() + 3.0) == []
+
+    assert watcher.check_pending(now=time.monotonic() + 5.0) == [recording]
+    # The same version is not queued twice
+    watcher.notice(recording)
+    assert watcher.counters()['pending'] == 0
+    assert watcher.counters()['queue_depth'] == 1
+
+
+def test_startup_scan_skips_transcribed_files(tmp_path):
+    watcher, _ = make_watcher(tmp_path, settle=0.0)
+    done = write_wav(tmp_path / 'done.wav', 1.0)
+    done.with_suffix('.txt').write_text('old transcript')
+    fresh = write_wav(tmp_path / 'fresh.wav', 1.0)
+
+    watcher.scan(skip_transcribed=True)
+    assert watcher.check_pending() == [fresh]
+
+
+@pytest.mark.parametrize('poll', [True, False])
+def test_run_transcribes_new_files(tmp_path, monkeypatch, poll):
+    if not poll and not inotify_available():
+        pytest.skip("inotify is Linux-only")
+    monkeypatch.setattr('groq_cli.watch.POLL_SECONDS', 0.1)
+    watcher, fake = make_watcher(tmp_path, settle=0.2, poll=poll, workers=2)
+
+    thread = threading.Thread(target=watcher.run)
+    thread.start()
+    try:
+        (tmp_path / 'nested').mkdir()
+        write_wav(tmp_path / 'nested' / 'call.wav', 2.0)
+        deadline = time.monotonic() + 10
+        while watcher.counters()['done'] < 1 and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        watcher.shutdown()
+        thread.join()
+
+    counters = watcher.counters()
+    assert counters['done'] == 1 and counters['failed'] == 0
+    assert counters['latency_last'] >= 0.2
+    assert (tmp_path / 'nested' / 'call.txt').read_text(encoding='utf-8').strip() == 'tick tick'
+    assert len(fake.calls) == 1
+
+
+def test_deleted_files_are_forgotten(tmp_path):
+    watcher, _ = make_watcher(tmp_path, settle=0.0)
+    recordings = [write_wav(tmp_path / f'call{i}.wav', 1.0) for i in range(3)]
+    watcher.scan()
+    watcher.check_pending()
+
+    recordings[0].unlink()
+    watcher.notice(recordings[0])
+    recordings[1].unlink()
+    # Polling gets no delete events; the rescan notices instead
+    watcher.scan()
+
+    assert list(watcher._handled) == [recordings[2]]
+
+
+def test_failed_files_are_retried_then_given_up(tmp_path, monkeypatch):
+    monkeypatch.setattr('groq_cli.watch.MAX_ATTEMPTS', 2)
+    transcriber, _ = make_transcriber(FailingTranscriptions(succeed=0))
+    watcher = FolderWatcher(transcriber, tmp_path, settle=0.0)
+    recording = write_wav(tmp_path / 'call.wav', 1.0)
+    watcher.start()
+    try:
+        watcher.scan()
+        deadline = time.monotonic() + 10
+        while watcher.counters()['failed'] < 1 and time.monotonic() < deadline:
+            watcher.check_pending()
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+
+    counters = watcher.counters()
+    assert counters['queued'] == 2
+    assert counters['retried'] == 1 and counters['failed'] == 1
+    # The failing version is not queued again, but a new one is
+    watcher.notice(recording)
+    assert watcher.check_pending() == []
+    write_wav(recording, 2.0)
+    watcher.notice(recording)
+    assert watcher.check_pending() == [recording]
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify is Linux-only")
+def test_removed_directories_drop_their_watch(tmp_path):
+    from groq_cli.watch import _Inotify
+
+    (tmp_path / 'nested').mkdir()
+    inotify = _Inotify()
+    try:
+        inotify.add_tree(tmp_path)
+        (tmp_path / 'nested').rmdir()
+        deadline = time.monotonic() + 5
+        while len(inotify._dirs) > 1 and time.monotonic() < deadline:
+            inotify.read(0.1)
+        assert list(inotify._dirs.values()) == [tmp_path]
+    finally:
+        inotify.close()